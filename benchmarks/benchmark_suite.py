@@ -0,0 +1,223 @@
+"""
+Benchmark suite of the design and filtering hot paths.
+
+Times the design of the test fixture configurations with every window type and
+several transition widths, which set the tap count, and the filtering of signals of
+several lengths with every engine. The timings are written as JSON and compared
+with a stored baseline, flagging the cases slower than the baseline by more than a
+threshold. Run with:
+
+    python benchmarks/benchmark_suite.py
+
+Options:
+    --output PATH        Where to write the results (default: benchmarks/results.json).
+    --baseline PATH      The baseline to compare with (default: benchmarks/baseline.json).
+    --threshold RATIO    The allowed slowdown, 0.25 for 25% (default: 0.25).
+    --update-baseline    Write the results to the baseline instead of comparing.
+
+The exit status is 1 when a case regressed. Timings depend on the machine, so the
+baseline should be refreshed with --update-baseline on the machine running the
+comparison.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from pathlib import Path
+
+import numpy as np
+import scipy
+
+# Benchmark the working tree, and read the configurations of the test fixtures
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT / "src"), str(ROOT)]
+
+from easy_fir_filter import EasyFirFilter, FilterConf, StreamingFirFilter
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+WINDOW_TYPES = ("hamming", "blackman", "kaiser", "equiripple")
+# Divisors of the transition bands, each one multiplying the tap count
+TRANSITION_SCALES = (1, 4, 16)
+SIGNAL_LENGTHS = (1_000, 10_000, 100_000, 1_000_000)
+ENGINES = ("auto", "direct", "fft", "streaming")
+# Chunk size of the streaming engine
+CHUNK_SIZE = 1024
+# Largest signal length times tap count of the direct-form engines
+MAX_DIRECT_WORK = 5e7
+
+
+def _time(function) -> float:
+    """
+    Returns the best of several timings of `function`, in seconds.
+
+    Every timing runs `function` for at least 50 ms, and the best of five is kept to
+    filter out the noise of other processes.
+    """
+    number = max(1, int(0.05 / max(timeit.timeit(function, number=1), 1e-7)))
+
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def _narrowed(filter_conf: FilterConf, scale: int) -> FilterConf:
+    """
+    Returns the configuration with its transition bands divided by `scale`, moving
+    each stopband edge towards its passband edge.
+    """
+    narrowed = filter_conf.copy()
+    for passband, stopband in (
+        ("passband_freq_hz", "stopband_freq_hz"),
+        ("passband_freq2_hz", "stopband_freq2_hz"),
+    ):
+        if passband in filter_conf:
+            narrowed[stopband] = (
+                filter_conf[passband]
+                + (filter_conf[stopband] - filter_conf[passband]) / scale
+            )
+
+    return narrowed
+
+
+def _design_cases() -> dict[str, dict]:
+    """
+    Times the design of every fixture configuration, window type and transition width.
+    """
+    cases = {}
+    for index, base_conf in enumerate(list_filter_configurations):
+        for window_type in WINDOW_TYPES:
+            for scale in TRANSITION_SCALES:
+                filter_conf = _narrowed(
+                    {**base_conf, "window_type": window_type}, scale
+                )
+                taps = len(EasyFirFilter(filter_conf).calculate_filter())
+                seconds = _time(lambda: EasyFirFilter(filter_conf).calculate_filter())
+
+                name = (
+                    f"design/{index}-{filter_conf['filter_type']}/{window_type}/"
+                    f"x{scale}"
+                )
+                cases[name] = {"seconds": seconds, "taps": taps}
+
+    return cases
+
+
+def _filtering_cases() -> dict[str, dict]:
+    """
+    Times every filtering engine over the signal lengths and the tap counts of the
+    lowpass fixture.
+    """
+    rng = np.random.default_rng(0)
+    lowpass = next(
+        conf for conf in list_filter_configurations if conf["filter_type"] == "lowpass"
+    )
+
+    cases = {}
+    for scale in TRANSITION_SCALES:
+        fir_filter = EasyFirFilter(
+            {**_narrowed(lowpass, scale), "window_type": "kaiser"}
+        )
+        taps = len(fir_filter.calculate_filter())
+        for signal_length in SIGNAL_LENGTHS:
+            signal = rng.standard_normal(signal_length)
+            for engine in ENGINES:
+                if engine in ("direct", "streaming") and (
+                    signal_length * taps > MAX_DIRECT_WORK
+                ):
+                    continue
+
+                if engine == "streaming":
+                    streaming = StreamingFirFilter(fir_filter.coefficients, CHUNK_SIZE)
+                    out = np.empty(CHUNK_SIZE)
+
+                    def run():
+                        for start in range(0, signal_length, CHUNK_SIZE):
+                            chunk = signal[start : start + CHUNK_SIZE]
+                            streaming.process(chunk, out[: chunk.size])
+
+                else:
+
+                    def run():
+                        fir_filter.apply(signal, method=engine)
+
+                name = f"filter/{engine}/taps={taps}/signal={signal_length}"
+                cases[name] = {"seconds": _time(run), "taps": taps}
+
+    return cases
+
+
+def _compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Prints the cases slower than the baseline by more than `threshold` and returns
+    their names.
+    """
+    if baseline["machine"] != results["machine"]:
+        print(
+            "Warning: the baseline was recorded on another machine "
+            f"({baseline['machine']['platform']}), refresh it with --update-baseline."
+        )
+
+    regressions = []
+    print(f"{'case':<56} {'baseline (ms)':>14} {'now (ms)':>10} {'ratio':>6}")
+    for name, case in results["cases"].items():
+        if name not in baseline["cases"]:
+            continue
+
+        before = baseline["cases"][name]["seconds"]
+        ratio = case["seconds"] / before
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            print(
+                f"{name:<56} {before * 1e3:>14.3f} {case['seconds'] * 1e3:>10.3f} "
+                f"{ratio:>6.2f}"
+            )
+
+    print(
+        f"{len(regressions)} of {len(results['cases'])} cases regressed by more than "
+        f"{threshold:.0%}."
+    )
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--output", type=Path, default=ROOT / "benchmarks" / "results.json"
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=ROOT / "benchmarks" / "baseline.json"
+    )
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    cases = {**_design_cases(), **_filtering_cases()}
+
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "machine": {
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "scipy": scipy.__version__,
+        },
+        "cases": cases,
+    }
+
+    path = args.baseline if args.update_baseline else args.output
+    path.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"Wrote {len(cases)} cases to {path}")
+
+    if args.update_baseline or not args.baseline.exists():
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+
+    return 1 if _compare(results, baseline, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
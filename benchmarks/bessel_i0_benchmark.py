@@ -0,0 +1,62 @@
+"""
+Benchmark of the vectorized I0 evaluator against the previous Kaiser window routine.
+
+The previous routine evaluated 25 series terms with math.factorial and truncated
+every term, once per beta. Run with:
+
+    python benchmarks/bessel_i0_benchmark.py
+"""
+
+import math
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+from scipy.special import i0
+
+# Benchmark the working tree
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from easy_fir_filter.utils import bessel_i0, truncate
+
+
+def _legacy_i0(alpha: float, round_to: int = 7) -> float:
+    """
+    The I0 routine previously used by KaiserWindow._calculate_i_alpha.
+    """
+    if alpha == 0:
+        return 1
+
+    result = 0
+    for k in range(1, 26):
+        result += truncate(((1 / math.factorial(k)) * (alpha / 2) ** k) ** 2, round_to)
+
+    return result + 1
+
+
+def main():
+    print(f"{'betas':>8} {'legacy (ms)':>12} {'bessel_i0 (ms)':>15} {'speedup':>8}")
+    for size in (101, 1001, 10001):
+        betas = np.linspace(0, 10, size)
+        legacy = min(
+            timeit.repeat(lambda: [_legacy_i0(b) for b in betas], number=1, repeat=5)
+        )
+        vectorized = min(timeit.repeat(lambda: bessel_i0(betas), number=1, repeat=5))
+        print(
+            f"{size:>8} {legacy * 1e3:>12.3f} {vectorized * 1e3:>15.3f} "
+            f"{legacy / vectorized:>7.0f}x"
+        )
+
+    print()
+    print(f"{'alpha':>8} {'legacy rel. error':>18} {'bessel_i0 rel. error':>21}")
+    for alpha in (2.0, 5.0, 10.0, 20.0, 40.0):
+        exact = i0(alpha)
+        print(
+            f"{alpha:>8} {abs(_legacy_i0(alpha) - exact) / exact:>18.2e} "
+            f"{abs(bessel_i0(alpha) - exact) / exact:>21.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
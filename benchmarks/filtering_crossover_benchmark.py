@@ -0,0 +1,118 @@
+"""
+Benchmark of the direct-form and FFT overlap-add filtering engines.
+
+Times both engines over a grid of signal lengths and tap counts, with symmetric
+coefficients, which the direct form filters with the folded kernel like every
+EasyFirFilter design, and with asymmetric ones. Fits the cost models of
+easy_fir_filter.filtering.method to the timings and reports how often the crossover
+heuristic picks the faster engine. Run with:
+
+    python benchmarks/filtering_crossover_benchmark.py
+
+The fitted coefficients can be copied into DIRECT_COST and FFT_COST.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+from scipy.optimize import nnls
+
+# Benchmark the working tree
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from easy_fir_filter.filtering import OverlapAddConvolver, convolve_direct
+from easy_fir_filter.filtering.method import (
+    DIRECT_COST,
+    FFT_COST,
+    choose_method,
+    direct_cost_terms,
+    fft_cost_terms,
+)
+
+SIGNAL_LENGTHS = (100, 1_000, 10_000, 100_000, 1_000_000)
+TAPS = (3, 7, 15, 31, 63, 127, 255, 511, 1023, 2047)
+
+
+def _time(function) -> float:
+    """
+    Returns the best of several timings of `function`, in seconds.
+    """
+    number = max(1, int(0.02 / max(timeit.timeit(function, number=1), 1e-7)))
+
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def _fit(terms: list[np.ndarray], times: list[float]) -> np.ndarray:
+    """
+    Fits non-negative cost coefficients minimizing the relative error of the model.
+    """
+    weights = 1 / np.array(times)
+    coefficients, _ = nnls(np.array(terms) * weights[:, None], np.ones(len(times)))
+
+    return coefficients
+
+
+def main():
+    rng = np.random.default_rng(0)
+    cases = []
+
+    for signal_length in SIGNAL_LENGTHS:
+        signal = rng.standard_normal(signal_length)
+        for taps in TAPS:
+            if signal_length * min(signal_length, taps) > 5e8:
+                continue
+            for symmetric in (True, False):
+                half = rng.standard_normal(taps // 2 + 1)
+                coefficients = (
+                    np.concatenate([half, half[-2::-1]])
+                    if symmetric
+                    else rng.standard_normal(taps)
+                )
+                convolver = OverlapAddConvolver(coefficients)
+                fft_size = convolver.fft_size_for(signal_length)
+
+                direct = _time(
+                    lambda: convolve_direct(signal, coefficients, symmetric=symmetric)
+                )
+                fft = _time(lambda: convolver.convolve(signal))
+                cases.append((signal_length, taps, symmetric, fft_size, direct, fft))
+
+    direct_cost = _fit(
+        [
+            direct_cost_terms(length, taps, symmetric=symmetric)
+            for length, taps, symmetric, *_ in cases
+        ],
+        [case[4] for case in cases],
+    )
+    fft_cost = _fit(
+        [fft_cost_terms(length, taps, size) for length, taps, _, size, *_ in cases],
+        [case[5] for case in cases],
+    )
+
+    print(
+        f"{'signal':>8} {'taps':>6} {'symmetric':>9} {'direct (ms)':>12} "
+        f"{'fft (ms)':>10} {'chosen':>7}"
+    )
+    regret = []
+    for signal_length, taps, symmetric, fft_size, direct, fft in cases:
+        chosen = choose_method(
+            signal_length, taps, fft_size=fft_size, symmetric=symmetric
+        )
+        regret.append((direct if chosen == "direct" else fft) / min(direct, fft))
+        print(
+            f"{signal_length:>8} {taps:>6} {symmetric!s:>9} {direct * 1e3:>12.3f} "
+            f"{fft * 1e3:>10.3f} {chosen:>7}"
+        )
+
+    print()
+    print(f"Current DIRECT_COST: {tuple(DIRECT_COST)}")
+    print(f"Current FFT_COST:    {tuple(FFT_COST)}")
+    print(f"Fitted DIRECT_COST:  {tuple(float(f'{c:.2g}') for c in direct_cost)}")
+    print(f"Fitted FFT_COST:     {tuple(float(f'{c:.2g}') for c in fft_cost)}")
+    print(f"Worst slowdown of the chosen engine: {max(regret):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark of the folded direct-form kernel against the generic one.
+
+Filters a signal with symmetric coefficients using the generic tap loop
+(symmetric=False) and the folded kernel, which pre-adds the mirrored samples.
+Run with:
+
+    python benchmarks/folded_convolution_benchmark.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+# Benchmark the working tree
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from easy_fir_filter.filtering import StreamingFirFilter, convolve_direct
+
+
+def _time(function) -> float:
+    """
+    Returns the best of several timings of `function`, in seconds.
+    """
+    return min(timeit.repeat(function, number=3, repeat=5)) / 3
+
+
+def main():
+    rng = np.random.default_rng(0)
+
+    print(
+        f"{'signal':>8} {'taps':>6} {'generic (ms)':>13} {'folded (ms)':>12} {'speedup':>8}"
+    )
+    for signal_length in (10_000, 200_000):
+        signal = rng.standard_normal(signal_length)
+        for taps in (11, 51, 101, 301, 1001):
+            half = rng.standard_normal(taps // 2 + 1)
+            coefficients = np.concatenate([half, half[-2::-1]])
+
+            generic = _time(
+                lambda: convolve_direct(signal, coefficients, symmetric=False)
+            )
+            folded = _time(lambda: convolve_direct(signal, coefficients))
+            print(
+                f"{signal_length:>8} {taps:>6} {generic * 1e3:>13.3f} "
+                f"{folded * 1e3:>12.3f} {generic / folded:>7.2f}x"
+            )
+
+    print()
+    print(
+        f"{'chunk':>8} {'taps':>6} {'generic (ms)':>13} {'folded (ms)':>12} {'speedup':>8}"
+    )
+    for chunk_size in (256, 4096):
+        chunk = rng.standard_normal(chunk_size)
+        out = np.empty(chunk_size)
+        for taps in (51, 301):
+            half = rng.standard_normal(taps // 2 + 1)
+            coefficients = np.concatenate([half, half[-2::-1]])
+            folded_filter = StreamingFirFilter(coefficients)
+            generic_filter = StreamingFirFilter(coefficients)
+            generic_filter._symmetric = False
+
+            generic = _time(lambda: generic_filter.process(chunk, out))
+            folded = _time(lambda: folded_filter.process(chunk, out))
+            print(
+                f"{chunk_size:>8} {taps:>6} {generic * 1e3:>13.3f} "
+                f"{folded * 1e3:>12.3f} {generic / folded:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
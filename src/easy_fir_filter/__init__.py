@@ -1,4 +1,36 @@
+from .batch import (
+    CoefficientSets,
+    design_many,
+    design_many_parallel,
+    verify_many,
+)
+from .cache import DesignCache, DiskDesignCache
 from .easy_fir_filter import EasyFirFilter
+from .filtering import StreamingFirFilter
+from .multirate import (
+    Decimator,
+    Interpolator,
+    MultistageDecimator,
+    Resampler,
+    plan_decimation,
+)
 from .types import FilterConf, FilterType, FilterWindow
 
-__all__ = ["EasyFirFilter", "FilterConf", "FilterType", "FilterWindow"]
+__all__ = [
+    "CoefficientSets",
+    "Decimator",
+    "DesignCache",
+    "DiskDesignCache",
+    "EasyFirFilter",
+    "FilterConf",
+    "FilterType",
+    "FilterWindow",
+    "Interpolator",
+    "MultistageDecimator",
+    "Resampler",
+    "StreamingFirFilter",
+    "design_many",
+    "design_many_parallel",
+    "plan_decimation",
+    "verify_many",
+]
@@ -0,0 +1,15 @@
+from easy_fir_filter.analysis.frequency_response import frequency_response
+from easy_fir_filter.analysis.minimum_order import minimum_order
+from easy_fir_filter.analysis.spec_measurement import (
+    filter_bands,
+    measure_spec,
+    meets_spec,
+)
+
+__all__ = [
+    "filter_bands",
+    "frequency_response",
+    "measure_spec",
+    "meets_spec",
+    "minimum_order",
+]
@@ -0,0 +1,56 @@
+"""
+This module contains the frequency response of designed filters: magnitude, phase and
+group delay on a real FFT grid.
+"""
+
+import numpy as np
+
+from easy_fir_filter.types import FrequencyResponse
+
+
+def frequency_response(
+    coefficients: np.ndarray | list[float],
+    sampling_freq_hz: float,
+    n_points: int = 8192,
+) -> FrequencyResponse:
+    """
+    Computes the magnitude, phase and group delay of a filter on a real FFT grid.
+
+    The filter and its ramp k * h(k) are transformed by a single real FFT of two
+    rows, and the group delay follows from their ratio, without differentiating
+    the phase:
+        H = FFT(h(k)), R = FFT(k * h(k))
+        tau = Re(R / H)
+
+    Args:
+        coefficients (np.ndarray | list[float]): The FIR filter coefficients.
+        sampling_freq_hz (float): The sampling frequency in Hz.
+        n_points (int, optional): The FFT size. Defaults to 8192.
+
+    Returns:
+        FrequencyResponse: The response at the n_points // 2 + 1 grid frequencies.
+
+    Raises:
+        ValueError: If the coefficients are empty or n_points is lower than their number.
+    """
+    h = np.asarray(coefficients, dtype=np.float64)
+    if h.size == 0:
+        raise ValueError("The coefficients cannot be empty.")
+    if n_points < h.size:
+        raise ValueError(
+            f"The number of points must be at least the number of taps ({h.size}), "
+            f"got {n_points}."
+        )
+
+    response, ramp = np.fft.rfft(np.stack((h, np.arange(h.size) * h)), n_points)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        magnitude_db = 20 * np.log10(np.abs(response))
+        group_delay = np.where(response != 0, np.real(ramp / response), np.nan)
+
+    return {
+        "frequencies_hz": np.fft.rfftfreq(n_points, 1 / sampling_freq_hz),
+        "magnitude_db": magnitude_db,
+        "phase_rad": np.unwrap(np.angle(response)),
+        "group_delay_samples": group_delay,
+    }
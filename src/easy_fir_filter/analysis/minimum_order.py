@@ -0,0 +1,83 @@
+"""
+This module contains the search for the lowest filter order that meets a filter
+configuration.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+from easy_fir_filter.analysis.spec_measurement import measure_spec, meets_spec
+from easy_fir_filter.types import FilterConf
+
+
+def minimum_order(
+    n: int,
+    design: Callable[[int], np.ndarray],
+    filter_conf: FilterConf,
+    step: int = 1,
+    max_order: int | None = None,
+) -> int:
+    """
+    Binary-searches the lowest filter order whose design meets a configuration.
+
+    The candidates are the orders of at least 1 spaced by `step` from `n`, as a
+    single-tap filter (order 0) has no window. Each candidate is
+    designed with `design` and its response is measured with measure_spec. If the
+    estimate `n` meets Ap and As, the search bisects the orders below it. Otherwise
+    the order first grows by half until a design meets them, up to `max_order`, and
+    the search bisects between the last failing and the first meeting order.
+
+    The search assumes that, once a design meets the configuration, longer designs
+    keep meeting it, which holds for the window designs as the transition band
+    narrows when the order grows.
+
+    Args:
+        n (int): The order of the closed-form estimate.
+        design (Callable[[int], np.ndarray]): Returns the complete coefficients of
+            the design of a given order.
+        filter_conf (FilterConf): The filter configuration to meet.
+        step (int, optional): The spacing of the candidate orders, 2 to keep them
+            odd for half-band filters. Defaults to 1.
+        max_order (int, optional): The highest order to try. Defaults to 2 * n.
+
+    Returns:
+        int: The lowest order meeting the configuration, or `n` if no order up to
+            `max_order` meets it, for example when As exceeds what the window reaches.
+
+    Raises:
+        ValueError: If n is negative or step is lower than 1.
+    """
+    if n < 0:
+        raise ValueError("The filter order cannot be negative.")
+    if step < 1:
+        raise ValueError("The order step must be at least 1.")
+    if max_order is None:
+        max_order = 2 * n
+
+    def order(k: int) -> int:
+        return n % step + k * step
+
+    def meets(k: int) -> bool:
+        return meets_spec(measure_spec(design(order(k)), filter_conf), filter_conf)
+
+    # The index of the lowest candidate, order 1 or the lowest order above it
+    lowest = 0 if n % step else 1
+
+    # order(low) is known or assumed to fail and order(high) meets the specification
+    low, high = lowest - 1, max(n // step, lowest)
+    while not meets(high):
+        if order(high) >= max_order:
+            return n
+        low, high = high, max(
+            high + 1, min(high * 3 // 2, (max_order - n % step) // step)
+        )
+
+    while high - low > 1:
+        middle = (low + high) // 2
+        if meets(middle):
+            high = middle
+        else:
+            low = middle
+
+    return order(high)
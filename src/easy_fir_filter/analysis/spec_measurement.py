@@ -0,0 +1,126 @@
+"""
+This module contains the measurement of the passband ripple and stopband attenuation
+of designed filters, from their frequency response.
+"""
+
+import numpy as np
+
+from easy_fir_filter.types import FilterConf, SpecMeasurement
+
+# Smallest FFT size of the measurement grid, and grid points per filter tap
+_MIN_POINTS = 8192
+_POINTS_PER_TAP = 16
+
+
+def filter_bands(
+    filter_conf: FilterConf,
+) -> tuple[list[tuple[float, float]], list[tuple[float, float]]]:
+    """
+    Returns the passbands and stopbands of a filter configuration.
+
+    Args:
+        filter_conf (FilterConf): The filter configuration.
+
+    Returns:
+        tuple[list[tuple[float, float]], list[tuple[float, float]]]: The (low, high)
+            edges in Hz of the passbands and of the stopbands.
+
+    Raises:
+        ValueError: If the filter type is not supported.
+    """
+    filter_type = filter_conf["filter_type"]
+    nyquist = filter_conf["sampling_freq_hz"] / 2
+    fp = filter_conf["passband_freq_hz"]
+    fs = filter_conf["stopband_freq_hz"]
+
+    if filter_type == "lowpass":
+        return [(0.0, fp)], [(fs, nyquist)]
+    if filter_type == "highpass":
+        return [(fp, nyquist)], [(0.0, fs)]
+
+    if filter_type not in ("bandpass", "bandstop"):
+        raise ValueError(f"Unsupported filter type: {filter_type}")
+
+    fp2 = filter_conf["passband_freq2_hz"]  # type: ignore
+    fs2 = filter_conf["stopband_freq2_hz"]  # type: ignore
+    if filter_type == "bandpass":
+        return [(fp, fp2)], [(0.0, fs), (fs2, nyquist)]
+    return [(0.0, fp), (fp2, nyquist)], [(fs, fs2)]
+
+
+def measure_spec(
+    coefficients: np.ndarray | list[float],
+    filter_conf: FilterConf,
+    n_points: int | None = None,
+) -> SpecMeasurement:
+    """
+    Measures the passband ripple and stopband attenuation of a filter.
+
+    The magnitude response is evaluated on a real FFT grid of `n_points` points and
+    at the exact band edges, where equiripple and windowed designs have their largest
+    errors. Over the passbands and stopbands of the configuration:
+        Ap = 20 * log10(max(|H|) / min(|H|)) (passbands)
+        As = -20 * log10(max(|H|)) (stopbands)
+
+    Args:
+        coefficients (np.ndarray | list[float]): The FIR filter coefficients.
+        filter_conf (FilterConf): The filter configuration with the band edges.
+        n_points (int, optional): The FFT size. Defaults to 16 points per tap, and at
+            least 8192.
+
+    Returns:
+        SpecMeasurement: The measured passband ripple and stopband attenuation.
+    """
+    h = np.asarray(coefficients, dtype=np.float64)
+    if n_points is None:
+        n_points = max(_MIN_POINTS, _POINTS_PER_TAP * h.size)
+
+    passbands, stopbands = filter_bands(filter_conf)
+    grid = np.fft.rfftfreq(n_points, 1 / filter_conf["sampling_freq_hz"])
+    response = np.abs(np.fft.rfft(h, n_points))
+
+    edges = np.array([edge for band in passbands + stopbands for edge in band])
+    taps = np.arange(h.size)
+    edge_response = np.abs(
+        np.exp(-2j * np.pi * np.outer(edges, taps) / filter_conf["sampling_freq_hz"])
+        @ h
+    )
+
+    frequencies = np.concatenate((grid, edges))
+    magnitude = np.concatenate((response, edge_response))
+    passband = np.concatenate(
+        [magnitude[(frequencies >= lo) & (frequencies <= hi)] for lo, hi in passbands]
+    )
+    stopband = np.concatenate(
+        [magnitude[(frequencies >= lo) & (frequencies <= hi)] for lo, hi in stopbands]
+    )
+
+    # A passband with a zero gain, such as all-zero coefficients, has no finite ripple
+    ripple = (
+        float(20 * np.log10(passband.max() / passband.min()))
+        if passband.min() > 0
+        else np.inf
+    )
+    with np.errstate(divide="ignore"):
+        return {
+            "passband_ripple_db": ripple,
+            "stopband_attenuation_db": float(-20 * np.log10(stopband.max())),
+        }
+
+
+def meets_spec(measurement: SpecMeasurement, filter_conf: FilterConf) -> bool:
+    """
+    Checks whether a measurement meets the ripple and attenuation of a configuration.
+
+    Args:
+        measurement (SpecMeasurement): The measured passband ripple and stopband attenuation.
+        filter_conf (FilterConf): The filter configuration with the required values.
+
+    Returns:
+        bool: True if Ap and As are both met.
+    """
+    return (
+        measurement["passband_ripple_db"] <= filter_conf["passband_ripple_db"]
+        and measurement["stopband_attenuation_db"]
+        >= filter_conf["stopband_attenuation_db"]
+    )
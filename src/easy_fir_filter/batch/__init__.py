@@ -0,0 +1,6 @@
+from easy_fir_filter.batch.coefficient_sets import CoefficientSets
+from easy_fir_filter.batch.design_many import design_many
+from easy_fir_filter.batch.parallel import design_many_parallel
+from easy_fir_filter.batch.verify_many import verify_many
+
+__all__ = ["CoefficientSets", "design_many", "design_many_parallel", "verify_many"]
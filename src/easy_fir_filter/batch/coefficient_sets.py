@@ -0,0 +1,78 @@
+"""
+This module contains the implementation of the CoefficientSets class, a ragged collection of
+FIR filter coefficient sets backed by a single array.
+"""
+
+from typing import Iterator
+
+import numpy as np
+
+
+class CoefficientSets:
+    """
+    Ragged, array-backed collection of FIR filter coefficient sets.
+
+    All coefficient sets are stored back to back in one flat float64 array. Set `i`
+    spans `values[offsets[i]:offsets[i + 1]]`, and indexing the collection returns
+    that slice as a view, without copying.
+
+    Attributes:
+        values (np.ndarray): The coefficients of every set, concatenated.
+        offsets (np.ndarray): The start of each set in `values`, followed by the
+            total number of coefficients (one more element than there are sets).
+    """
+
+    def __init__(self, values: np.ndarray, offsets: np.ndarray):
+        """
+        Initializes the collection from the flat coefficients and the set offsets.
+
+        Args:
+            values (np.ndarray): The coefficients of every set, concatenated.
+            offsets (np.ndarray): The start of each set, followed by len(values).
+
+        Raises:
+            ValueError: If the offsets do not describe the values array.
+        """
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(values):
+            raise ValueError("Offsets must start at 0 and end at the number of values.")
+
+        self.values = values
+        self.offsets = offsets
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """
+        The number of coefficients (N = 2n + 1) of each set.
+        """
+        return np.diff(self.offsets)
+
+    @property
+    def orders(self) -> np.ndarray:
+        """
+        The filter order (n) of each set.
+        """
+        return (self.lengths - 1) // 2
+
+    def tolist(self) -> list[list[float]]:
+        """
+        Returns every coefficient set as a list of floats.
+
+        Returns:
+            list[list[float]]: The coefficient sets.
+        """
+        return [coefficients.tolist() for coefficients in self]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Coefficient set index out of range.")
+
+        return self.values[self.offsets[index] : self.offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for index in range(len(self)):
+            yield self[index]
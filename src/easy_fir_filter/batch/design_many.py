@@ -0,0 +1,216 @@
+"""
+This module provides the design_many function, which designs many FIR filters in a single call.
+
+Instead of running the EasyFirFilter design process once per configuration, the
+configurations are grouped by filter and window type and every design stage is
+computed for the whole group with array operations. Equiripple designs come from an
+iterative search, so they are designed one by one.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from easy_fir_filter.batch.coefficient_sets import CoefficientSets
+from easy_fir_filter.equiripple import design_equiripple
+from easy_fir_filter.factory.filter_factory import FilterFactory
+from easy_fir_filter.filters.lowpass_filter import LowpassFilter
+from easy_fir_filter.interfaces.filter_interface import IFilter
+from easy_fir_filter.phase import minimum_phase
+from easy_fir_filter.types import FilterConf, FilterType, FilterWindow
+from easy_fir_filter.utils import truncate_array
+from easy_fir_filter.validators.filter_conf_validator import FilterConfValidator
+from easy_fir_filter.windows.kaiser_window import KaiserWindow
+
+
+def design_many(
+    filter_confs: Sequence[FilterConf], round_to: int = 4, validate: bool = True
+) -> CoefficientSets:
+    """
+    Designs the FIR filters of many configurations at once.
+
+    The result of each configuration matches `EasyFirFilter(conf, round_to).calculate_filter()`.
+
+    Args:
+        filter_confs (Sequence[FilterConf]): The filter configurations to design.
+        round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+        validate (bool, optional): Whether to validate every configuration first. Defaults to True.
+
+    Returns:
+        CoefficientSets: The coefficients of every filter, in the order of `filter_confs`.
+
+    Raises:
+        FilterConfValidationError, ValueError: If validate is True and a configuration is invalid.
+        ValueError: If the delta of a configuration truncates to zero at this precision,
+            or no equiripple design meets a configuration.
+    """
+    if validate:
+        for filter_conf in filter_confs:
+            FilterConfValidator(filter_conf)
+
+    groups: dict[tuple[FilterType, FilterWindow, bool], list[int]] = {}
+    for index, filter_conf in enumerate(filter_confs):
+        key = (
+            filter_conf["filter_type"],
+            filter_conf["window_type"],
+            filter_conf.get("half_band", False),
+        )
+        groups.setdefault(key, []).append(index)
+
+    orders = np.zeros(len(filter_confs), dtype=np.int64)
+    group_designs = []
+    for (filter_type, window_type, half_band), indexes in groups.items():
+        group_confs = [filter_confs[i] for i in indexes]
+        if window_type == "equiripple":
+            n, half_coefficients = _design_equiripple_group(group_confs, round_to)
+        else:
+            n, half_coefficients = _design_group(
+                filter_type, window_type, group_confs, round_to, half_band
+            )
+        orders[indexes] = n
+        group_designs.append((np.asarray(indexes), n, half_coefficients))
+
+    offsets = np.zeros(len(filter_confs) + 1, dtype=np.int64)
+    np.cumsum(2 * orders + 1, out=offsets[1:])
+    values = np.empty(offsets[-1])
+
+    # Mirror each half response around its center: position p of a filter of
+    # order n takes the half coefficient |p - n|
+    for indexes, n, half_coefficients in group_designs:
+        owner, position = _ragged_indexes(2 * n + 1)
+        half_offsets = np.concatenate(([0], np.cumsum(n + 1)[:-1]))
+        values[offsets[indexes][owner] + position] = half_coefficients[
+            half_offsets[owner] + np.abs(position - n[owner])
+        ]
+
+    # Minimum-phase conversions need one cepstrum per filter
+    for index, filter_conf in enumerate(filter_confs):
+        if filter_conf.get("minimum_phase", False):
+            design = values[offsets[index] : offsets[index + 1]]
+            design[:] = minimum_phase(design, round_to)
+
+    return CoefficientSets(values, offsets)
+
+
+def _design_group(
+    filter_type: FilterType,
+    window_type: FilterWindow,
+    filter_confs: list[FilterConf],
+    round_to: int,
+    half_band: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Designs a group of filters that share the filter and window type.
+
+    Args:
+        filter_type (FilterType): The filter type of the group.
+        window_type (FilterWindow): The window type of the group.
+        filter_confs (list[FilterConf]): The configurations of the group.
+        round_to (int): The number of decimal places to round coefficients to.
+        half_band (bool, optional): Whether the group holds half-band lowpass filters. Defaults to False.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: A tuple containing:
+            - n (np.ndarray): The order of each filter.
+            - half_coefficients (np.ndarray): The n + 1 coefficients of each filter, concatenated.
+    """
+    filter_cls = FilterFactory.get_filter_class(filter_type)
+    window_cls = FilterFactory.get_window_class(window_type)
+
+    As = _conf_values(filter_confs, "stopband_attenuation_db")
+    Ap = _conf_values(filter_confs, "passband_ripple_db")
+    F = _conf_values(filter_confs, "sampling_freq_hz")
+    fp = _conf_values(filter_confs, "passband_freq_hz")
+    fs = _conf_values(filter_confs, "stopband_freq_hz")
+    fp2 = _conf_values(filter_confs, "passband_freq2_hz")
+    fs2 = _conf_values(filter_confs, "stopband_freq2_hz")
+
+    # Delta
+    delta_s = 10 ** (-0.05 * As)
+    delta_p = (10 ** (0.05 * Ap) - 1) / (10 ** (0.05 * Ap) + 1)
+    delta = truncate_array(np.minimum(delta_s, delta_p), round_to)
+    if np.any(delta <= 0):
+        raise ValueError(
+            f"Delta truncates to zero with round_to={round_to}. "
+            "Increase round_to or reduce the stopband attenuation."
+        )
+    # Ripples A's
+    AS = truncate_array(-20 * np.log10(delta), round_to)
+    # D parameter
+    D = np.where(AS <= 21, 0.9222, truncate_array((AS - 7.95) / 14.36, round_to))
+    # Filter order
+    filter_lengths = filter_cls._calculate_filter_lengths(  # type: ignore
+        D, F, fp, fs, fp2, fs2, round_to
+    )
+    n, N = IFilter._filter_orders(filter_lengths)
+    if half_band:
+        n, N = LowpassFilter._half_band_orders(n, N)
+
+    owner, nc = _ragged_indexes(n + 1)
+    # Impulse response coefficients
+    impulse_response = filter_cls._impulse_response(  # type: ignore
+        nc, F[owner], fp[owner], fs[owner], fp2[owner], fs2[owner], round_to
+    )
+    if half_band:
+        impulse_response = LowpassFilter._zero_half_band_taps(nc, impulse_response)
+    # Window coefficients
+    alpha = (
+        KaiserWindow._alpha_parameters(AS, round_to)[owner]
+        if window_type == "kaiser"
+        else None
+    )
+    window = window_cls._window(nc, N[owner], alpha, round_to)  # type: ignore
+
+    return n, truncate_array(window * impulse_response, round_to)
+
+
+def _design_equiripple_group(
+    filter_confs: list[FilterConf], round_to: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Designs a group of equiripple filters, one at a time.
+
+    Args:
+        filter_confs (list[FilterConf]): The configurations of the group.
+        round_to (int): The number of decimal places to round coefficients to.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: A tuple containing:
+            - n (np.ndarray): The order of each filter.
+            - half_coefficients (np.ndarray): The n + 1 coefficients of each filter, concatenated.
+    """
+    designs = [design_equiripple(filter_conf, round_to) for filter_conf in filter_confs]
+    n = np.array([design.size // 2 for design in designs], dtype=np.int64)
+
+    return n, np.concatenate([design[order:] for design, order in zip(designs, n)])
+
+
+def _conf_values(filter_confs: list[FilterConf], key: str) -> np.ndarray:
+    """
+    Collects a numeric configuration value of every filter, using NaN when it is missing.
+    """
+    return np.array(
+        [filter_conf.get(key, np.nan) for filter_conf in filter_confs],
+        dtype=np.float64,
+    )
+
+
+def _ragged_indexes(lengths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Enumerates the elements of consecutive segments of the given lengths.
+
+    Args:
+        lengths (np.ndarray): The length of each segment.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: For every element, the index of its segment
+            and its position inside the segment.
+
+    Example:
+        >>> _ragged_indexes(np.array([2, 3]))
+        (array([0, 0, 1, 1, 1]), array([0, 1, 0, 1, 2]))
+    """
+    owner = np.repeat(np.arange(len(lengths)), lengths)
+    starts = np.cumsum(lengths) - lengths
+
+    return owner, np.arange(lengths.sum()) - starts[owner]
@@ -0,0 +1,142 @@
+"""
+This module provides the design_many_parallel function, which shards a large configuration
+sweep across a pool of worker processes.
+
+Each worker designs its chunk with design_many and hands the coefficients back through a
+shared memory block, so only the small offsets array is pickled.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Sequence
+
+import numpy as np
+
+from easy_fir_filter.batch.coefficient_sets import CoefficientSets
+from easy_fir_filter.batch.design_many import design_many
+from easy_fir_filter.types import FilterConf
+from easy_fir_filter.validators.filter_conf_validator import FilterConfValidator
+
+
+def design_many_parallel(
+    filter_confs: Sequence[FilterConf],
+    round_to: int = 4,
+    max_workers: int | None = None,
+    chunk_size: int = 1000,
+) -> CoefficientSets:
+    """
+    Designs the FIR filters of many configurations using a pool of worker processes.
+
+    The configurations are validated in the calling process, then split into chunks
+    of `chunk_size` and each chunk is designed by a worker with `design_many`. If
+    everything fits in a single chunk, it is designed in the calling process.
+
+    Args:
+        filter_confs (Sequence[FilterConf]): The filter configurations to design.
+        round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+        max_workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int, optional): The number of configurations per chunk. Defaults to 1000.
+
+    Returns:
+        CoefficientSets: The coefficients of every filter, in the order of `filter_confs`.
+
+    Raises:
+        ValueError: If chunk_size is lower than 1.
+        FilterConfValidationError, ValueError: If a configuration is invalid.
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1.")
+
+    chunks = [
+        list(filter_confs[start : start + chunk_size])
+        for start in range(0, len(filter_confs), chunk_size)
+    ]
+    if len(chunks) <= 1:
+        return design_many(filter_confs, round_to)
+
+    # Validation errors do not all survive pickling, so the workers skip it
+    for filter_conf in filter_confs:
+        FilterConfValidator(filter_conf)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_design_chunk, chunk, round_to) for chunk in chunks]
+
+        chunk_results = []
+        error = None
+        for future in futures:
+            try:
+                chunk_results.append(future.result())
+            except Exception as exception:  # noqa: BLE001
+                error = error or exception
+
+    if error is not None:
+        for name, _ in chunk_results:
+            _, block = _release(name, 0)
+            block.close()
+            block.unlink()
+        raise error
+
+    return _gather(chunk_results)
+
+
+def _design_chunk(
+    filter_confs: list[FilterConf], round_to: int
+) -> tuple[str, np.ndarray]:
+    """
+    Designs a chunk of validated configurations in a worker and copies its coefficients
+    into a new shared memory block.
+
+    The block is handed over to the parent process, which unlinks it after copying.
+
+    Returns:
+        tuple[str, np.ndarray]: The shared memory block name and the offsets of the chunk.
+    """
+    result = design_many(filter_confs, round_to, validate=False)
+
+    # Shared memory blocks cannot be empty
+    block = shared_memory.SharedMemory(create=True, size=max(result.values.nbytes, 1))
+    try:
+        np.ndarray(result.values.shape, np.float64, block.buf)[:] = result.values
+    finally:
+        block.close()
+
+    # The parent process owns the block from here on, so the worker's resource
+    # tracker must not unlink it when the worker exits
+    resource_tracker.unregister(block._name, "shared_memory")  # type: ignore[attr-defined]
+
+    return block.name, result.offsets
+
+
+def _gather(chunk_results: list[tuple[str, np.ndarray]]) -> CoefficientSets:
+    """
+    Concatenates the chunk results into one collection and releases the shared memory.
+    """
+    lengths = [int(offsets[-1]) for _, offsets in chunk_results]
+    values = np.empty(sum(lengths))
+    offsets = [np.zeros(1, dtype=np.int64)]
+
+    start = 0
+    for (name, chunk_offsets), length in zip(chunk_results, lengths):
+        chunk_values, block = _release(name, length)
+        values[start : start + length] = chunk_values
+        del chunk_values
+        block.close()
+        block.unlink()
+
+        offsets.append(chunk_offsets[1:] + start)
+        start += length
+
+    return CoefficientSets(values, np.concatenate(offsets))
+
+
+def _release(name: str, length: int) -> tuple[np.ndarray, shared_memory.SharedMemory]:
+    """
+    Attaches to a shared memory block written by a worker.
+
+    Returns:
+        tuple[np.ndarray, shared_memory.SharedMemory]: A view of the first `length`
+            coefficients and the block, which the caller must close and unlink.
+    """
+    block = shared_memory.SharedMemory(name=name)
+
+    return np.ndarray((length,), np.float64, block.buf), block
@@ -0,0 +1,220 @@
+"""
+This module provides the verify_many function, which measures whether many designed
+filters meet their configurations in a single call.
+
+The coefficients are zero-padded into a 2-D array and transformed by one real FFT per
+batch of rows. The grid bins of each band are a contiguous range, so the band maxima
+and minima of the whole batch are taken by np.maximum.reduceat and
+np.minimum.reduceat over the flattened magnitudes.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from easy_fir_filter.analysis import filter_bands
+from easy_fir_filter.analysis.spec_measurement import _MIN_POINTS, _POINTS_PER_TAP
+from easy_fir_filter.batch.coefficient_sets import CoefficientSets
+from easy_fir_filter.types import FilterConf, SpecVerification
+
+# Largest number of spectrum values computed in one batch of rows
+_BATCH_ELEMENTS = 1 << 22
+# Most passbands and most stopbands of a filter type
+_MAX_BANDS = 2
+
+
+def verify_many(
+    coefficient_sets: CoefficientSets | Sequence[np.ndarray | list[float]],
+    filter_confs: Sequence[FilterConf],
+    n_points: int | None = None,
+) -> SpecVerification:
+    """
+    Measures the passband ripple and stopband attenuation of many filters and checks
+    them against their configurations.
+
+    Each filter is measured as in analysis.measure_spec: its magnitude response is
+    evaluated on a real FFT grid of `n_points` points and at the exact band edges of
+    its configuration, where truncated designs have their largest errors. The margins
+    are positive when the specification is met with room to spare:
+        passband margin = Ap - measured ripple
+        stopband margin = measured attenuation - As
+
+    Args:
+        coefficient_sets (CoefficientSets | Sequence): The coefficients of every
+            filter, such as the result of design_many.
+        filter_confs (Sequence[FilterConf]): The configuration of every filter.
+        n_points (int, optional): The FFT size. Defaults to 16 points per tap of the
+            longest filter, and at least 8192.
+
+    Returns:
+        SpecVerification: The measurements, margins and pass/fail flags, in the order
+            of `filter_confs`.
+
+    Raises:
+        ValueError: If the number of filters and configurations differ, a filter has no
+            coefficients, or n_points is lower than the longest filter.
+    """
+    if isinstance(coefficient_sets, CoefficientSets):
+        values, offsets = coefficient_sets.values, coefficient_sets.offsets
+    else:
+        arrays = [
+            np.asarray(coefficients, dtype=np.float64)
+            for coefficients in coefficient_sets
+        ]
+        values = np.concatenate(arrays) if arrays else np.empty(0)
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([array.size for array in arrays], out=offsets[1:])
+
+    count = len(filter_confs)
+    if offsets.size - 1 != count:
+        raise ValueError(
+            f"Got {offsets.size - 1} coefficient sets for {count} configurations."
+        )
+
+    lengths = np.diff(offsets)
+    if np.any(lengths == 0):
+        raise ValueError("Every filter must have at least one coefficient.")
+
+    longest = int(lengths.max()) if count else 1
+    if n_points is None:
+        n_points = max(_MIN_POINTS, _POINTS_PER_TAP * longest)
+    if n_points < longest:
+        raise ValueError(
+            f"The number of points must be at least the longest filter ({longest}), "
+            f"got {n_points}."
+        )
+
+    sampling_freq_hz = np.array(
+        [filter_conf["sampling_freq_hz"] for filter_conf in filter_confs],
+        dtype=np.float64,
+    )
+    passbands, stopbands = _band_edges(filter_confs)
+
+    ripple = np.empty(count)
+    attenuation = np.empty(count)
+    rows = max(1, _BATCH_ELEMENTS // n_points)
+    for start in range(0, count, rows):
+        batch = slice(start, min(start + rows, count))
+        ripple[batch], attenuation[batch] = _measure_batch(
+            values[offsets[batch.start] : offsets[batch.stop]],
+            lengths[batch],
+            sampling_freq_hz[batch],
+            passbands[batch],
+            stopbands[batch],
+            n_points,
+        )
+
+    passband_margin = (
+        np.array([conf["passband_ripple_db"] for conf in filter_confs], dtype=float)
+        - ripple
+    )
+    stopband_margin = attenuation - np.array(
+        [conf["stopband_attenuation_db"] for conf in filter_confs], dtype=float
+    )
+
+    return {
+        "passband_ripple_db": ripple,
+        "stopband_attenuation_db": attenuation,
+        "passband_margin_db": passband_margin,
+        "stopband_margin_db": stopband_margin,
+        "passed": (passband_margin >= 0) & (stopband_margin >= 0),
+    }
+
+
+def _band_edges(filter_confs: Sequence[FilterConf]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Collects the passbands and stopbands of every configuration.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The (count, 2, 2) passband and stopband
+            (low, high) edges in Hz, padded with NaN for filters with a single band.
+    """
+    passbands = np.full((len(filter_confs), _MAX_BANDS, 2), np.nan)
+    stopbands = np.full((len(filter_confs), _MAX_BANDS, 2), np.nan)
+    for i, filter_conf in enumerate(filter_confs):
+        filter_passbands, filter_stopbands = filter_bands(filter_conf)
+        passbands[i, : len(filter_passbands)] = filter_passbands
+        stopbands[i, : len(filter_stopbands)] = filter_stopbands
+
+    return passbands, stopbands
+
+
+def _measure_batch(
+    values: np.ndarray,
+    lengths: np.ndarray,
+    sampling_freq_hz: np.ndarray,
+    passbands: np.ndarray,
+    stopbands: np.ndarray,
+    n_points: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Measures the passband ripple and stopband attenuation of a batch of filters.
+
+    Args:
+        values (np.ndarray): The concatenated coefficients of the batch.
+        lengths (np.ndarray): The number of coefficients of each filter.
+        sampling_freq_hz (np.ndarray): The sampling frequency of each filter.
+        passbands (np.ndarray): The NaN-padded (rows, 2, 2) passband edges.
+        stopbands (np.ndarray): The NaN-padded (rows, 2, 2) stopband edges.
+        n_points (int): The FFT size.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The passband ripple and stopband attenuation
+            in dB of each filter.
+    """
+    rows = lengths.size
+    owner = np.repeat(np.arange(rows), lengths)
+    position = np.arange(values.size) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    padded = np.zeros((rows, int(lengths.max())))
+    padded[owner, position] = values
+
+    # Magnitude on the FFT grid, with a spare column so every band end is a valid index
+    bins = n_points // 2 + 1
+    magnitude = np.zeros((rows, bins + 1))
+    np.abs(np.fft.rfft(padded, n_points, axis=1), out=magnitude[:, :bins])
+    magnitude = magnitude.ravel()
+
+    # Magnitude at the exact band edges, evaluating the polynomials by Horner's rule
+    edges = np.concatenate((passbands, stopbands), axis=1)
+    z = np.exp(-2j * np.pi * np.nan_to_num(edges) / sampling_freq_hz[:, None, None])
+    edge_response = np.zeros(edges.shape, dtype=np.complex128)
+    for tap in padded.T[::-1]:
+        edge_response *= z
+        edge_response += tap[:, None, None]
+    edge_magnitude = np.abs(edge_response)
+
+    # The grid bins of a band are contiguous: k * F / n_points in [low, high]
+    scale = n_points / sampling_freq_hz[:, None, None]
+    bounds = np.nan_to_num(
+        np.stack(
+            (
+                np.ceil(edges[..., 0] * scale[..., 0]),
+                np.floor(edges[..., 1] * scale[..., 0]) + 1,
+            ),
+            axis=-1,
+        )
+    )
+    bounds = np.clip(bounds, 0, bins).astype(np.int64)
+    bounds += (np.arange(rows) * (bins + 1))[:, None, None]
+    empty = bounds[..., 1] <= bounds[..., 0]
+    present = ~np.isnan(edges[..., 0])
+
+    def band_reduce(ufunc: np.ufunc, identity: float) -> np.ndarray:
+        grid = ufunc.reduceat(magnitude, bounds.ravel())[::2].reshape(empty.shape)
+        reduced = ufunc(
+            np.where(empty, identity, grid), ufunc.reduce(edge_magnitude, axis=2)
+        )
+        return np.where(present, reduced, identity)
+
+    band_max = band_reduce(np.maximum, -np.inf)
+    band_min = band_reduce(np.minimum, np.inf)
+
+    passband_max = band_max[:, :_MAX_BANDS].max(axis=1)
+    passband_min = band_min[:, :_MAX_BANDS].min(axis=1)
+    stopband_max = band_max[:, _MAX_BANDS:].max(axis=1)
+
+    with np.errstate(divide="ignore"):
+        return (
+            20 * np.log10(passband_max / passband_min),
+            -20 * np.log10(stopband_max),
+        )
@@ -0,0 +1,5 @@
+from easy_fir_filter.cache.canonical_key import canonicalize_filter_conf
+from easy_fir_filter.cache.design_cache import DesignCache
+from easy_fir_filter.cache.disk_cache import DiskDesignCache
+
+__all__ = ["DesignCache", "DiskDesignCache", "canonicalize_filter_conf"]
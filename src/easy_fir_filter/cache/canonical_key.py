@@ -0,0 +1,41 @@
+"""
+This module provides the canonical, hashable form of a filter configuration.
+
+Two configurations that describe the same design (same keys and values, regardless
+of key order or of int/float spelling) produce the same key, so it can be used to
+look up cached designs.
+"""
+
+from typing import Hashable
+
+from easy_fir_filter.types.fir_filter_conf import FilterConf
+
+
+def canonicalize_filter_conf(filter_conf: FilterConf, round_to: int = 4) -> Hashable:
+    """
+    Builds a hashable key that identifies the design of a filter configuration.
+
+    The key contains the rounding precision and the configuration items sorted by
+    key. Numeric values are normalized to float, so 1000 and 1000.0 (or -0.0 and
+    0.0) produce the same key. The window type and every other string value are
+    kept as they are.
+
+    Args:
+        filter_conf (FilterConf): The filter configuration dictionary.
+        round_to (int, optional): The number of decimal places of the design. Defaults to 4.
+
+    Returns:
+        Hashable: The canonical key of the configuration.
+
+    Example:
+        >>> canonicalize_filter_conf({"sampling_freq_hz": 8000, "filter_type": "lowpass"})
+        (4, (('filter_type', 'lowpass'), ('sampling_freq_hz', 8000.0)))
+    """
+    items = []
+    for key in sorted(filter_conf):
+        value = filter_conf[key]  # type: ignore
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = float(value) + 0.0
+        items.append((key, value))
+
+    return round_to, tuple(items)
@@ -0,0 +1,125 @@
+"""
+This module contains the implementation of the DesignCache class, an in-memory LRU cache
+of designed FIR filter coefficients.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+import numpy as np
+
+from easy_fir_filter.cache.canonical_key import canonicalize_filter_conf
+from easy_fir_filter.easy_fir_filter import EasyFirFilter
+from easy_fir_filter.types import CacheStats, FilterConf
+
+
+class DesignCache:
+    """
+    In-memory LRU cache of FIR filter designs.
+
+    Repeated designs of the same configuration skip validation, the filter and window
+    creation and the whole design process. Configurations are identified by their
+    canonical key (see `canonicalize_filter_conf`), and the cached coefficients are
+    returned as read-only arrays so callers cannot corrupt the shared entry.
+
+    The cache is safe to share between threads.
+
+    Attributes:
+        max_size (int): Maximum number of designs kept. The least recently used design
+            is evicted when a new one does not fit.
+        hits (int): Number of designs served from the cache.
+        misses (int): Number of designs that had to be calculated.
+        evictions (int): Number of designs removed to respect max_size.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initializes an empty design cache.
+
+        Args:
+            max_size (int, optional): Maximum number of designs kept. Defaults to 256.
+
+        Raises:
+            ValueError: If max_size is lower than 1.
+        """
+        if max_size < 1:
+            raise ValueError("The maximum cache size must be at least 1.")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def calculate_filter(
+        self, filter_conf: FilterConf, round_to: int = 4
+    ) -> np.ndarray:
+        """
+        Returns the FIR filter coefficients of a configuration, designing it on a miss.
+
+        Args:
+            filter_conf (FilterConf): The filter configuration dictionary.
+            round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The read-only FIR filter coefficients.
+        """
+        key = canonicalize_filter_conf(filter_conf, round_to)
+
+        with self._lock:
+            coefficients = self._entries.get(key)
+            if coefficients is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return coefficients
+            self.misses += 1
+
+        # Design outside the lock so other configurations are not blocked
+        coefficients = np.array(
+            EasyFirFilter(filter_conf, round_to).calculate_filter(), dtype=np.float64
+        )
+        coefficients.flags.writeable = False
+
+        with self._lock:
+            self._entries[key] = coefficients
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return coefficients
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the cache counters.
+
+        Returns:
+            CacheStats: The hit, miss and eviction counters and the current size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def clear(self):
+        """
+        Removes every cached design and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached designs.
+        """
+        return len(self._entries)
@@ -0,0 +1,257 @@
+"""
+This module contains the implementation of the DiskDesignCache class, a persistent cache of
+designed FIR filter coefficients that can be shared by several processes.
+"""
+
+import functools
+import hashlib
+import os
+import tempfile
+import time
+from importlib.metadata import PackageNotFoundError, version
+
+import numpy as np
+
+from easy_fir_filter.cache.canonical_key import canonicalize_filter_conf
+from easy_fir_filter.easy_fir_filter import EasyFirFilter
+from easy_fir_filter.types import DiskCacheStats, FilterConf
+
+_ENTRY_SUFFIX = ".npy"
+_TEMP_SUFFIX = ".tmp"
+# Age in seconds after which clear() removes a temporary file that was never renamed
+_STALE_TEMP_SECONDS = 3600
+
+
+@functools.cache
+def _library_version() -> str:
+    """
+    Returns the installed version of the package, used to invalidate old entries.
+
+    The version is read from the package metadata once per process.
+    """
+    try:
+        return version("easy-fir-filter")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class DiskDesignCache:
+    """
+    On-disk cache of FIR filter designs, shared across processes.
+
+    Each design is stored as a raw `.npy` file named after the SHA-256 hash of its
+    canonical configuration key (see `canonicalize_filter_conf`) and the library
+    version, so upgrading the library never serves stale designs. Entries are
+    loaded memory-mapped and read-only.
+
+    Files are written to a temporary file in the cache directory and moved into
+    place with an atomic rename, so concurrent workers can fill the same directory
+    and readers never see a partial entry. When the total size exceeds max_bytes,
+    the least recently used entries are removed.
+
+    Attributes:
+        directory (str): The cache directory. It is created if it does not exist.
+        max_bytes (int): Maximum total size in bytes of the stored entries.
+        hits (int): Number of designs loaded from disk by this instance.
+        misses (int): Number of designs this instance had to calculate.
+        evictions (int): Number of entries this instance removed.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int = 64 * 1024**2):
+        """
+        Initializes the disk cache on the given directory.
+
+        Args:
+            directory (str | os.PathLike): The cache directory.
+            max_bytes (int, optional): Maximum total size of the entries. Defaults to 64 MiB.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError("The maximum cache size must be positive.")
+
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def entry_path(self, filter_conf: FilterConf, round_to: int = 4) -> str:
+        """
+        Returns the path of the entry that stores a configuration.
+
+        Args:
+            filter_conf (FilterConf): The filter configuration dictionary.
+            round_to (int, optional): The number of decimal places of the design. Defaults to 4.
+
+        Returns:
+            str: The path of the `.npy` entry.
+        """
+        key = (_library_version(), canonicalize_filter_conf(filter_conf, round_to))
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+
+        return os.path.join(self.directory, digest + _ENTRY_SUFFIX)
+
+    def calculate_filter(
+        self, filter_conf: FilterConf, round_to: int = 4
+    ) -> np.ndarray:
+        """
+        Returns the FIR filter coefficients of a configuration, designing and storing it on a miss.
+
+        Args:
+            filter_conf (FilterConf): The filter configuration dictionary.
+            round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The read-only FIR filter coefficients. Entries loaded from
+                disk are memory-mapped.
+        """
+        path = self.entry_path(filter_conf, round_to)
+
+        try:
+            coefficients = np.load(path, mmap_mode="r")
+        except (FileNotFoundError, ValueError):
+            # Missing, evicted by another process, or unreadable: design it again
+            pass
+        else:
+            self._touch(path)
+            self.hits += 1
+            return coefficients
+
+        self.misses += 1
+        coefficients = np.array(
+            EasyFirFilter(filter_conf, round_to).calculate_filter(), dtype=np.float64
+        )
+        coefficients.flags.writeable = False
+
+        self._write(path, coefficients)
+        self._evict(keep=path)
+
+        return coefficients
+
+    def stats(self) -> DiskCacheStats:
+        """
+        Returns the counters of this instance and the usage of the cache directory.
+
+        Returns:
+            DiskCacheStats: The counters, the number of entries and their total size.
+        """
+        entries = self._entries()
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "size_bytes": sum(size for _, _, size in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self):
+        """
+        Removes every entry and stale temporary file, and resets the counters.
+
+        Temporary files younger than _STALE_TEMP_SECONDS may still be written by
+        other processes, so they are kept.
+        """
+        stale_before = time.time() - _STALE_TEMP_SECONDS
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(_ENTRY_SUFFIX):
+                self._remove(path)
+            elif name.endswith(_TEMP_SUFFIX):
+                try:
+                    stale = os.stat(path).st_mtime < stale_before
+                except FileNotFoundError:
+                    continue
+                if stale:
+                    self._remove(path)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _write(self, path: str, coefficients: np.ndarray):
+        """
+        Atomically writes an entry: a temporary file is written, then renamed over `path`.
+
+        If another process removed the temporary file meanwhile, the entry is not
+        stored, and the design is calculated again on its next lookup.
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=_TEMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, coefficients)
+            os.replace(temp_path, path)
+        except FileNotFoundError:
+            pass
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+    def _evict(self, keep: str):
+        """
+        Removes the least recently used entries until the cache fits in max_bytes.
+
+        Args:
+            keep (str): Path of an entry that must not be removed (the one just written).
+        """
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+
+        for path, _, size in sorted(entries, key=lambda entry: entry[1]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            if self._remove(path):
+                self.evictions += 1
+            total -= size
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        """
+        Lists the stored entries.
+
+        Returns:
+            list[tuple[str, float, int]]: The path, last access time and size of each entry.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(_ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+
+        return entries
+
+    @staticmethod
+    def _touch(path: str):
+        """
+        Marks an entry as recently used.
+        """
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """
+        Removes a file, ignoring files already removed by another process.
+
+        Returns:
+            bool: Whether the file was removed by this call.
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+
+        return True
@@ -1,16 +1,84 @@
 """
 This module contains the implementation of the EasyFirFilter class, which provides a high-level interface
-for designing and calculating FIR filter coefficients based on a given filter configuration.
+for designing FIR filters based on a given filter configuration and applying them to signals.
 """
 
+import copy
+import logging
 import math
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Literal
 
+import numpy as np
+
+from easy_fir_filter.analysis import frequency_response, minimum_order
+from easy_fir_filter.equiripple import design_equiripple
 from easy_fir_filter.factory.filter_factory import FilterFactory
+from easy_fir_filter.filtering import (
+    OverlapAddConvolver,
+    choose_method,
+    convolve_direct,
+)
+from easy_fir_filter.filtering.direct_form import is_symmetric
+from easy_fir_filter.filtering.output_window import normalize_axis
+from easy_fir_filter.instrumentation import timed_stage
 from easy_fir_filter.interfaces.easy_fir_filter_interface import IEasyFirFilter
-from easy_fir_filter.types import FilterConf
-from easy_fir_filter.utils import build_filter_coefficients, truncate
-from easy_fir_filter.validators.filter_conf_validator import \
-    FilterConfValidator
+from easy_fir_filter.phase import minimum_phase, passband_latency
+from easy_fir_filter.types import (
+    ConvolutionMode,
+    DesignStage,
+    FilterConf,
+    FilteringMethod,
+    FrequencyResponse,
+    StageRecord,
+)
+from easy_fir_filter.utils import build_symmetric_coefficients, truncate
+from easy_fir_filter.validators.filter_conf_validator import FilterConfValidator
+
+logger = logging.getLogger(__name__)
+
+# The FilterConf fields read by the filter objects
+_FILTER_FIELDS = frozenset(
+    {
+        "filter_type",
+        "sampling_freq_hz",
+        "passband_freq_hz",
+        "stopband_freq_hz",
+        "passband_freq2_hz",
+        "stopband_freq2_hz",
+        "half_band",
+    }
+)
+# The FilterConf fields of the specification measured by the equiripple and
+# minimum-order designs
+_SPEC_FIELDS = (_FILTER_FIELDS - {"half_band"}) | {
+    "passband_ripple_db",
+    "stopband_attenuation_db",
+}
+# The FilterConf fields each design stage reads
+_STAGE_FIELDS: dict[DesignStage, frozenset[str]] = {
+    "delta": frozenset({"passband_ripple_db", "stopband_attenuation_db"}),
+    "ripples": frozenset(),
+    "d_parameter": frozenset(),
+    "order": _FILTER_FIELDS,
+    "equiripple": _SPEC_FIELDS | {"window_type"},
+    "minimum_order": _SPEC_FIELDS | {"window_type", "half_band"},
+    "impulse_response": _FILTER_FIELDS,
+    "window": frozenset({"window_type"}),
+    "coefficients": frozenset(),
+}
+# The earlier stages whose results each design stage reads
+_STAGE_INPUTS: dict[DesignStage, tuple[DesignStage, ...]] = {
+    "delta": (),
+    "ripples": ("delta",),
+    "d_parameter": ("ripples",),
+    "order": ("d_parameter",),
+    "equiripple": (),
+    "minimum_order": ("ripples", "order"),
+    "impulse_response": ("order", "minimum_order"),
+    "window": ("ripples", "order", "minimum_order"),
+    "coefficients": ("impulse_response", "window"),
+}
 
 
 class EasyFirFilter(IEasyFirFilter, FilterConfValidator):
@@ -23,8 +91,9 @@ class EasyFirFilter(IEasyFirFilter, FilterConfValidator):
     Attributes:
         filter_conf (FilterConf): The filter configuration dictionary.
         round_to (int): The number of decimal places to round coefficients to.
+        minimize_order (bool): Whether to shrink window designs to the lowest order meeting the specification.
         filter: The filter object created by FilterFactory.
-        window: The window object created by FilterFactory.
+        window: The window object created by FilterFactory, or None for the equiripple design.
         As (float): Stopband attenuation in dB.
         Ap (float): Passband ripple in dB.
         delta (float): Minimum tolerance between passband and stopband ripples.
@@ -32,23 +101,56 @@ class EasyFirFilter(IEasyFirFilter, FilterConfValidator):
         AS (float): Calculated stopband attenuation.
         D (float): Kaiser window parameter.
         fir_filter_coefficients (list[float]): The calculated FIR filter coefficients.
+        coefficients (np.ndarray | None): The complete filter, used to filter signals, which
+            is symmetric unless the minimum_phase option is set.
+        latency_samples (float | None): The delay of the filter in samples, its order n for
+            linear phase, or its mean passband group delay for minimum phase.
+        zero_taps (np.ndarray): The indexes of the coefficients that are zero by construction,
+            every other one for half-band filters, which the direct-form engines skip.
+        kaiser_taps (int | None): The length given by the closed-form (Kaiser) order estimate.
+        taps_saved (int | None): The taps the equiripple design or the order minimization
+            saves compared with kaiser_taps, 0 otherwise.
     """
 
-    def __init__(self, filter_conf: FilterConf, round_to: int = 4):
+    def __init__(
+        self,
+        filter_conf: FilterConf,
+        round_to: int = 4,
+        minimize_order: bool = False,
+        on_stage: Callable[[StageRecord], None] | None = None,
+        trace_memory: bool = False,
+    ):
         """
         Initializes the EasyFirFilter with the given filter configuration and rounding precision.
 
         Args:
             filter_conf (FilterConf): The filter configuration dictionary.
             round_to (int): The number of decimal places to round coefficients to (default: 4).
+            minimize_order (bool): Whether to search for the lowest order whose window
+                design still meets the specification (default: False).
+            on_stage (Callable[[StageRecord], None], optional): Receives the wall time,
+                tap count and optional peak memory of every design stage, such as a
+                StageCollector. Without it, the stages are not measured (default: None).
+            trace_memory (bool): Whether to record the peak memory of every stage with
+                tracemalloc, which slows the design down (default: False).
         """
-        FilterConfValidator.__init__(self, filter_conf)
+        self.on_stage = on_stage
+        self.trace_memory = trace_memory
+        self.filter = None
+
+        with self._stage("validation"):
+            FilterConfValidator.__init__(self, filter_conf)
 
         self.round_to = round_to
+        self.minimize_order = minimize_order
         self.filter_conf = filter_conf
 
         self.filter = FilterFactory.create_filter(filter_conf, round_to)
-        self.window = FilterFactory.create_window(filter_conf["window_type"], round_to)
+        self.window = (
+            None
+            if filter_conf["window_type"] == "equiripple"
+            else FilterFactory.create_window(filter_conf["window_type"], round_to)
+        )
 
         self.As = filter_conf["stopband_attenuation_db"]
         self.Ap = filter_conf["passband_ripple_db"]
@@ -58,6 +160,14 @@ class EasyFirFilter(IEasyFirFilter, FilterConfValidator):
         self.AS = None
         self.D = None
         self.fir_filter_coefficients: list[float] = []
+        self.coefficients: np.ndarray | None = None
+        self._linear_coefficients: np.ndarray | None = None
+        self.zero_taps: np.ndarray = np.empty(0, dtype=np.int64)
+        self.latency_samples: float | None = None
+        self.kaiser_taps: int | None = None
+        self.taps_saved: int | None = None
+        self._convolver: OverlapAddConvolver | None = None
+        self._frequency_responses: dict[int, FrequencyResponse] = {}
 
     def calculate_filter(self) -> list[float]:
         """
@@ -67,28 +177,311 @@ class EasyFirFilter(IEasyFirFilter, FilterConfValidator):
         ripple calculation, D parameter calculation, filter order calculation, impulse response calculation,
         windowing, and final coefficient calculation.
 
+        With the "equiripple" window type, the Kaiser order is only computed to report
+        taps_saved, and the coefficients come from design_equiripple instead. With
+        minimize_order, the order of a window design is binary-searched around
+        the estimate, keeping the lowest one whose truncated coefficients meet
+        Ap and As (see analysis.minimum_order). With the minimum_phase option, the
+        linear-phase design is then converted to minimum phase, and latency_samples
+        reports its passband group delay instead of n.
+
+        With an on_stage callback, every stage is measured and reported to it as it
+        finishes (see instrumentation.timed_stage).
+
         Returns:
             list[float]: The calculated FIR filter coefficients.
         """
+        return self._design(None)
+
+    def redesign(self, **changes) -> list[float]:
+        """
+        Changes fields of the filter configuration and recalculates the design,
+        recomputing only the stages that depend on the changed fields.
+
+        Every stage reads some FilterConf fields (_STAGE_FIELDS) and the results of
+        earlier stages (_STAGE_INPUTS). A stage is recomputed when one of its fields
+        changed or one of its inputs was recomputed. For example, changing the
+        window_type keeps delta, the order and the impulse response, and changing a
+        band edge keeps delta, the ripples, D and the Kaiser alpha. Switching between
+        the equiripple and a window design, or redesigning a filter that was never
+        calculated, recomputes every stage.
+
+        Args:
+            **changes: The FilterConf fields to change, with None removing an
+                optional field such as passband_freq2_hz.
+
+        Returns:
+            list[float]: The calculated FIR filter coefficients.
+
+        Raises:
+            ValueError: If the changed configuration is invalid, in which case the
+                filter keeps its previous configuration and design. A stage that
+                fails also restores the previous configuration and design before
+                its error propagates.
+
+        Example:
+            >>> fir_filter.calculate_filter()
+            >>> fir_filter.redesign(stopband_freq_hz=1400)
+        """
+        filter_conf: FilterConf = {**self.filter_conf, **changes}  # type: ignore
+        for field, value in changes.items():
+            if value is None:
+                filter_conf.pop(field, None)  # type: ignore
+
+        with self._stage("validation"):
+            FilterConfValidator(filter_conf)
+
+        changed = {
+            field
+            for field in self.filter_conf.keys() | filter_conf.keys()
+            if self.filter_conf.get(field) != filter_conf.get(field)
+        }
+        equiripple = filter_conf["window_type"] == "equiripple"
+        if self.coefficients is None or (self.window is None) != equiripple:
+            changed = None
+
+        # The stages only rebind attributes, so shallow copies keep the design
+        snapshot = {
+            **vars(self),
+            "filter": copy.copy(self.filter),
+            "window": copy.copy(self.window),
+        }
+        try:
+            self.filter_conf = filter_conf
+            self.As = filter_conf["stopband_attenuation_db"]
+            self.Ap = filter_conf["passband_ripple_db"]
+            if changed is None or changed & _FILTER_FIELDS:
+                self.filter = FilterFactory.create_filter(filter_conf, self.round_to)
+            if changed is None or "window_type" in changed:
+                self.window = (
+                    None
+                    if equiripple
+                    else FilterFactory.create_window(
+                        filter_conf["window_type"], self.round_to
+                    )
+                )
+
+            return self._design(changed)
+        except Exception:
+            vars(self).clear()
+            vars(self).update(snapshot)
+            raise
+
+    def _design(self, changed: set[str] | None) -> list[float]:
+        """
+        Runs the design stages invalidated by the changed FilterConf fields.
+
+        Args:
+            changed (set[str] | None): The changed fields, or None to run every stage.
+
+        Returns:
+            list[float]: The calculated FIR filter coefficients.
+        """
+        recomputed: set[DesignStage] = set()
+
+        def run(stage: DesignStage, calculate: Callable[[], object]):
+            if (
+                changed is None
+                or _STAGE_FIELDS[stage] & changed
+                or any(
+                    stage_input in recomputed for stage_input in _STAGE_INPUTS[stage]
+                )
+            ):
+                with self._stage(stage):
+                    calculate()
+                recomputed.add(stage)
+
         # Delta
-        self.calculate_delta()
+        run("delta", self.calculate_delta)
         # Ripples A's and Ap
-        self.calculate_ripples()
+        run("ripples", self.calculate_ripples)
         # D parameter
-        self.calculate_d_parameter()
+        run("d_parameter", self.calculate_d_parameter)
         # Filter order
-        n, N = self.filter.calculate_filter_order(self.D)  # type: ignore
-        # Impulse response coefficients
-        self.filter.calculate_impulse_response_coefficients()
-        # Window coefficients
-        if self.filter_conf["window_type"] == "kaiser":
-            self.window.calculate_window_coefficients(n, N, self.AS)  # type: ignore
+        run("order", self._calculate_order)
+        if self.window is None:
+            # Equiripple coefficients
+            run("equiripple", self._calculate_equiripple)
         else:
-            self.window.calculate_window_coefficients(n, N)
-        # FIR filter coefficients
-        self._calculate_filter_coefficients()
+            if self.minimize_order:
+                run("minimum_order", self._calculate_minimum_order)
+            # Impulse response coefficients
+            run("impulse_response", self.filter.calculate_impulse_response_coefficients)
+            # Window coefficients
+            run(
+                "window",
+                lambda: self._calculate_window_coefficients(
+                    self.filter.n, 2 * self.filter.n + 1
+                ),
+            )
+            # FIR filter coefficients
+            run("coefficients", self._calculate_filter_coefficients)
+
+        if changed is not None and not recomputed and "minimum_phase" not in changed:
+            return self.coefficients.tolist()  # type: ignore
+
+        n = self.filter.n
+        self.coefficients = self._linear_coefficients
+        self.latency_samples = float(n)
+        if self.filter_conf.get("minimum_phase", False):
+            with self._stage("minimum_phase"):
+                self.coefficients = minimum_phase(self.coefficients, self.round_to)
+            self.latency_samples = passband_latency(self.coefficients, self.filter_conf)
+        self.taps_saved = self.kaiser_taps - (2 * n + 1)
+        self.zero_taps = np.empty(0, dtype=np.int64)
+        if self.filter_conf.get("half_band", False):
+            # Taps at an even, nonzero distance from the center
+            offsets = np.arange(self.coefficients.size) - n
+            self.zero_taps = np.flatnonzero((offsets % 2 == 0) & (offsets != 0))
+        self._convolver = None
+        self._frequency_responses = {}
+
+        return self.coefficients.tolist()
+
+    def _calculate_order(self) -> int:
+        """
+        Calculates the closed-form (Kaiser) filter order and stores its length in kaiser_taps.
+
+        Returns:
+            int: The filter order (n).
+        """
+        n, self.kaiser_taps = self.filter.calculate_filter_order(self.D)  # type: ignore
+
+        return n
+
+    def _calculate_equiripple(self) -> np.ndarray:
+        """
+        Designs the shortest equiripple filter meeting the configuration.
+
+        Returns:
+            np.ndarray: The symmetric filter coefficients.
+        """
+        equiripple = design_equiripple(self.filter_conf, self.round_to)
+        self.filter.n = equiripple.size // 2
+        self.coefficients = self._linear_coefficients = equiripple
+        # Coefficients from the center tap
+        self.fir_filter_coefficients = equiripple[self.filter.n :].tolist()
+
+        return equiripple
+
+    def _calculate_minimum_order(self) -> int:
+        """
+        Finds the lowest order, from the Kaiser estimate, whose window design meets
+        the configuration (see analysis.minimum_order).
 
-        return build_filter_coefficients(self.fir_filter_coefficients)
+        Returns:
+            int: The filter order (n).
+        """
+        # Half-band orders stay odd
+        step = 2 if self.filter_conf.get("half_band", False) else 1
+        n = minimum_order(
+            self.kaiser_taps // 2,  # type: ignore
+            self._window_design,
+            self.filter_conf,
+            step,
+        )
+        self.filter.n = n
+
+        return n
+
+    def frequency_response(self, n_points: int = 8192) -> FrequencyResponse:
+        """
+        Returns the magnitude, phase and group delay of the designed filter.
+
+        The filter is designed first if calculate_filter() has not been called yet.
+        The response is computed with a single real FFT of `n_points` points (see
+        analysis.frequency_response) and kept until the next design, so repeated
+        calls with the same size return the same read-only arrays.
+
+        Args:
+            n_points (int, optional): The FFT size. Defaults to 8192.
+
+        Returns:
+            FrequencyResponse: The response at the n_points // 2 + 1 grid frequencies.
+
+        Raises:
+            ValueError: If n_points is lower than the number of taps.
+        """
+        if self.coefficients is None:
+            self.calculate_filter()
+
+        if n_points not in self._frequency_responses:
+            response = frequency_response(
+                self.coefficients,  # type: ignore
+                self.filter_conf["sampling_freq_hz"],
+                n_points,
+            )
+            for values in response.values():
+                values.flags.writeable = False
+            self._frequency_responses[n_points] = response
+
+        return self._frequency_responses[n_points]
+
+    def apply(
+        self,
+        signal: np.ndarray | list[float],
+        mode: ConvolutionMode = "same",
+        out: np.ndarray | None = None,
+        method: Literal["auto"] | FilteringMethod = "auto",
+        axis: int = -1,
+    ) -> np.ndarray:
+        """
+        Filters a signal with the designed FIR filter.
+
+        The filter is designed first if calculate_filter() has not been called yet.
+        With method "auto", the direct-form or the FFT overlap-add engine is chosen
+        from the cost model of choose_method, which accounts for the zero taps the
+        direct-form engine skips and for its folded kernel of symmetric designs. The overlap-add engine, with the spectrum of the
+        coefficients, is kept for later calls.
+
+        Multichannel signals, such as (channels, samples) or (samples, channels) arrays,
+        are filtered along `axis` in a single call, without a loop over the channels.
+
+        Args:
+            signal (np.ndarray | list[float]): The signal to filter, or one signal per
+                index of the axes other than `axis`.
+            mode (ConvolutionMode, optional): The output mode, as in numpy.convolve. Defaults to "same".
+            out (np.ndarray, optional): A float64 buffer to write the output into, avoiding an allocation.
+            method (str, optional): "auto", "direct" or "fft". Defaults to "auto".
+            axis (int, optional): The axis of the signal holding the samples. Defaults to -1.
+
+        Returns:
+            np.ndarray: The filtered signal, which is `out` if it was given.
+
+        Raises:
+            ValueError: If the signal is empty, the mode, method or axis is invalid,
+                or `out` is not a suitable buffer.
+        """
+        if method not in ("auto", "direct", "fft"):
+            raise ValueError(
+                f"Invalid method '{method}'. Valid methods are: auto, direct, fft."
+            )
+
+        if self.coefficients is None:
+            self.calculate_filter()
+        if self._convolver is None:
+            self._convolver = OverlapAddConvolver(self.coefficients)  # type: ignore
+
+        if method == "auto":
+            signal = np.asarray(signal, dtype=np.float64)
+            samples = (
+                signal.shape[normalize_axis(axis, signal.ndim)] if signal.ndim else 1
+            )
+            method = choose_method(
+                samples,
+                self._convolver.taps,
+                mode,
+                self._convolver.fft_size_for(samples),
+                signal.size // max(samples, 1),
+                self.zero_taps.size,
+                is_symmetric(self._convolver.coefficients),
+            )
+
+        if method == "direct":
+            return convolve_direct(
+                signal, self._convolver.coefficients, mode, out, axis=axis
+            )
+        return self._convolver.convolve(signal, mode, out, axis)
 
     def calculate_delta(self) -> float:
         """
@@ -148,17 +541,84 @@ class EasyFirFilter(IEasyFirFilter, FilterConfValidator):
         )
         return self.D
 
+    def _stage(self, stage: DesignStage) -> ContextManager:
+        """
+        Returns the context measuring a design stage, or a no-op context without on_stage.
+
+        Args:
+            stage (DesignStage): The name of the stage.
+
+        Returns:
+            ContextManager: The context to run the stage in.
+        """
+        if self.on_stage is None:
+            return nullcontext()
+
+        return timed_stage(stage, self.on_stage, self._taps, self.trace_memory)
+
+    def _taps(self) -> int | None:
+        """
+        Returns the current filter length (N), or None before the order is calculated.
+        """
+        if self.filter is None or self.filter.n is None:
+            return None
+
+        return 2 * self.filter.n + 1
+
+    def _calculate_window_coefficients(self, n: int, N: int) -> np.ndarray:
+        """
+        Calculates the window coefficients of the given order, passing AS to the Kaiser window.
+
+        Args:
+            n (int): The filter order.
+            N (int): The filter length.
+
+        Returns:
+            np.ndarray: The n + 1 window coefficients.
+        """
+        if self.filter_conf["window_type"] == "kaiser":
+            return self.window.calculate_window_coefficients(n, N, self.AS)  # type: ignore
+
+        return self.window.calculate_window_coefficients(n, N)  # type: ignore
+
+    def _window_design(self, n: int) -> np.ndarray:
+        """
+        Designs the complete window filter of a given order, without storing it.
+
+        This evaluates a candidate order of the minimize_order search. The impulse
+        response and window coefficients of the filter and window objects are
+        overwritten and recomputed for the chosen order afterwards.
+
+        Args:
+            n (int): The filter order.
+
+        Returns:
+            np.ndarray: The 2n + 1 symmetric coefficients.
+        """
+        self.filter.n = n
+
+        return build_symmetric_coefficients(
+            self._calculate_window_coefficients(n, 2 * n + 1),
+            self.filter.calculate_impulse_response_coefficients(),
+            self.round_to,
+        )
+
     def _calculate_filter_coefficients(self) -> list[float]:
         """
         Calculates the final FIR filter coefficients by multiplying the impulse response and window coefficients.
 
+        The truncated products are mirrored into the complete 2n + 1 coefficients in
+        one array pass (see build_symmetric_coefficients), stored in `coefficients`.
+        They are logged at the DEBUG level of the "easy_fir_filter.easy_fir_filter"
+        logger.
+
         Returns:
-            list[float]: The calculated FIR filter coefficients.
+            list[float]: The n + 1 FIR filter coefficients, from the center tap.
 
         Raises:
             ValueError: If window or impulse response coefficients have not been calculated yet.
         """
-        if self.window.window_coefficients is None:
+        if self.window is None or self.window.window_coefficients is None:
             raise ValueError(
                 "Window coefficients must be calculated first. Call calculate_window_coefficients()."
             )
@@ -168,13 +628,14 @@ class EasyFirFilter(IEasyFirFilter, FilterConfValidator):
                 "Impulse response coefficients must be calculated first. Call calculate_impulse_response_coefficients()."
             )
 
-        for i in range(self.filter.n + 1):
-            self.fir_filter_coefficients.append(
-                truncate(
-                    self.window.window_coefficients[i]
-                    * self.filter.impulse_response_coefficients[i],
-                    self.round_to,
-                )
-            )
-        print(self.fir_filter_coefficients)
+        n = self.filter.n
+        self.coefficients = self._linear_coefficients = build_symmetric_coefficients(
+            self.window.window_coefficients[: n + 1],
+            self.filter.impulse_response_coefficients[: n + 1],
+            self.round_to,
+        )
+        self.fir_filter_coefficients = self.coefficients[n:].tolist()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("FIR filter coefficients: %s", self.fir_filter_coefficients)
+
         return self.fir_filter_coefficients
@@ -0,0 +1,15 @@
+from easy_fir_filter.equiripple.remez_design import (
+    design_equiripple,
+    equiripple_coefficients,
+    estimate_equiripple_taps,
+    remez_bands,
+    ripple_tolerances,
+)
+
+__all__ = [
+    "design_equiripple",
+    "equiripple_coefficients",
+    "estimate_equiripple_taps",
+    "remez_bands",
+    "ripple_tolerances",
+]
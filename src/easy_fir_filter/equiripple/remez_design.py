@@ -0,0 +1,222 @@
+"""
+This module contains the equiripple (Parks-McClellan) design of FIR filters with the
+fewest taps meeting a filter configuration.
+"""
+
+import math
+from typing import Iterator
+
+import numpy as np
+from scipy.signal import remez
+
+from easy_fir_filter.analysis import filter_bands, measure_spec, meets_spec
+from easy_fir_filter.types import FilterConf
+from easy_fir_filter.utils import truncate_array
+
+# Odd lengths tried one at a time upwards from the estimate
+_STEPS = 32
+# Lengths in a row without convergence that end the upward search
+_MAX_DIVERGED = 3
+# Steps of the downward search below the estimate
+_COARSE_STEPS = 16
+
+
+def ripple_tolerances(filter_conf: FilterConf) -> tuple[float, float]:
+    """
+    Returns the passband and stopband tolerances of a configuration.
+
+    Unlike the windowed design, which uses min(delta_p, delta_s) for both bands, the
+    equiripple design keeps them apart:
+        delta_p = (10^(0.05 * Ap) - 1) / (10^(0.05 * Ap) + 1)
+        delta_s = 10^(-0.05 * As)
+
+    Args:
+        filter_conf (FilterConf): The filter configuration.
+
+    Returns:
+        tuple[float, float]: delta_p and delta_s.
+    """
+    ripple = 10 ** (0.05 * filter_conf["passband_ripple_db"])
+    delta_p = (ripple - 1) / (ripple + 1)
+    delta_s = 10 ** (-0.05 * filter_conf["stopband_attenuation_db"])
+
+    return delta_p, delta_s
+
+
+def remez_bands(
+    filter_conf: FilterConf,
+) -> tuple[list[float], list[float], list[float]]:
+    """
+    Returns the band edges, desired gains and weights of the Remez exchange algorithm.
+
+    Each band is weighted by the inverse of its tolerance, so the weighted error is
+    the same in every band when both tolerances are met at once.
+
+    Args:
+        filter_conf (FilterConf): The filter configuration.
+
+    Returns:
+        tuple[list[float], list[float], list[float]]: The band edges in Hz, the gain
+            of each band and the weight of each band, as expected by scipy.signal.remez.
+    """
+    delta_p, delta_s = ripple_tolerances(filter_conf)
+    passbands, stopbands = filter_bands(filter_conf)
+    bands = sorted(
+        [(band, 1.0, 1 / delta_p) for band in passbands]
+        + [(band, 0.0, 1 / delta_s) for band in stopbands]
+    )
+
+    return (
+        [edge for band, _, _ in bands for edge in band],
+        [gain for _, gain, _ in bands],
+        [weight for _, _, weight in bands],
+    )
+
+
+def estimate_equiripple_taps(filter_conf: FilterConf) -> int:
+    """
+    Estimates the length of an equiripple filter with Kaiser's formula:
+        N = (-20 * log10(sqrt(delta_p * delta_s)) - 13) / (14.6 * df / F) + 1
+    Where:
+        df = the narrowest transition band
+
+    Args:
+        filter_conf (FilterConf): The filter configuration.
+
+    Returns:
+        int: The estimated odd filter length.
+    """
+    delta_p, delta_s = ripple_tolerances(filter_conf)
+    passbands, stopbands = filter_bands(filter_conf)
+    edges = sorted(edge for band in passbands + stopbands for edge in band)
+    transition = min(high - low for low, high in zip(edges[1::2], edges[2::2]))
+
+    taps = (-20 * math.log10(math.sqrt(delta_p * delta_s)) - 13) / (
+        14.6 * transition / filter_conf["sampling_freq_hz"]
+    ) + 1
+
+    return _odd(max(int(taps), 3))
+
+
+def equiripple_coefficients(
+    filter_conf: FilterConf, taps: int, round_to: int = 4
+) -> np.ndarray | None:
+    """
+    Designs the equiripple filter of a given odd length.
+
+    Args:
+        filter_conf (FilterConf): The filter configuration.
+        taps (int): The odd filter length (N).
+        round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+
+    Returns:
+        np.ndarray | None: The N symmetric coefficients, truncated to `round_to`
+            decimals, or None if the Remez exchange does not converge.
+    """
+    bands, desired, weight = remez_bands(filter_conf)
+    try:
+        h = remez(
+            taps, bands, desired, weight=weight, fs=filter_conf["sampling_freq_hz"]
+        )
+    except ValueError:
+        return None
+
+    # Average with the mirrored filter so the truncated halves match exactly
+    return truncate_array((h + h[::-1]) / 2, round_to)
+
+
+def design_equiripple(
+    filter_conf: FilterConf, round_to: int = 4, max_taps: int | None = None
+) -> np.ndarray:
+    """
+    Designs the shortest odd-length equiripple filter meeting a configuration.
+
+    Whether a length meets Ap and As is not monotonic: the Remez exchange diverges
+    for filters much longer than needed, and truncation can break a design that a
+    shorter one meets. So the lengths are searched in three steps:
+        1. Upwards from Kaiser's estimate, one odd length at a time for the first
+           _STEPS lengths, then growing by a quarter up to `max_taps`. The search
+           stops early once _MAX_DIVERGED lengths in a row do not converge.
+        2. If no length meets the specification, downwards from the estimate in
+           _COARSE_STEPS equal steps, for specifications that shorter designs meet.
+        3. From the first length meeting it, the length is shortened one odd length
+           at a time while the shorter design still meets it.
+    Every candidate is truncated to `round_to` decimals before its response is
+    measured (see measure_spec), so the returned coefficients meet the
+    specification as they are.
+
+    Args:
+        filter_conf (FilterConf): The filter configuration.
+        round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+        max_taps (int, optional): The longest filter to try. Defaults to four times
+            the estimate.
+
+    Returns:
+        np.ndarray: The symmetric coefficients of the shortest design found.
+
+    Raises:
+        ValueError: If no design up to `max_taps` meets the specification, for
+            example when `round_to` is too coarse for the stopband attenuation.
+    """
+    estimate = estimate_equiripple_taps(filter_conf)
+    if max_taps is None:
+        max_taps = 4 * estimate
+    start = min(estimate, max_taps if max_taps % 2 else max_taps - 1)
+
+    diverged = 0
+
+    def design(taps: int) -> np.ndarray | None:
+        nonlocal diverged
+        h = equiripple_coefficients(filter_conf, taps, round_to)
+        diverged = diverged + 1 if h is None else 0
+        if h is None or not meets_spec(measure_spec(h, filter_conf), filter_conf):
+            return None
+
+        return h
+
+    def upwards() -> Iterator[int]:
+        taps = start
+        for _ in range(_STEPS):
+            if taps > max_taps:
+                return
+            yield taps
+            taps += 2
+        while taps <= max_taps:
+            yield taps
+            taps = _odd(int(taps * 1.25))
+
+    def downwards() -> Iterator[int]:
+        step = 2 * max(1, start // (2 * _COARSE_STEPS))
+        yield from range(start - step, 2, -step)
+
+    best = None
+    for taps in upwards():
+        best = design(taps)
+        if best is not None or diverged >= _MAX_DIVERGED:
+            break
+    if best is None:
+        for taps in downwards():
+            best = design(taps)
+            if best is not None:
+                break
+    if best is None:
+        raise ValueError(
+            f"No equiripple design of up to {max_taps} taps meets the specification "
+            f"with round_to={round_to}."
+        )
+
+    # Shorten while the next shorter length still meets it
+    while taps > 3:
+        shorter = design(taps - 2)
+        if shorter is None:
+            break
+        taps, best = taps - 2, shorter
+
+    return best
+
+
+def _odd(value: int) -> int:
+    """
+    Returns `value` if it is odd, or the next odd number.
+    """
+    return value if value % 2 else value + 1
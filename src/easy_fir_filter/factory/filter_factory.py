@@ -4,7 +4,7 @@ This file contains the implementation of the FilterFactory class.
 
 from easy_fir_filter.interfaces.filter_interface import IFilter
 from easy_fir_filter.interfaces.window_interface import IWindow
-from easy_fir_filter.types.fir_filter_conf import FilterConf, FilterWindow
+from easy_fir_filter.types.fir_filter_conf import FilterConf, FilterType, FilterWindow
 
 
 class FilterFactory:
@@ -44,29 +44,62 @@ class FilterFactory:
         Raises:
             ValueError: If an invalid filter type is provided.
         """
-        filter_type = filter_conf.get("filter_type")
+        filter_cls = FilterFactory.get_filter_class(filter_conf.get("filter_type"))  # type: ignore
 
+        return filter_cls(filter_conf, round_to)
+
+    @staticmethod
+    def create_window(window: FilterWindow, round_to: int = 4) -> IWindow:
+        """
+        Creates and returns the appropriate window instance based on the window type.
+
+        Args:
+            window (FilterWindow): Configuration containing the window type.
+            round_to (int, optional): Number of decimal places for rounding the window coefficients. Defaults to 4.
+
+        Returns:
+            IWindow: The created window instance.
+
+        Raises:
+            ValueError: If an invalid window type is provided.
+        """
+        window_cls = FilterFactory.get_window_class(window)
+
+        return window_cls(round_to)
+
+    @staticmethod
+    def get_filter_class(filter_type: FilterType) -> type[IFilter]:
+        """
+        Returns the filter class for the given filter type, without instantiating it.
+
+        Args:
+            filter_type (FilterType): The type of filter.
+
+        Returns:
+            type[IFilter]: The filter class.
+
+        Raises:
+            ValueError: If an invalid filter type is provided.
+        """
         if filter_type not in FilterFactory._FILTERS:
             raise ValueError(f"Invalid filter type '{filter_type}' provided.")
 
         filter_class = FilterFactory._FILTERS[filter_type]
         module_path, class_name = filter_class.rsplit(".", 1)
         module = __import__(module_path, fromlist=[class_name])
-        filter_cls = getattr(module, class_name)
 
-        return filter_cls(filter_conf, round_to)
+        return getattr(module, class_name)
 
     @staticmethod
-    def create_window(window: FilterWindow, round_to: int = 4) -> IWindow:
+    def get_window_class(window: FilterWindow) -> type[IWindow]:
         """
-        Creates and returns the appropriate window instance based on the window type.
+        Returns the window class for the given window type, without instantiating it.
 
         Args:
-            window (FilterWindow): Configuration containing the window type.
-            round_to (int, optional): Number of decimal places for rounding the window coefficients. Defaults to 4.
+            window (FilterWindow): The window type.
 
         Returns:
-            IWindow: The created window instance.
+            type[IWindow]: The window class.
 
         Raises:
             ValueError: If an invalid window type is provided.
@@ -77,6 +110,5 @@ class FilterFactory:
         window_class = FilterFactory._WINDOWS[window]
         module_path, class_name = window_class.rsplit(".", 1)
         module = __import__(module_path, fromlist=[class_name])
-        window_cls = getattr(module, class_name)
 
-        return window_cls(round_to)
+        return getattr(module, class_name)
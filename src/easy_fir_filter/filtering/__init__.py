@@ -0,0 +1,19 @@
+from easy_fir_filter.filtering.direct_form import convolve_direct
+from easy_fir_filter.filtering.method import choose_method
+from easy_fir_filter.filtering.output_window import output_window
+from easy_fir_filter.filtering.overlap_add import (
+    OverlapAddConvolver,
+    choose_fft_size,
+    convolve_fft,
+)
+from easy_fir_filter.filtering.streaming import StreamingFirFilter
+
+__all__ = [
+    "OverlapAddConvolver",
+    "StreamingFirFilter",
+    "choose_fft_size",
+    "choose_method",
+    "convolve_direct",
+    "convolve_fft",
+    "output_window",
+]
@@ -0,0 +1,124 @@
+"""
+This module contains the DelayLine class, the input buffer shared by the streaming
+filters.
+"""
+
+import numpy as np
+
+
+class DelayLine:
+    """
+    Buffer holding the last samples of a stream followed by the next chunk.
+
+    The history lives at the start of one of two preallocated work buffers, with room
+    for a chunk after it, so kernels read the history and the chunk as one contiguous
+    array. After a chunk, the last `history` samples are copied to the start of the
+    other buffer and the buffers swap roles, so the copy never overlaps. The buffers
+    only grow when a chunk is longer than every previous one.
+
+    Attributes:
+        history (int): The number of past samples kept between chunks.
+        channels_shape (tuple[int, ...]): () for a single signal, or (channels,).
+    """
+
+    def __init__(
+        self, history: int, channels_shape: tuple[int, ...] = (), capacity: int = 0
+    ):
+        """
+        Initializes the delay line with a zero history.
+
+        Args:
+            history (int): The number of past samples kept between chunks.
+            channels_shape (tuple[int, ...], optional): The shape of the channel axes.
+                Defaults to (), for a single signal.
+            capacity (int, optional): The chunk length to preallocate for. Defaults to 0.
+        """
+        self.history = history
+        self.channels_shape = channels_shape
+        self.capacity = capacity
+
+        self._buffer = np.zeros(channels_shape + (history + capacity,))
+        self._spare = np.zeros(self._buffer.shape)
+
+    def load(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Copies a chunk after the history.
+
+        Args:
+            chunk (np.ndarray): The samples, along the last axis.
+
+        Returns:
+            np.ndarray: A view of the history followed by the chunk.
+        """
+        size = chunk.shape[-1]
+        self.reserve(size)
+
+        self._buffer[..., self.history : self.history + size] = chunk
+
+        return self._buffer[..., : self.history + size]
+
+    def advance(self, size: int):
+        """
+        Makes the last `history` samples of the loaded chunk the new history.
+
+        Args:
+            size (int): The length of the chunk passed to load().
+        """
+        self._spare[..., : self.history] = self._buffer[..., size : size + self.history]
+        self._buffer, self._spare = self._spare, self._buffer
+
+    def reserve(self, size: int):
+        """
+        Grows the buffers, keeping the history, so they hold a chunk of `size` samples.
+
+        Args:
+            size (int): The chunk length.
+        """
+        if size <= self.capacity:
+            return
+
+        self.capacity = max(size, 2 * self.capacity)
+        buffer = np.zeros(self.channels_shape + (self.history + self.capacity,))
+        buffer[..., : self.history] = self._buffer[..., : self.history]
+
+        self._buffer = buffer
+        self._spare = np.zeros(buffer.shape)
+
+    def reset(self):
+        """
+        Clears the history.
+        """
+        self._buffer[..., : self.history] = 0.0
+
+    def snapshot(self) -> np.ndarray:
+        """
+        Returns a copy of the history.
+
+        Returns:
+            np.ndarray: The last `history` samples, oldest first.
+        """
+        return self._buffer[..., : self.history].copy()
+
+    def restore(self, state: np.ndarray | list[float]):
+        """
+        Restores a history returned by snapshot().
+
+        Args:
+            state (np.ndarray | list[float]): The last `history` samples, oldest first.
+
+        Raises:
+            ValueError: If the state does not have the shape returned by snapshot().
+        """
+        state = np.asarray(state, dtype=np.float64)
+        shape = self.channels_shape + (self.history,)
+        if state.shape != shape:
+            raise ValueError(f"The state must have shape {shape}, got {state.shape}.")
+
+        self._buffer[..., : self.history] = state
+
+    @property
+    def buffers(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The two work buffers, which outputs must not overlap.
+        """
+        return self._buffer, self._spare
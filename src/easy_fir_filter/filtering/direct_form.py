@@ -0,0 +1,186 @@
+"""
+This module contains the direct-form FIR filtering engine.
+"""
+
+import numpy as np
+
+from easy_fir_filter.filtering.output_window import (
+    as_signal,
+    as_signals,
+    output_window,
+    prepare_output,
+)
+from easy_fir_filter.types import ConvolutionMode
+
+
+def convolve_direct(
+    signal: np.ndarray | list[float],
+    coefficients: np.ndarray | list[float],
+    mode: ConvolutionMode = "same",
+    out: np.ndarray | None = None,
+    symmetric: bool | None = None,
+    axis: int = -1,
+) -> np.ndarray:
+    """
+    Filters a signal with FIR coefficients using the direct-form convolution.
+
+    The output is computed as:
+        y(m) = sum(h(k) * x(m - k)) for k = 0 to N - 1
+    Where:
+        h = coefficients
+        x = signal
+
+    The sum runs over the shortest input, and each term is accumulated over the
+    whole output at once, so the Python loop does min(L, N) iterations. Zero taps,
+    such as every other coefficient of a half-band filter, are skipped.
+
+    Multichannel signals, such as (channels, samples) or (samples, channels) arrays,
+    are filtered along `axis`. Every term is accumulated over all the channels at
+    once, reading the input in place whatever its memory layout.
+
+    Symmetric (linear-phase) coefficients, such as every EasyFirFilter design, use
+    the folded kernel, which halves the multiplications. Pass `symmetric=False` to
+    force the generic kernel.
+
+    Args:
+        signal (np.ndarray | list[float]): The signal to filter (x), or one signal per
+            index of the axes other than `axis`.
+        coefficients (np.ndarray | list[float]): The FIR filter coefficients (h).
+        mode (ConvolutionMode, optional): The output mode, as in numpy.convolve. Defaults to "same".
+        out (np.ndarray, optional): A float64 buffer to write the output into.
+        symmetric (bool, optional): Whether to use the folded kernel. Defaults to
+            checking whether the coefficients are symmetric.
+        axis (int, optional): The axis of the signal holding the samples. Defaults to -1.
+
+    Returns:
+        np.ndarray: The filtered signal, which is `out` if it was given.
+
+    Raises:
+        ValueError: If the signal is empty, the coefficients are not a non-empty 1-D
+            array, the mode or axis is invalid, `out` is not a suitable buffer, or
+            symmetric is True with coefficients that are not symmetric.
+    """
+    x = as_signals(signal, axis)
+    h = as_signal(coefficients, "coefficients")
+    samples = x.shape[-1]
+    start, length = output_window(samples, h.size, mode)
+    out = prepare_output(out, x.shape[:-1] + (length,), x, h, axis=axis)
+    y = np.moveaxis(out, axis, -1)
+
+    if symmetric is None:
+        symmetric = is_symmetric(h)
+    elif symmetric and not is_symmetric(h):
+        raise ValueError("The coefficients are not symmetric.")
+
+    if symmetric and h.size <= samples:
+        # Zero padding makes every x(m - k) of the output window readable
+        # The temporaries follow the layout of the input and output, so every
+        # ufunc walks the channels in memory order
+        padded_shape = list(out.shape)
+        padded_shape[axis] = samples + 2 * (h.size - 1)
+        padded = np.moveaxis(np.zeros(padded_shape), axis, -1)
+        padded[..., h.size - 1 : h.size - 1 + samples] = x
+        folded_direct_form_kernel(padded, h, start + h.size - 1, y, np.empty_like(y))
+        return out
+
+    # The convolution is commutative: loop over the shortest input
+    if h.size > samples and x.ndim == 1:
+        x, h = h, x
+
+    direct_form_kernel(x, h, start, y, np.empty_like(y))
+
+    return out
+
+
+def direct_form_kernel(
+    x: np.ndarray, h: np.ndarray, start: int, out: np.ndarray, product: np.ndarray
+):
+    """
+    Computes samples [start, start + L) of the full convolution of x and h into `out`,
+    along the last axis.
+
+    The loop runs over the nonzero taps of h and allocates nothing: `product` is a
+    scratch buffer with the shape of `out`.
+
+    Args:
+        x (np.ndarray): The float64 signals, with the samples along the last axis.
+        h (np.ndarray): The 1-D float64 coefficients.
+        start (int): The index, in the full convolution, of the first output sample.
+        out (np.ndarray): The float64 buffer receiving the L output samples of each signal.
+        product (np.ndarray): A float64 scratch buffer with the shape of `out`.
+    """
+    length = out.shape[-1]
+    samples = x.shape[-1]
+    out.fill(0.0)
+
+    for k, tap in enumerate(h):
+        # Output samples m (in full convolution indexes) that x(m - k) reaches
+        first = max(start, k)
+        last = min(start + length, k + samples)
+        if first >= last or tap == 0.0:
+            continue
+
+        window = (..., slice(first - start, last - start))
+        np.multiply(x[..., first - k : last - k], tap, out=product[window])
+        np.add(out[window], product[window], out=out[window])
+
+
+def folded_direct_form_kernel(
+    x: np.ndarray, h: np.ndarray, offset: int, out: np.ndarray, scratch: np.ndarray
+):
+    """
+    Convolves x with symmetric coefficients h, pre-adding the samples that share a tap.
+
+    With h(k) = h(N - 1 - k), the output is computed as:
+        y(i) = sum(h(k) * (x(j - k) + x(j - N + 1 + k))) for k = 0 to N // 2 - 1
+               + h(N // 2) * x(j - N // 2) (only when N is odd)
+    Where:
+        j = offset + i
+    so each pair of taps costs one multiplication instead of two, and pairs of zero
+    taps are skipped.
+
+    Every sample read must exist, so offset >= N - 1 and offset + L <= len(x), with
+    L output samples per signal. Signals are along the last axis of x and `out`.
+
+    Args:
+        x (np.ndarray): The float64 signals, with the samples along the last axis.
+        h (np.ndarray): The 1-D float64 symmetric coefficients.
+        offset (int): The index of x aligned with h(0) for the first output sample.
+        out (np.ndarray): The float64 buffer receiving the output.
+        scratch (np.ndarray): A float64 scratch buffer with the shape of `out`.
+    """
+    length = out.shape[-1]
+    taps = h.size
+    out.fill(0.0)
+
+    for k in range(taps // 2):
+        if h[k] == 0.0:
+            continue
+
+        first = offset - k
+        mirror = offset - (taps - 1 - k)
+        np.add(
+            x[..., first : first + length],
+            x[..., mirror : mirror + length],
+            out=scratch,
+        )
+        np.multiply(scratch, h[k], out=scratch)
+        np.add(out, scratch, out=out)
+
+    if taps % 2 and h[taps // 2] != 0.0:
+        center = offset - taps // 2
+        np.multiply(x[..., center : center + length], h[taps // 2], out=scratch)
+        np.add(out, scratch, out=out)
+
+
+def is_symmetric(coefficients: np.ndarray) -> bool:
+    """
+    Checks whether the coefficients are symmetric (h(k) == h(N - 1 - k) for every k).
+
+    Args:
+        coefficients (np.ndarray): The 1-D coefficients.
+
+    Returns:
+        bool: True if the coefficients are symmetric.
+    """
+    return bool(np.array_equal(coefficients, coefficients[::-1]))
@@ -0,0 +1,122 @@
+"""
+This module contains the crossover heuristic choosing between the direct-form and
+the FFT overlap-add filtering engines.
+
+Both engines are modelled as a linear combination of cost terms, with coefficients
+fitted to timings of the two engines by benchmarks/filtering_crossover_benchmark.py.
+"""
+
+import numpy as np
+
+from easy_fir_filter.filtering.output_window import output_window
+from easy_fir_filter.filtering.overlap_add import (
+    batch_blocks,
+    choose_fft_size,
+    signal_fft_size,
+)
+from easy_fir_filter.types import ConvolutionMode, FilteringMethod
+
+# Seconds per call, per ufunc call and per sample a ufunc reads
+DIRECT_COST = (3.2e-5, 2.1e-6, 4.9e-10)
+# Seconds per call, per batch of blocks, per signal sample and per FFT butterfly (M * log2 M)
+FFT_COST = (0.0, 7e-5, 1.4e-8, 1.2e-9)
+
+
+def direct_cost_terms(
+    signal_length: int,
+    taps: int,
+    mode: ConvolutionMode = "same",
+    channels: int = 1,
+    zero_taps: int = 0,
+    symmetric: bool = False,
+) -> np.ndarray:
+    """
+    Returns the cost terms of the direct-form engine: one call, the ufunc calls and
+    the samples they read over every channel.
+
+    The generic kernel does two ufunc calls (multiply, add) per tap iteration, with
+    min(L, N) iterations for a single signal and N for several channels, without the
+    zero taps, which are skipped. The folded kernel, used for symmetric coefficients
+    no longer than the signal, does three (add, multiply, add) per pair of nonzero
+    taps, after copying the signals into a zero-padded buffer.
+    """
+    _, length = output_window(signal_length, taps, mode)
+    active = taps - zero_taps
+    if symmetric and taps <= signal_length:
+        # Pairs of taps, and the center tap of odd lengths
+        iterations = (active + 1) // 2
+        padding = 2 * (signal_length + 2 * (taps - 1)) * channels
+        calls = 3 * iterations
+        samples = calls * length * channels + padding
+    else:
+        iterations = min(signal_length, active) if channels == 1 else active
+        calls = 2 * iterations
+        samples = calls * length * channels
+
+    return np.array([1.0, calls, samples])
+
+
+def fft_cost_terms(
+    signal_length: int, taps: int, fft_size: int, channels: int = 1
+) -> np.ndarray:
+    """
+    Returns the cost terms of the overlap-add engine when it uses FFTs of `fft_size`
+    points: one call, the batches of blocks, the signal samples and the FFT butterflies.
+    """
+    block = fft_size - taps + 1
+    blocks = -(-signal_length // block)
+    batches = -(-blocks // batch_blocks(fft_size, channels))
+
+    return np.array(
+        [
+            1.0,
+            batches,
+            signal_length * channels,
+            blocks * channels * fft_size * np.log2(max(fft_size, 2)),
+        ]
+    )
+
+
+def choose_method(
+    signal_length: int,
+    taps: int,
+    mode: ConvolutionMode = "same",
+    fft_size: int | None = None,
+    channels: int = 1,
+    zero_taps: int = 0,
+    symmetric: bool = False,
+) -> FilteringMethod:
+    """
+    Chooses the cheapest filtering engine for a signal and filter length.
+
+    Args:
+        signal_length (int): The length of the signal (L).
+        taps (int): The number of filter coefficients (N).
+        mode (ConvolutionMode, optional): The output mode. Defaults to "same".
+        fft_size (int, optional): The FFT size the overlap-add engine would use.
+            Defaults to the size chosen by choose_fft_size for the signal.
+        channels (int, optional): The number of signals filtered together. Defaults to 1.
+        zero_taps (int, optional): The number of coefficients that are zero, such as
+            every other one of a half-band filter. Defaults to 0.
+        symmetric (bool, optional): Whether the coefficients are symmetric, which lets
+            the direct form use the folded kernel. Defaults to False.
+
+    Returns:
+        FilteringMethod: "direct" or "fft".
+    """
+    if fft_size is None:
+        fft_size = signal_fft_size(choose_fft_size(taps), signal_length, taps)
+
+    direct = float(
+        np.dot(
+            DIRECT_COST,
+            direct_cost_terms(
+                signal_length, taps, mode, channels, zero_taps, symmetric
+            ),
+        )
+    )
+    fft = float(
+        np.dot(FFT_COST, fft_cost_terms(signal_length, taps, fft_size, channels))
+    )
+
+    return "direct" if direct <= fft else "fft"
@@ -0,0 +1,159 @@
+"""
+This module contains the helpers shared by the filtering engines to size and
+check their output.
+"""
+
+import numpy as np
+
+from easy_fir_filter.types import ConvolutionMode
+
+
+def output_window(
+    signal_length: int, taps: int, mode: ConvolutionMode
+) -> tuple[int, int]:
+    """
+    Computes which part of the full convolution an output mode keeps.
+
+    The full convolution of a signal of length L with N coefficients has
+    L + N - 1 samples. The modes follow numpy.convolve:
+        - full: start = 0, length = L + N - 1
+        - same: start = (min(L, N) - 1) // 2, length = max(L, N)
+        - valid: start = min(L, N) - 1, length = max(L, N) - min(L, N) + 1
+
+    Args:
+        signal_length (int): The length of the signal (L).
+        taps (int): The number of coefficients (N).
+        mode (ConvolutionMode): The output mode.
+
+    Returns:
+        tuple[int, int]: The index of the first kept sample of the full convolution
+            and the number of kept samples.
+
+    Raises:
+        ValueError: If the mode is not full, same or valid.
+    """
+    shortest, longest = sorted((signal_length, taps))
+
+    if mode == "full":
+        return 0, signal_length + taps - 1
+    if mode == "same":
+        return (shortest - 1) // 2, longest
+    if mode == "valid":
+        return shortest - 1, longest - shortest + 1
+
+    raise ValueError(f"Invalid mode '{mode}'. Valid modes are: full, same, valid.")
+
+
+def as_signal(values: np.ndarray | list[float], name: str = "signal") -> np.ndarray:
+    """
+    Converts the input of a filtering engine to a non-empty 1-D float64 array.
+
+    Args:
+        values (np.ndarray | list[float]): The samples to convert.
+        name (str, optional): The name of the input, used in error messages. Defaults to "signal".
+
+    Returns:
+        np.ndarray: The samples as a 1-D float64 array, without copying when possible.
+
+    Raises:
+        ValueError: If the input is not one-dimensional or is empty.
+    """
+    array = np.asarray(values, dtype=np.float64)
+
+    if array.ndim != 1:
+        raise ValueError(
+            f"The {name} must be a 1-D array, got {array.ndim} dimensions."
+        )
+    if array.size == 0:
+        raise ValueError(f"The {name} cannot be empty.")
+
+    return array
+
+
+def as_signals(values: np.ndarray | list, axis: int = -1) -> np.ndarray:
+    """
+    Converts the signals given to a filtering engine to a float64 array whose last
+    axis is the filtered one.
+
+    A 1-D input is a single signal. A 2-D input, such as (channels, samples) or
+    (samples, channels), holds one signal per index of the other axes.
+
+    Args:
+        values (np.ndarray | list): The samples to convert.
+        axis (int, optional): The axis holding the samples of each signal. Defaults to -1.
+
+    Returns:
+        np.ndarray: A view (a copy only if the values are not float64) with the
+            samples along the last axis.
+
+    Raises:
+        ValueError: If the input is a scalar, is empty, or `axis` is out of range.
+    """
+    array = np.asarray(values, dtype=np.float64)
+
+    if array.ndim == 0:
+        raise ValueError("The signal must have at least one dimension.")
+    if array.size == 0:
+        raise ValueError("The signal cannot be empty.")
+
+    return np.moveaxis(array, normalize_axis(axis, array.ndim), -1)
+
+
+def prepare_output(
+    out: np.ndarray | None,
+    shape: int | tuple[int, ...],
+    *inputs: np.ndarray,
+    axis: int = -1,
+) -> np.ndarray:
+    """
+    Returns the buffer a filtering engine writes into.
+
+    Args:
+        out (np.ndarray | None): The buffer supplied by the caller, if any.
+        shape (int | tuple[int, ...]): The output shape, with the filtered axis last.
+        *inputs (np.ndarray): The engine inputs, which the buffer must not overlap.
+        axis (int, optional): The position of the filtered axis in `out`. Defaults to -1.
+
+    Returns:
+        np.ndarray: `out`, or a new float64 array if it is None, with the filtered
+            axis at `axis`.
+
+    Raises:
+        ValueError: If `out` does not have the output shape, is not a float64 array,
+            or shares memory with an input.
+    """
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    position = normalize_axis(axis, len(shape))
+    shape = shape[:position] + shape[-1:] + shape[position:-1]
+
+    if out is None:
+        return np.empty(shape)
+
+    if not isinstance(out, np.ndarray) or out.dtype != np.float64:
+        raise ValueError("The output buffer must be a float64 NumPy array.")
+    if out.shape != shape:
+        raise ValueError(f"The output buffer must have shape {shape}, got {out.shape}.")
+    if any(np.shares_memory(out, array) for array in inputs):
+        raise ValueError("The output buffer cannot overlap the inputs.")
+
+    return out
+
+
+def normalize_axis(axis: int, ndim: int) -> int:
+    """
+    Returns the non-negative position of `axis` in an array of `ndim` dimensions.
+
+    Args:
+        axis (int): The axis, which may be negative.
+        ndim (int): The number of dimensions of the array.
+
+    Returns:
+        int: The axis position, between 0 and ndim - 1.
+
+    Raises:
+        ValueError: If the axis is out of range.
+    """
+    if not -ndim <= axis < ndim:
+        raise ValueError(f"Axis {axis} is out of range for {ndim} dimensions.")
+
+    return axis % ndim
@@ -0,0 +1,264 @@
+"""
+This module contains the FFT overlap-add filtering engine, used for long filters.
+"""
+
+import numpy as np
+
+from easy_fir_filter.filtering.output_window import (
+    as_signal,
+    as_signals,
+    output_window,
+    prepare_output,
+)
+from easy_fir_filter.types import ConvolutionMode
+
+# Smallest and largest FFT sizes considered when choosing the FFT size
+_MIN_FFT_SIZE = 16
+_MAX_FFT_SIZE = 1 << 20
+# Number of samples transformed at once, which bounds the temporary memory
+_BATCH_SAMPLES = 1 << 18
+
+
+def choose_fft_size(taps: int, block_size: int | None = None) -> int:
+    """
+    Chooses the FFT size of the overlap-add engine.
+
+    Each FFT of size M filters a block of M - N + 1 samples. Without a block size,
+    the power of two minimizing the cost per filtered sample is chosen:
+        cost(M) = M * log2(M) / (M - N + 1)
+    With a block size B, the smallest power of two with M >= B + N - 1 is chosen.
+
+    In both cases M >= 2 * (N - 1), so the tail of a block only overlaps the next one.
+
+    Args:
+        taps (int): The number of filter coefficients (N).
+        block_size (int, optional): The number of signal samples filtered by each FFT.
+
+    Returns:
+        int: The FFT size (M).
+
+    Raises:
+        ValueError: If taps or block_size are lower than 1.
+    """
+    if taps < 1:
+        raise ValueError("The number of taps must be at least 1.")
+    if block_size is not None and block_size < 1:
+        raise ValueError("The block size must be at least 1.")
+
+    smallest = _next_power_of_two(max(2 * (taps - 1), _MIN_FFT_SIZE))
+
+    if block_size is not None:
+        return max(smallest, _next_power_of_two(block_size + taps - 1))
+
+    sizes = [smallest << i for i in range((_MAX_FFT_SIZE // smallest).bit_length())]
+    sizes = sizes or [smallest]
+
+    return min(sizes, key=lambda size: size * np.log2(size) / (size - taps + 1))
+
+
+def signal_fft_size(fft_size: int, signal_length: int, taps: int) -> int:
+    """
+    Returns the FFT size used to filter a signal of the given length.
+
+    Signals shorter than a block are filtered with a single, smaller FFT.
+
+    Args:
+        fft_size (int): The FFT size chosen for the filter.
+        signal_length (int): The length of the signal (L).
+        taps (int): The number of filter coefficients (N).
+
+    Returns:
+        int: The FFT size.
+    """
+    return min(
+        fft_size,
+        _next_power_of_two(max(signal_length + taps - 1, 2 * (taps - 1))),
+    )
+
+
+def batch_blocks(fft_size: int, channels: int = 1) -> int:
+    """
+    Returns the number of blocks of each channel transformed at once with FFTs of
+    `fft_size` points.
+    """
+    return max(_BATCH_SAMPLES // (fft_size * max(channels, 1)), 1)
+
+
+class OverlapAddConvolver:
+    """
+    FFT overlap-add convolution with a fixed set of FIR coefficients.
+
+    The signal is split into blocks of M - N + 1 samples. Each block is filtered by
+    multiplying its M-point spectrum with the spectrum of the coefficients, and the
+    N - 1 samples of tail of each block are added to the start of the next one.
+
+    The spectrum of the coefficients is computed once per FFT size and cached, so a
+    convolver should be kept and reused for every signal filtered with the same filter.
+    """
+
+    def __init__(
+        self, coefficients: np.ndarray | list[float], block_size: int | None = None
+    ):
+        """
+        Initializes the convolver.
+
+        Args:
+            coefficients (np.ndarray | list[float]): The FIR filter coefficients (h).
+            block_size (int, optional): The number of signal samples filtered by each FFT.
+                Defaults to the size with the lowest cost per sample for the tap count.
+
+        Raises:
+            ValueError: If the coefficients are not a non-empty 1-D array or block_size
+                is lower than 1.
+        """
+        self.coefficients = as_signal(coefficients, "coefficients").copy()
+        self.taps = self.coefficients.size
+        self.fft_size = choose_fft_size(self.taps, block_size)
+        self._spectra: dict[int, np.ndarray] = {}
+
+    def spectrum(self, fft_size: int) -> np.ndarray:
+        """
+        Returns the real FFT of the coefficients, zero padded to `fft_size` points.
+
+        Args:
+            fft_size (int): The FFT size.
+
+        Returns:
+            np.ndarray: The fft_size // 2 + 1 complex bins, cached per FFT size.
+        """
+        if fft_size not in self._spectra:
+            self._spectra[fft_size] = np.fft.rfft(self.coefficients, fft_size)
+
+        return self._spectra[fft_size]
+
+    def fft_size_for(self, signal_length: int) -> int:
+        """
+        Returns the FFT size used to filter a signal of the given length.
+
+        Args:
+            signal_length (int): The length of the signal (L).
+
+        Returns:
+            int: The FFT size.
+        """
+        return signal_fft_size(self.fft_size, signal_length, self.taps)
+
+    def convolve(
+        self,
+        signal: np.ndarray | list[float],
+        mode: ConvolutionMode = "same",
+        out: np.ndarray | None = None,
+        axis: int = -1,
+    ) -> np.ndarray:
+        """
+        Filters a signal with the coefficients of the convolver.
+
+        Multichannel signals, such as (channels, samples) or (samples, channels) arrays,
+        are filtered along `axis`, transforming the blocks of every channel together.
+
+        Args:
+            signal (np.ndarray | list[float]): The signal to filter (x), or one signal
+                per index of the axes other than `axis`.
+            mode (ConvolutionMode, optional): The output mode, as in numpy.convolve. Defaults to "same".
+            out (np.ndarray, optional): A float64 buffer to write the output into.
+            axis (int, optional): The axis of the signal holding the samples. Defaults to -1.
+
+        Returns:
+            np.ndarray: The filtered signal, which is `out` if it was given.
+
+        Raises:
+            ValueError: If the signal is empty, the mode or axis is invalid, or `out`
+                is not a suitable buffer.
+        """
+        x = as_signals(signal, axis)
+        channels, samples = x.shape[:-1], x.shape[-1]
+        start, length = output_window(samples, self.taps, mode)
+        out = prepare_output(out, channels + (length,), x, axis=axis)
+        y = np.moveaxis(out, axis, -1)
+
+        taps = self.taps
+        fft_size = self.fft_size_for(samples)
+        block = fft_size - taps + 1
+        spectrum = self.spectrum(fft_size)
+        batch = batch_blocks(fft_size, x.size // samples) * block
+
+        # Tail of the last block of the previous batch
+        carry = np.zeros(channels + (taps - 1,))
+
+        for first in range(0, samples, batch):
+            chunk = x[..., first : first + batch]
+            blocks = -(-chunk.shape[-1] // block)
+
+            padded = np.zeros(channels + (blocks * block,))
+            padded[..., : chunk.shape[-1]] = chunk
+            filtered = np.fft.irfft(
+                np.fft.rfft(padded.reshape(channels + (blocks, block)), fft_size)
+                * spectrum,
+                fft_size,
+            )
+
+            # Overlap-add: the tail of each block goes onto the head of the next
+            result = filtered[..., :block].copy()
+            result[..., 1:, : taps - 1] += filtered[..., :-1, block:]
+            result[..., 0, : taps - 1] += carry
+            carry = filtered[..., -1, block:]
+
+            _write_window(y, result.reshape(channels + (-1,)), first, start)
+
+        _write_window(y, carry, samples + (-samples) % block, start)
+
+        return out
+
+
+def convolve_fft(
+    signal: np.ndarray | list[float],
+    coefficients: np.ndarray | list[float],
+    mode: ConvolutionMode = "same",
+    out: np.ndarray | None = None,
+    block_size: int | None = None,
+    axis: int = -1,
+) -> np.ndarray:
+    """
+    Filters a signal with FIR coefficients using the FFT overlap-add method.
+
+    This is a one-shot helper; to filter several signals with the same coefficients,
+    keep an OverlapAddConvolver so their spectrum is only computed once.
+
+    Args:
+        signal (np.ndarray | list[float]): The signal to filter (x), or one signal per
+            index of the axes other than `axis`.
+        coefficients (np.ndarray | list[float]): The FIR filter coefficients (h).
+        mode (ConvolutionMode, optional): The output mode, as in numpy.convolve. Defaults to "same".
+        out (np.ndarray, optional): A float64 buffer to write the output into.
+        block_size (int, optional): The number of signal samples filtered by each FFT.
+        axis (int, optional): The axis of the signal holding the samples. Defaults to -1.
+
+    Returns:
+        np.ndarray: The filtered signal, which is `out` if it was given.
+
+    Raises:
+        ValueError: If the signal is empty, the coefficients are not a non-empty 1-D
+            array, the mode or axis is invalid, or `out` is not a suitable buffer.
+    """
+    return OverlapAddConvolver(coefficients, block_size).convolve(
+        signal, mode, out, axis
+    )
+
+
+def _write_window(out: np.ndarray, values: np.ndarray, first: int, start: int):
+    """
+    Writes the samples of the full convolution at indexes [first, first + len(values))
+    that fall inside the output window starting at `start`, along the last axis.
+    """
+    lo = max(first, start)
+    hi = min(first + values.shape[-1], start + out.shape[-1])
+
+    if lo < hi:
+        out[..., lo - start : hi - start] = values[..., lo - first : hi - first]
+
+
+def _next_power_of_two(value: int) -> int:
+    """
+    Returns the smallest power of two greater than or equal to `value`.
+    """
+    return 1 << max(value - 1, 0).bit_length()
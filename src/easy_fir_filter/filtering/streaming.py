@@ -0,0 +1,171 @@
+"""
+This module contains the StreamingFirFilter class, which filters a signal received
+in chunks while keeping the filter state between chunks.
+"""
+
+import numpy as np
+
+from easy_fir_filter.filtering.delay_line import DelayLine
+from easy_fir_filter.filtering.direct_form import (
+    direct_form_kernel,
+    folded_direct_form_kernel,
+    is_symmetric,
+)
+from easy_fir_filter.filtering.output_window import (
+    as_signal,
+    normalize_axis,
+    prepare_output,
+)
+
+
+class StreamingFirFilter:
+    """
+    Causal FIR filter for signals received in chunks of any size.
+
+    The filter keeps a delay line with the last N - 1 input samples, so the output of
+    consecutive process() calls is the output of filtering the concatenated chunks:
+        y(m) = sum(h(k) * x(m - k)) for k = 0 to N - 1
+    with the samples before the first chunk taken as zero. This is the first part of
+    numpy.convolve(x, h, "full"), one output sample per input sample.
+
+    The delay line and the scratch buffers are preallocated (see DelayLine) and only
+    grow when a chunk is longer than every previous one, so once warmed up, process()
+    allocates nothing when an output buffer is given. Symmetric coefficients use the
+    folded direct-form kernel.
+
+    With `channels`, the filter processes (channels, samples) or (samples, channels)
+    chunks and keeps one delay line per channel.
+
+    Attributes:
+        coefficients (np.ndarray): The FIR filter coefficients (h).
+        taps (int): The number of coefficients (N).
+        channels (int | None): The number of channels, or None for a single 1-D signal.
+    """
+
+    def __init__(
+        self,
+        coefficients: np.ndarray | list[float],
+        max_chunk_size: int = 0,
+        channels: int | None = None,
+    ):
+        """
+        Initializes the streaming filter with an empty (zero) state.
+
+        Args:
+            coefficients (np.ndarray | list[float]): The FIR filter coefficients, for example
+                EasyFirFilter.calculate_filter() or EasyFirFilter.coefficients.
+            max_chunk_size (int, optional): The expected largest chunk, to preallocate the
+                buffers for. Defaults to 0, allocating on the first call.
+            channels (int, optional): The number of channels of the chunks. Defaults to
+                None, for 1-D chunks.
+
+        Raises:
+            ValueError: If the coefficients are not a non-empty 1-D array,
+                max_chunk_size is negative or channels is lower than 1.
+        """
+        if max_chunk_size < 0:
+            raise ValueError("The maximum chunk size cannot be negative.")
+        if channels is not None and channels < 1:
+            raise ValueError("The number of channels must be at least 1.")
+
+        self.coefficients = as_signal(coefficients, "coefficients").copy()
+        self.taps = self.coefficients.size
+        self._symmetric = is_symmetric(self.coefficients)
+        self.channels = channels
+        self._channels_shape = () if channels is None else (channels,)
+
+        self._delay_line = DelayLine(
+            self.taps - 1, self._channels_shape, max_chunk_size
+        )
+        self._product = np.empty(self._channels_shape + (max_chunk_size,))
+
+    def process(
+        self,
+        chunk: np.ndarray | list[float],
+        out: np.ndarray | None = None,
+        axis: int = -1,
+    ) -> np.ndarray:
+        """
+        Filters the next chunk of the signal.
+
+        Args:
+            chunk (np.ndarray | list[float]): The next samples of the 1-D signal, or of
+                every channel, as a 2-D array with the samples along `axis`.
+            out (np.ndarray, optional): A float64 buffer with the shape of the chunk to
+                write the output into.
+            axis (int, optional): The axis of a multichannel chunk holding the samples.
+                Defaults to -1.
+
+        Returns:
+            np.ndarray: One output sample per chunk sample, which is `out` if it was given.
+
+        Raises:
+            ValueError: If the chunk does not have the dimensions and channels of the
+                filter, the axis is invalid, or `out` is not a suitable buffer.
+        """
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if chunk.ndim != len(self._channels_shape) + 1:
+            raise ValueError(
+                f"The chunk must be a {len(self._channels_shape) + 1}-D array, "
+                f"got {chunk.ndim} dimensions."
+            )
+
+        axis = normalize_axis(axis, chunk.ndim)
+        x = np.moveaxis(chunk, axis, -1)
+        if x.shape[:-1] != self._channels_shape:
+            raise ValueError(
+                f"The chunk must have {self.channels} channels, got {x.shape[0]}."
+            )
+
+        size = x.shape[-1]
+        out = prepare_output(out, x.shape, chunk, *self._delay_line.buffers, axis=axis)
+        if size == 0:
+            return out
+
+        if size > self._product.shape[-1]:
+            self._delay_line.reserve(size)
+            self._product = np.empty(
+                self._channels_shape + (self._delay_line.capacity,)
+            )
+
+        kernel = folded_direct_form_kernel if self._symmetric else direct_form_kernel
+        kernel(
+            self._delay_line.load(x),
+            self.coefficients,
+            self.taps - 1,
+            np.moveaxis(out, axis, -1),
+            self._product[..., :size],
+        )
+        # The last N - 1 inputs become the delay line of the next chunk
+        self._delay_line.advance(size)
+
+        return out
+
+    def reset(self):
+        """
+        Clears the delay line, as if no sample had been processed.
+        """
+        self._delay_line.reset()
+
+    def snapshot(self) -> np.ndarray:
+        """
+        Returns a copy of the filter state.
+
+        Returns:
+            np.ndarray: The last N - 1 input samples, oldest first, of shape (N - 1,)
+                or (channels, N - 1).
+        """
+        return self._delay_line.snapshot()
+
+    def restore(self, state: np.ndarray | list[float]):
+        """
+        Restores a state returned by snapshot().
+
+        Args:
+            state (np.ndarray | list[float]): The last N - 1 input samples, oldest first,
+                of every channel.
+
+        Raises:
+            ValueError: If the state does not have the shape returned by snapshot().
+        """
+        self._delay_line.restore(state)
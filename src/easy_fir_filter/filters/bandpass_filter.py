@@ -2,11 +2,11 @@
 This file contains the implementation of the BandpassFilter class.
 """
 
-import math
+import numpy as np
 
 from easy_fir_filter.interfaces.filter_interface import IFilter
 from easy_fir_filter.types.fir_filter_conf import FilterConf
-from easy_fir_filter.utils import truncate
+from easy_fir_filter.utils import truncate_array
 
 
 class BandpassFilter(IFilter):
@@ -36,7 +36,7 @@ class BandpassFilter(IFilter):
             round_to (int, optional): Number of decimal places for rounding coefficients. Defaults to 4.
         """
         self.n: int | None = None
-        self.impulse_response_coefficients: list[float] = []
+        self.impulse_response_coefficients: np.ndarray = np.empty(0)
 
         self.filter_conf = filter_conf
         self.round_to = round_to
@@ -57,14 +57,48 @@ class BandpassFilter(IFilter):
         if not d:
             raise ValueError("The design parameter 'd' must be calculated first.")
 
-        N = math.ceil(
+        N = np.ceil(
             ((self.F * d) / min(self.fp - self.fs, self.fs2 - self.fp2))
             + self._FILTER_ORDER_FACTOR
         )
 
         return int(N)
 
-    def calculate_impulse_response_coefficients(self) -> list[float]:
+    @classmethod
+    def _calculate_filter_lengths(
+        cls,
+        d: np.ndarray,
+        F: np.ndarray,
+        fp: np.ndarray,
+        fs: np.ndarray,
+        fp2: np.ndarray | None = None,
+        fs2: np.ndarray | None = None,
+        round_to: int = 4,
+    ) -> np.ndarray:
+        """
+        Calculates the filter lengths (N) of several filters at once.
+
+        This is the array counterpart of `_calculate_filter_length`, used when
+        designing many filters in a batch.
+
+        Args:
+            d (np.ndarray): The D parameter of each filter.
+            F (np.ndarray): Sampling frequencies in Hz.
+            fp (np.ndarray): Lower passband frequencies in Hz.
+            fs (np.ndarray): Lower stopband frequencies in Hz.
+            fp2 (np.ndarray): Upper passband frequencies in Hz.
+            fs2 (np.ndarray): Upper stopband frequencies in Hz.
+            round_to (int, optional): Number of decimal places to truncate to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The computed filter lengths (N) as integers.
+        """
+        N = np.ceil(
+            ((F * d) / np.minimum(fp - fs, fs2 - fp2)) + cls._FILTER_ORDER_FACTOR  # type: ignore
+        )
+        return N.astype(np.int64)
+
+    def calculate_impulse_response_coefficients(self) -> np.ndarray:
         """
         Computes the impulse response coefficients of the bandpass filter.
 
@@ -79,7 +113,7 @@ class BandpassFilter(IFilter):
             nc = coefficient index
 
         Returns:
-            list[float]: The computed impulse response coefficients.
+            np.ndarray: The n + 1 computed impulse response coefficients.
 
         Raises:
             ValueError: If the filter order has not been calculated first.
@@ -87,19 +121,56 @@ class BandpassFilter(IFilter):
         if self.n is None:
             raise ValueError("Order must be calculated first. Call calculate_order().")
 
-        nc = 1
-        deltaF = min(self.fp - self.fs, self.fs2 - self.fp2)
-        fc1 = self.fp - (deltaF / 2)
-        fc2 = self.fp2 + (deltaF / 2)
+        self.impulse_response_coefficients = self._impulse_response(
+            np.arange(self.n + 1),
+            self.F,
+            self.fp,
+            self.fs,
+            self.fp2,
+            self.fs2,
+            round_to=self.round_to,
+        )
 
-        n0 = (2 / self.F) * (fc2 - fc1)
-        self.impulse_response_coefficients.append(truncate(n0, self.round_to))
+        return self.impulse_response_coefficients
 
-        while nc <= self.n:
-            term1 = (2 * math.pi * nc * fc2) / self.F
-            term2 = (2 * math.pi * nc * fc1) / self.F
-            c = (1 / (nc * math.pi)) * (math.sin(term1) - math.sin(term2))
-            self.impulse_response_coefficients.append(truncate(c, self.round_to))
-            nc += 1
+    @staticmethod
+    def _impulse_response(
+        nc: np.ndarray,
+        F: float | np.ndarray,
+        fp: float | np.ndarray,
+        fs: float | np.ndarray,
+        fp2: float | np.ndarray | None = None,
+        fs2: float | np.ndarray | None = None,
+        round_to: int = 4,
+    ) -> np.ndarray:
+        """
+        Evaluates the bandpass impulse response at the coefficient indexes `nc`.
 
-        return self.impulse_response_coefficients
+        The frequencies may be scalars or arrays broadcastable against `nc`, so
+        several filters can be evaluated in a single call.
+
+        Args:
+            nc (np.ndarray): Coefficient indexes (0 to n).
+            F (float | np.ndarray): Sampling frequency in Hz.
+            fp (float | np.ndarray): Lower passband frequency in Hz.
+            fs (float | np.ndarray): Lower stopband frequency in Hz.
+            fp2 (float | np.ndarray): Upper passband frequency in Hz.
+            fs2 (float | np.ndarray): Upper stopband frequency in Hz.
+            round_to (int, optional): Number of decimal places to truncate to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The impulse response coefficients.
+        """
+        deltaF = np.minimum(fp - fs, fs2 - fp2)  # type: ignore
+        fc1 = fp - (deltaF / 2)
+        fc2 = fp2 + (deltaF / 2)  # type: ignore
+
+        n0 = truncate_array((2 / F) * (fc2 - fc1), round_to)
+
+        # Index 0 is replaced by n0 below; use 1 there to avoid dividing by zero
+        safe_nc = np.where(nc == 0, 1, nc)
+        term1 = (2 * np.pi * safe_nc * fc2) / F
+        term2 = (2 * np.pi * safe_nc * fc1) / F
+        c = (1 / (safe_nc * np.pi)) * (np.sin(term1) - np.sin(term2))
+
+        return np.where(nc == 0, n0, truncate_array(c, round_to))
@@ -2,11 +2,11 @@
 This module contains the implementation of the Highpass FIR Filter class.
 """
 
-import math
+import numpy as np
 
 from easy_fir_filter.interfaces.filter_interface import IFilter
 from easy_fir_filter.types.fir_filter_conf import FilterConf
-from easy_fir_filter.utils import truncate
+from easy_fir_filter.utils import truncate_array
 
 
 class HighpassFilter(IFilter):
@@ -35,7 +35,7 @@ class HighpassFilter(IFilter):
                                       impulse response coefficients. Defaults to 4.
         """
         self.n: int | None = None
-        self.impulse_response_coefficients: list[float] = []
+        self.impulse_response_coefficients: np.ndarray = np.empty(0)
 
         self.filter_conf = filter_conf
         self.round_to = round_to
@@ -63,7 +63,39 @@ class HighpassFilter(IFilter):
         N = int(((self.F * d) / (self.fp - self.fs)) + self._FILTER_ORDER_FACTOR)
         return N
 
-    def calculate_impulse_response_coefficients(self) -> list[float]:
+    @classmethod
+    def _calculate_filter_lengths(
+        cls,
+        d: np.ndarray,
+        F: np.ndarray,
+        fp: np.ndarray,
+        fs: np.ndarray,
+        fp2: np.ndarray | None = None,
+        fs2: np.ndarray | None = None,
+        round_to: int = 4,
+    ) -> np.ndarray:
+        """
+        Calculates the filter lengths (N) of several filters at once.
+
+        This is the array counterpart of `_calculate_filter_length`, used when
+        designing many filters in a batch.
+
+        Args:
+            d (np.ndarray): The D parameter of each filter.
+            F (np.ndarray): Sampling frequencies in Hz.
+            fp (np.ndarray): Passband frequencies in Hz.
+            fs (np.ndarray): Stopband frequencies in Hz.
+            fp2 (np.ndarray, optional): Not used by the highpass filter.
+            fs2 (np.ndarray, optional): Not used by the highpass filter.
+            round_to (int, optional): Number of decimal places to truncate to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The computed filter lengths (N) as integers.
+        """
+        N = np.trunc(((F * d) / (fp - fs)) + cls._FILTER_ORDER_FACTOR)
+        return N.astype(np.int64)
+
+    def calculate_impulse_response_coefficients(self) -> np.ndarray:
         """
         Computes the impulse response coefficients of the highpass filter.
 
@@ -80,7 +112,7 @@ class HighpassFilter(IFilter):
             nc = coefficient index
 
         Returns:
-            list[float]: The list of computed impulse response coefficients.
+            np.ndarray: The n + 1 computed impulse response coefficients.
 
         Raises:
             ValueError: If the filter order has not been calculated before calling this method.
@@ -88,15 +120,46 @@ class HighpassFilter(IFilter):
         if self.n is None:
             raise ValueError("Order must be calculated first. Call calculate_order().")
 
-        nc = 1
-        fc = 0.5 * (self.fp + self.fs)
-        n0 = 1 - ((2 * fc) / self.F)
-        self.impulse_response_coefficients.append(truncate(n0, self.round_to))
-
-        while nc <= self.n:
-            term = (2 * math.pi * nc * fc) / self.F
-            c = -((2 * fc) / self.F) * (math.sin(term) / term)
-            nc += 1
-            self.impulse_response_coefficients.append(truncate(c, self.round_to))
+        self.impulse_response_coefficients = self._impulse_response(
+            np.arange(self.n + 1), self.F, self.fp, self.fs, round_to=self.round_to
+        )
 
         return self.impulse_response_coefficients
+
+    @staticmethod
+    def _impulse_response(
+        nc: np.ndarray,
+        F: float | np.ndarray,
+        fp: float | np.ndarray,
+        fs: float | np.ndarray,
+        fp2: float | np.ndarray | None = None,
+        fs2: float | np.ndarray | None = None,
+        round_to: int = 4,
+    ) -> np.ndarray:
+        """
+        Evaluates the highpass impulse response at the coefficient indexes `nc`.
+
+        The frequencies may be scalars or arrays broadcastable against `nc`, so
+        several filters can be evaluated in a single call.
+
+        Args:
+            nc (np.ndarray): Coefficient indexes (0 to n).
+            F (float | np.ndarray): Sampling frequency in Hz.
+            fp (float | np.ndarray): Passband frequency in Hz.
+            fs (float | np.ndarray): Stopband frequency in Hz.
+            fp2 (float | np.ndarray, optional): Not used by the highpass filter.
+            fs2 (float | np.ndarray, optional): Not used by the highpass filter.
+            round_to (int, optional): Number of decimal places to truncate to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The impulse response coefficients.
+        """
+        fc = 0.5 * (fp + fs)
+        n0 = truncate_array(1 - ((2 * fc) / F), round_to)
+
+        # Index 0 is replaced by n0 below; use 1 there to avoid dividing by zero
+        safe_nc = np.where(nc == 0, 1, nc)
+        term = (2 * np.pi * safe_nc * fc) / F
+        c = truncate_array(-((2 * fc) / F) * (np.sin(term) / term), round_to)
+
+        return np.where(nc == 0, n0, c)
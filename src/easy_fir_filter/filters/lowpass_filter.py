@@ -2,11 +2,11 @@
 This module contains the implementation of the LowpassFilter class.
 """
 
-import math
+import numpy as np
 
 from easy_fir_filter.interfaces.filter_interface import IFilter
 from easy_fir_filter.types.fir_filter_conf import FilterConf
-from easy_fir_filter.utils import truncate
+from easy_fir_filter.utils import truncate_array
 
 
 class LowpassFilter(IFilter):
@@ -19,6 +19,10 @@ class LowpassFilter(IFilter):
     which is a fundamental technique in FIR filter design. The sinc function represents
     the ideal impulse response of a lowpass filter, and by modifying its parameters,
     we can create lowpass filters.
+
+    With the `half_band` option, the cut-off frequency is F / 4, so every coefficient
+    at an even, nonzero index is zero. Those coefficients are set to exactly 0 and
+    the order is made odd, so the outermost coefficients are not zero.
     """
 
     _FILTER_ORDER_FACTOR = 1
@@ -32,11 +36,12 @@ class LowpassFilter(IFilter):
                 - sampling_freq_hz (float): Sampling frequency in Hz.
                 - passband_freq_hz (float): Passband frequency in Hz.
                 - stopband_freq_hz (float): Stopband frequency in Hz.
+                - half_band (bool, optional): Whether to design a half-band filter.
             round_to (int, optional): Number of decimal places for rounding the
                                       impulse response coefficients. Defaults to 4.
         """
         self.n: int | None = None
-        self.impulse_response_coefficients: list[float] = []
+        self.impulse_response_coefficients: np.ndarray = np.empty(0)
 
         self.filter_conf = filter_conf
         self.round_to = round_to
@@ -44,6 +49,24 @@ class LowpassFilter(IFilter):
         self.F = filter_conf["sampling_freq_hz"]
         self.fp = filter_conf["passband_freq_hz"]
         self.fs = filter_conf["stopband_freq_hz"]
+        self.half_band = filter_conf.get("half_band", False)
+
+    def calculate_filter_order(self, d: float) -> tuple[int, int]:
+        """
+        Calculates the filter order and length, making the order odd for half-band filters.
+
+        Args:
+            d (float): The design parameter used to compute the filter order.
+
+        Returns:
+            tuple[int, int]: The filter order (n) and the filter length (N).
+        """
+        n, N = super().calculate_filter_order(d)
+        if self.half_band:
+            n, N = self._half_band_orders(n, N)
+            self.n = int(n)
+
+        return int(n), int(N)
 
     def _calculate_filter_length(self, d: float) -> int:
         """
@@ -61,7 +84,39 @@ class LowpassFilter(IFilter):
         N = int(((self.F * d) / (self.fs - self.fp)) + self._FILTER_ORDER_FACTOR)
         return N
 
-    def calculate_impulse_response_coefficients(self) -> list[float]:
+    @classmethod
+    def _calculate_filter_lengths(
+        cls,
+        d: np.ndarray,
+        F: np.ndarray,
+        fp: np.ndarray,
+        fs: np.ndarray,
+        fp2: np.ndarray | None = None,
+        fs2: np.ndarray | None = None,
+        round_to: int = 4,
+    ) -> np.ndarray:
+        """
+        Calculates the filter lengths (N) of several filters at once.
+
+        This is the array counterpart of `_calculate_filter_length`, used when
+        designing many filters in a batch.
+
+        Args:
+            d (np.ndarray): The D parameter of each filter.
+            F (np.ndarray): Sampling frequencies in Hz.
+            fp (np.ndarray): Passband frequencies in Hz.
+            fs (np.ndarray): Stopband frequencies in Hz.
+            fp2 (np.ndarray, optional): Not used by the lowpass filter.
+            fs2 (np.ndarray, optional): Not used by the lowpass filter.
+            round_to (int, optional): Number of decimal places to truncate to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The computed filter lengths (N) as integers.
+        """
+        N = np.trunc(((F * d) / (fs - fp)) + cls._FILTER_ORDER_FACTOR)
+        return N.astype(np.int64)
+
+    def calculate_impulse_response_coefficients(self) -> np.ndarray:
         """
         Computes the impulse response coefficients of the low-pass filter.
 
@@ -79,7 +134,7 @@ class LowpassFilter(IFilter):
             n0 = (2 * fc) / F (Normalized frequency)
 
         Returns:
-            list[float]: The list of computed impulse response coefficients.
+            np.ndarray: The n + 1 computed impulse response coefficients.
 
         Raises:
             ValueError: If the filter order has not been calculated before calling this method.
@@ -87,15 +142,86 @@ class LowpassFilter(IFilter):
         if self.n is None:
             raise ValueError("Order must be calculated first. Call calculate_order().")
 
-        nc = 1
-        fc = 0.5 * (self.fp + self.fs)  # Cutoff frequency
-        n0 = (2 * fc) / self.F  # Normalized frequency
-        self.impulse_response_coefficients.append(n0)
-
-        while nc <= self.n:
-            term = (2 * math.pi * nc * fc) / self.F
-            c = n0 * ((math.sin(term)) / term)
-            nc += 1
-            self.impulse_response_coefficients.append(truncate(c, self.round_to))
+        nc = np.arange(self.n + 1)
+        self.impulse_response_coefficients = self._impulse_response(
+            nc, self.F, self.fp, self.fs, round_to=self.round_to
+        )
+        if self.half_band:
+            self.impulse_response_coefficients = self._zero_half_band_taps(
+                nc, self.impulse_response_coefficients
+            )
 
         return self.impulse_response_coefficients
+
+    @staticmethod
+    def _half_band_orders(
+        n: int | np.ndarray, N: int | np.ndarray
+    ) -> tuple[int | np.ndarray, int | np.ndarray]:
+        """
+        Rounds the orders of half-band filters up to odd numbers.
+
+        The coefficients at even, nonzero indexes of a half-band filter are zero, so
+        with an even order the two outermost coefficients would only add zero taps.
+
+        Args:
+            n (int | np.ndarray): The filter orders.
+            N (int | np.ndarray): The filter lengths.
+
+        Returns:
+            tuple[int | np.ndarray, int | np.ndarray]: The odd orders and their lengths.
+        """
+        even = 1 - n % 2
+        return n + even, N + 2 * even
+
+    @staticmethod
+    def _zero_half_band_taps(nc: np.ndarray, c: np.ndarray) -> np.ndarray:
+        """
+        Sets the coefficients of a half-band filter at even, nonzero indexes to exactly 0.
+
+        Args:
+            nc (np.ndarray): Coefficient indexes (0 to n).
+            c (np.ndarray): The impulse response coefficients.
+
+        Returns:
+            np.ndarray: The coefficients, with the zero taps marked as exact zeros.
+        """
+        return np.where((nc % 2 == 0) & (nc != 0), 0.0, c)
+
+    @staticmethod
+    def _impulse_response(
+        nc: np.ndarray,
+        F: float | np.ndarray,
+        fp: float | np.ndarray,
+        fs: float | np.ndarray,
+        fp2: float | np.ndarray | None = None,
+        fs2: float | np.ndarray | None = None,
+        round_to: int = 4,
+    ) -> np.ndarray:
+        """
+        Evaluates the low-pass impulse response at the coefficient indexes `nc`.
+
+        The frequencies may be scalars or arrays broadcastable against `nc`, so
+        several filters can be evaluated in a single call. Index 0 takes the
+        value n0, which is not truncated.
+
+        Args:
+            nc (np.ndarray): Coefficient indexes (0 to n).
+            F (float | np.ndarray): Sampling frequency in Hz.
+            fp (float | np.ndarray): Passband frequency in Hz.
+            fs (float | np.ndarray): Stopband frequency in Hz.
+            fp2 (float | np.ndarray, optional): Not used by the low-pass filter.
+            fs2 (float | np.ndarray, optional): Not used by the low-pass filter.
+            round_to (int, optional): Number of decimal places to truncate to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The impulse response coefficients.
+        """
+        fc = 0.5 * (fp + fs)  # Cutoff frequency
+        n0 = (2 * fc) / F  # Normalized frequency
+
+        # Index 0 is replaced by n0 below; use 1 there to avoid dividing by zero
+        safe_nc = np.where(nc == 0, 1, nc)
+        term = (2 * np.pi * safe_nc * fc) / F
+        c = truncate_array(n0 * (np.sin(term) / term), round_to)
+
+        return np.where(nc == 0, n0, c)
@@ -0,0 +1,3 @@
+from easy_fir_filter.instrumentation.stage_timer import StageCollector, timed_stage
+
+__all__ = ["StageCollector", "timed_stage"]
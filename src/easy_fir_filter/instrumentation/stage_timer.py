@@ -0,0 +1,112 @@
+"""
+This module contains the per-stage instrumentation of the filter design process: a
+timing context and a collector for its records.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from easy_fir_filter.types import DesignStage, StageRecord
+
+
+@contextmanager
+def timed_stage(
+    stage: DesignStage,
+    on_stage: Callable[[StageRecord], None],
+    taps: Callable[[], int | None],
+    trace_memory: bool = False,
+) -> Iterator[None]:
+    """
+    Measures a design stage and passes its record to a callback.
+
+    With `trace_memory`, the peak of the memory traced by tracemalloc during the
+    stage is recorded, relative to the memory traced when it starts. Tracing is
+    started for the stage if it is not running already, which slows the stage down
+    noticeably, so the wall time is not representative in that mode. A trace the
+    caller started keeps its peak: the stage peak is then only known when it raises
+    that peak, and otherwise the memory the stage still holds at its end, a lower
+    bound of its peak, is recorded. A stage that raises an exception is not recorded.
+
+    Args:
+        stage (DesignStage): The name of the stage.
+        on_stage (Callable[[StageRecord], None]): The callback receiving the record.
+        taps (Callable[[], int | None]): Returns the filter length at the end of the stage.
+        trace_memory (bool, optional): Whether to record the peak memory. Defaults to False.
+
+    Yields:
+        None: The stage runs inside the context.
+    """
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if trace_memory:
+        base_bytes, outer_peak_bytes = tracemalloc.get_traced_memory()
+
+    start = time.perf_counter()
+    try:
+        yield
+        seconds = time.perf_counter() - start
+        peak_bytes = None
+        if trace_memory:
+            current_bytes, traced_peak_bytes = tracemalloc.get_traced_memory()
+            peak_bytes = (
+                traced_peak_bytes - base_bytes
+                if started_tracing or traced_peak_bytes > outer_peak_bytes
+                else max(current_bytes - base_bytes, 0)
+            )
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    on_stage(
+        {"stage": stage, "seconds": seconds, "taps": taps(), "peak_bytes": peak_bytes}
+    )
+
+
+class StageCollector:
+    """
+    Collects the stage records of one or more designs, to be used as the `on_stage`
+    callback of EasyFirFilter.
+
+    Attributes:
+        records (list[StageRecord]): The records, in the order the stages ran.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty collector.
+        """
+        self.records: list[StageRecord] = []
+
+    def __call__(self, record: StageRecord):
+        """
+        Stores a stage record.
+
+        Args:
+            record (StageRecord): The record of a finished stage.
+        """
+        self.records.append(record)
+
+    def totals(self) -> dict[DesignStage, float]:
+        """
+        Returns the total wall time of every recorded stage.
+
+        Returns:
+            dict[DesignStage, float]: The seconds spent in each stage, summed over
+                every design, in the order the stages first ran.
+        """
+        totals: dict[DesignStage, float] = {}
+        for record in self.records:
+            totals[record["stage"]] = (
+                totals.get(record["stage"], 0.0) + record["seconds"]
+            )
+
+        return totals
+
+    def clear(self):
+        """
+        Removes every record.
+        """
+        self.records.clear()
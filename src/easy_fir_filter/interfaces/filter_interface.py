@@ -4,6 +4,8 @@ This module defines the IFilter interface for digital filters.
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class IFilter(ABC):
     """
@@ -14,11 +16,11 @@ class IFilter(ABC):
 
     Attributes:
         n (int | None): The filter order, calculated as (N - 1) / 2, where N is the filter length.
-        impulse_response_coefficients (list[float]): The computed impulse response coefficients of the filter.
+        impulse_response_coefficients (np.ndarray): The computed impulse response coefficients of the filter.
     """
 
     n: int | None = None
-    impulse_response_coefficients: list[float] = []
+    impulse_response_coefficients: np.ndarray = np.empty(0)
 
     def calculate_filter_order(self, d: float) -> tuple[int, int]:
         """
@@ -57,6 +59,28 @@ class IFilter(ABC):
 
         return self.n, N
 
+    @staticmethod
+    def _filter_orders(filter_lengths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the order and length of several filters from their initial lengths.
+
+        This is the array counterpart of `calculate_filter_order`: each length is
+        adjusted by adding 1 or 2 so that it is odd.
+
+        Args:
+            filter_lengths (np.ndarray): The initial filter lengths, as integers.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: A tuple containing:
+                - n (np.ndarray): The filter orders, defined as (N - 1) / 2.
+                - N (np.ndarray): The total filter lengths.
+        """
+        N = np.where(
+            (filter_lengths + 1) % 2 == 0, filter_lengths + 2, filter_lengths + 1
+        )
+
+        return (N - 1) // 2, N
+
     @abstractmethod
     def _calculate_filter_length(self, d: float) -> int:
         """
@@ -74,14 +98,15 @@ class IFilter(ABC):
         raise NotImplementedError("Subclasses must implement this method.")
 
     @abstractmethod
-    def calculate_impulse_response_coefficients(self) -> list[float]:
+    def calculate_impulse_response_coefficients(self) -> np.ndarray:
         """
         Computes the impulse response coefficients of the filter.
 
         This method must be implemented by subclasses to generate the specific
-        impulse response required for the filter type.
+        impulse response required for the filter type. The whole half-response
+        (indexes 0 to n) is computed as a single array expression.
 
         Returns:
-            list[float]: A list containing the computed impulse response coefficients.
+            np.ndarray: An array containing the n + 1 computed impulse response coefficients.
         """
         raise NotImplementedError("Subclasses must implement this method.")
@@ -5,6 +5,8 @@ This module defines the IWindow interface for window functions used in digital f
 from abc import ABC, abstractmethod
 from typing import overload
 
+import numpy as np
+
 
 class IWindow(ABC):
     """
@@ -17,27 +19,27 @@ class IWindow(ABC):
     frequency response of the filter, thereby reducing spectral leakage.
 
     Attributes:
-        window_coefficients (list[float]): The window coefficients.
+        window_coefficients (np.ndarray): The window coefficients.
     """
 
-    window_coefficients: list[float] = []
+    window_coefficients: np.ndarray = np.empty(0)
 
     @overload
     @abstractmethod
     def calculate_window_coefficients(
         self, n: int, filter_length: int
-    ) -> list[float]: ...
+    ) -> np.ndarray: ...
 
     @overload
     @abstractmethod
     def calculate_window_coefficients(
         self, n: int, filter_length: int, AS: float
-    ) -> list[float]: ...
+    ) -> np.ndarray: ...
 
     @abstractmethod
     def calculate_window_coefficients(
         self, n: int, filter_length: int, AS: float | None = None
-    ) -> list[float]:
+    ) -> np.ndarray:
         """
         Computes the window function coefficients for a given filter order.
 
@@ -53,7 +55,8 @@ class IWindow(ABC):
                 If provided, it allows for more precise control over the window's shape.
 
         Returns:
-            list[float]: A list containing the computed window function coefficients.
+            np.ndarray: A contiguous float64 array containing the n + 1 computed
+                window function coefficients.
 
         Raises:
             NotImplementedError: If the method is not implemented in a subclass.
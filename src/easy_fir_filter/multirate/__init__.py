@@ -0,0 +1,19 @@
+from easy_fir_filter.multirate.decimator import Decimator
+from easy_fir_filter.multirate.interpolator import Interpolator
+from easy_fir_filter.multirate.multistage import (
+    MultistageDecimator,
+    decimation_cost,
+    plan_decimation,
+)
+from easy_fir_filter.multirate.polyphase import polyphase_branches
+from easy_fir_filter.multirate.resampler import Resampler
+
+__all__ = [
+    "Decimator",
+    "Interpolator",
+    "MultistageDecimator",
+    "Resampler",
+    "decimation_cost",
+    "plan_decimation",
+    "polyphase_branches",
+]
@@ -0,0 +1,204 @@
+"""
+This module contains the Decimator class, a polyphase anti-aliasing filter and
+downsampler.
+"""
+
+import numpy as np
+
+from easy_fir_filter.filtering.delay_line import DelayLine
+from easy_fir_filter.filtering.output_window import as_signal, prepare_output
+from easy_fir_filter.multirate.lowpass_design import design_lowpass
+from easy_fir_filter.multirate.polyphase import (
+    decimate_kernel,
+    polyphase_branches,
+    sparse_decimate_kernel,
+)
+from easy_fir_filter.types import FilterConf, MultirateState
+
+
+class Decimator:
+    """
+    Reduces the sampling rate of a signal by an integer factor M.
+
+    The anti-aliasing lowpass filter is designed with EasyFirFilter, with its stopband
+    edge at the output Nyquist frequency F / (2 * M). The coefficients are split into
+    M polyphase branches, so only the retained outputs (one of every M filtered
+    samples) are computed:
+        y(n) = sum(h(k) * x(n * M - k)) for k = 0 to N - 1
+
+    With the `half_band` option and a factor of 2, the filter is a half-band filter
+    with every other coefficient zero, and those taps are skipped.
+
+    The decimator works one-shot, with decimate(), or on a stream of chunks of any
+    size, with process(), where the output equals decimating the concatenated chunks.
+    The output is delayed by (N - 1) / 2 input samples, the group delay of the filter.
+
+    Attributes:
+        factor (int): The decimation factor (M).
+        filter_conf (FilterConf): The configuration of the anti-aliasing filter.
+        coefficients (np.ndarray): The anti-aliasing filter coefficients (h).
+        branches (np.ndarray): The (M, J) polyphase branch matrix, E(k, j) = h(j * M + k).
+    """
+
+    def __init__(
+        self,
+        factor: int,
+        filter_conf: FilterConf,
+        round_to: int = 4,
+        stopband_freq_hz: float | None = None,
+        max_chunk_size: int = 0,
+    ):
+        """
+        Initializes the decimator and designs its anti-aliasing filter.
+
+        Args:
+            factor (int): The decimation factor (M).
+            filter_conf (FilterConf): The input sampling frequency, passband edge,
+                ripples and window of the anti-aliasing filter. The filter type and
+                stopband edge are derived from the factor.
+            round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+            stopband_freq_hz (float, optional): Overrides the stopband edge, F / (2 * M) by default.
+            max_chunk_size (int, optional): The expected largest chunk, to preallocate the
+                buffers for. Defaults to 0, allocating on the first call.
+
+        Raises:
+            ValueError: If the factor is lower than 1, max_chunk_size is negative, or
+                the anti-aliasing filter configuration is invalid.
+        """
+        if not isinstance(factor, (int, np.integer)) or factor < 1:
+            raise ValueError("The decimation factor must be an integer of at least 1.")
+        if max_chunk_size < 0:
+            raise ValueError("The maximum chunk size cannot be negative.")
+
+        sampling_freq_hz = filter_conf["sampling_freq_hz"]
+        if stopband_freq_hz is None:
+            stopband_freq_hz = sampling_freq_hz / (2 * factor)
+
+        self.factor = int(factor)
+        self.filter_conf, self.coefficients = design_lowpass(
+            filter_conf, sampling_freq_hz, stopband_freq_hz, round_to
+        )
+        self.branches = polyphase_branches(self.coefficients, self.factor)
+
+        # kernel[j, q] = h(j * M + M - 1 - q), see decimate_kernel
+        self._kernel = np.ascontiguousarray(self.branches[::-1].T)
+        self._decimate_kernel = (
+            sparse_decimate_kernel
+            if self.filter_conf.get("half_band", False)
+            else decimate_kernel
+        )
+        self._delay_line = DelayLine(self.branches.size - 1, (), max_chunk_size)
+        self._product = np.empty(-(-max_chunk_size // self.factor))
+        self._phase = 0
+
+    def output_length(self, chunk_size: int) -> int:
+        """
+        Returns the number of outputs process() produces for the next chunk.
+
+        Args:
+            chunk_size (int): The length of the next chunk.
+
+        Returns:
+            int: The number of outputs.
+        """
+        return max(-(-(chunk_size - self._phase) // self.factor), 0)
+
+    def decimate(self, signal: np.ndarray | list[float]) -> np.ndarray:
+        """
+        Filters and decimates a whole signal, independently of the stream state.
+
+        Args:
+            signal (np.ndarray | list[float]): The 1-D signal at the input rate.
+
+        Returns:
+            np.ndarray: The ceil(L / M) output samples.
+
+        Raises:
+            ValueError: If the signal is not a non-empty 1-D array.
+        """
+        x = as_signal(signal)
+        history = self.branches.size - 1
+        outputs = -(-x.size // self.factor)
+
+        padded = np.zeros(history + x.size)
+        padded[history:] = x
+        out = np.empty(outputs)
+        self._decimate_kernel(padded, self._kernel, 0, out, np.empty(outputs))
+
+        return out
+
+    def process(
+        self, chunk: np.ndarray | list[float], out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Filters and decimates the next chunk of the stream.
+
+        Args:
+            chunk (np.ndarray | list[float]): The next samples of the 1-D signal.
+            out (np.ndarray, optional): A float64 buffer of output_length(len(chunk))
+                samples to write the output into.
+
+        Returns:
+            np.ndarray: The outputs that fall in this chunk, which is `out` if it was given.
+
+        Raises:
+            ValueError: If the chunk is not a 1-D array or `out` is not a suitable buffer.
+        """
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if chunk.ndim != 1:
+            raise ValueError(
+                f"The chunk must be a 1-D array, got {chunk.ndim} dimensions."
+            )
+
+        outputs = self.output_length(chunk.size)
+        out = prepare_output(out, outputs, chunk, *self._delay_line.buffers)
+        if chunk.size == 0:
+            return out
+
+        if outputs > self._product.size:
+            self._delay_line.reserve(chunk.size)
+            self._product = np.empty(-(-self._delay_line.capacity // self.factor))
+
+        buffer = self._delay_line.load(chunk)
+        if outputs:
+            self._decimate_kernel(
+                buffer, self._kernel, self._phase, out, self._product[:outputs]
+            )
+        self._delay_line.advance(chunk.size)
+        self._phase = (self._phase - chunk.size) % self.factor
+
+        return out
+
+    def reset(self):
+        """
+        Clears the stream state, as if no sample had been processed.
+        """
+        self._delay_line.reset()
+        self._phase = 0
+
+    def snapshot(self) -> MultirateState:
+        """
+        Returns a copy of the stream state.
+
+        Returns:
+            MultirateState: The last J * M - 1 input samples and the number of input
+                samples before the next retained output.
+        """
+        return {"history": self._delay_line.snapshot(), "phase": self._phase}
+
+    def restore(self, state: MultirateState):
+        """
+        Restores a state returned by snapshot().
+
+        Args:
+            state (MultirateState): The state to restore.
+
+        Raises:
+            ValueError: If the history does not have J * M - 1 samples or the phase is
+                not between 0 and M - 1.
+        """
+        if not 0 <= state["phase"] < self.factor:
+            raise ValueError(f"The phase must be between 0 and {self.factor - 1}.")
+
+        self._delay_line.restore(state["history"])
+        self._phase = int(state["phase"])
@@ -0,0 +1,186 @@
+"""
+This module contains the Interpolator class, a polyphase upsampler and
+anti-imaging filter.
+"""
+
+import numpy as np
+
+from easy_fir_filter.filtering.delay_line import DelayLine
+from easy_fir_filter.filtering.output_window import as_signal, prepare_output
+from easy_fir_filter.multirate.lowpass_design import design_lowpass
+from easy_fir_filter.multirate.polyphase import interpolate_kernel, polyphase_branches
+from easy_fir_filter.types import FilterConf, MultirateState
+
+
+class Interpolator:
+    """
+    Increases the sampling rate of a signal by an integer factor L.
+
+    Upsampling inserts L - 1 zeros after every input sample, and an anti-imaging
+    lowpass filter running at L * F, with its stopband edge at the input Nyquist
+    frequency F / 2, removes the spectral images. The filter is designed with
+    EasyFirFilter and scaled by L, the gain lost by the zero insertion. It is split
+    into L polyphase branches, one per output phase, so the inserted zeros are never
+    multiplied:
+        y(m * L + p) = L * sum(h(j * L + p) * x(m - j)) for j = 0 to J - 1
+
+    The interpolator works one-shot, with interpolate(), or on a stream of chunks of
+    any size, with process(), where the output equals interpolating the concatenated
+    chunks. The output is delayed by (N - 1) / 2 output samples, the group delay of
+    the filter.
+
+    Attributes:
+        factor (int): The interpolation factor (L).
+        filter_conf (FilterConf): The configuration of the anti-imaging filter.
+        coefficients (np.ndarray): The anti-imaging filter coefficients (h), without the gain.
+        branches (np.ndarray): The (L, J) polyphase branch matrix, E(p, j) = h(j * L + p).
+    """
+
+    def __init__(
+        self,
+        factor: int,
+        filter_conf: FilterConf,
+        round_to: int = 4,
+        stopband_freq_hz: float | None = None,
+        max_chunk_size: int = 0,
+    ):
+        """
+        Initializes the interpolator and designs its anti-imaging filter.
+
+        Args:
+            factor (int): The interpolation factor (L).
+            filter_conf (FilterConf): The input sampling frequency, passband edge,
+                ripples and window of the anti-imaging filter. The filter type and
+                stopband edge are derived from the factor.
+            round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+            stopband_freq_hz (float, optional): Overrides the stopband edge, F / 2 by default.
+            max_chunk_size (int, optional): The expected largest input chunk, to
+                preallocate the buffers for. Defaults to 0, allocating on the first call.
+
+        Raises:
+            ValueError: If the factor is lower than 1, max_chunk_size is negative, or
+                the anti-imaging filter configuration is invalid.
+        """
+        if not isinstance(factor, (int, np.integer)) or factor < 1:
+            raise ValueError(
+                "The interpolation factor must be an integer of at least 1."
+            )
+        if max_chunk_size < 0:
+            raise ValueError("The maximum chunk size cannot be negative.")
+
+        sampling_freq_hz = filter_conf["sampling_freq_hz"]
+        if stopband_freq_hz is None:
+            stopband_freq_hz = sampling_freq_hz / 2
+
+        self.factor = int(factor)
+        self.filter_conf, self.coefficients = design_lowpass(
+            filter_conf, sampling_freq_hz * self.factor, stopband_freq_hz, round_to
+        )
+        self.branches = polyphase_branches(self.coefficients, self.factor)
+
+        # kernel[i, p] = L * h((J - 1 - i) * L + p), see interpolate_kernel
+        self._kernel = np.ascontiguousarray(self.branches.T[::-1] * self.factor)
+        self._delay_line = DelayLine(self._kernel.shape[0] - 1, (), max_chunk_size)
+
+    def output_length(self, chunk_size: int) -> int:
+        """
+        Returns the number of outputs process() produces for a chunk.
+
+        Args:
+            chunk_size (int): The length of the chunk.
+
+        Returns:
+            int: The number of outputs, L per input sample.
+        """
+        return chunk_size * self.factor
+
+    def interpolate(self, signal: np.ndarray | list[float]) -> np.ndarray:
+        """
+        Upsamples and filters a whole signal, independently of the stream state.
+
+        Args:
+            signal (np.ndarray | list[float]): The 1-D signal at the input rate.
+
+        Returns:
+            np.ndarray: The L * len(signal) output samples.
+
+        Raises:
+            ValueError: If the signal is not a non-empty 1-D array.
+        """
+        x = as_signal(signal)
+        history = self._delay_line.history
+
+        padded = np.zeros(history + x.size)
+        padded[history:] = x
+        out = np.empty((x.size, self.factor))
+        interpolate_kernel(padded, self._kernel, out)
+
+        return out.reshape(-1)
+
+    def process(
+        self, chunk: np.ndarray | list[float], out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Upsamples and filters the next chunk of the stream.
+
+        Args:
+            chunk (np.ndarray | list[float]): The next samples of the 1-D signal.
+            out (np.ndarray, optional): A float64 buffer of output_length(len(chunk))
+                samples to write the output into.
+
+        Returns:
+            np.ndarray: The L outputs of every chunk sample, which is `out` if it was given.
+
+        Raises:
+            ValueError: If the chunk is not a 1-D array or `out` is not a suitable buffer.
+        """
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if chunk.ndim != 1:
+            raise ValueError(
+                f"The chunk must be a 1-D array, got {chunk.ndim} dimensions."
+            )
+
+        size = chunk.size
+        out = prepare_output(
+            out, self.output_length(size), chunk, *self._delay_line.buffers
+        )
+        if size == 0:
+            return out
+
+        interpolate_kernel(
+            self._delay_line.load(chunk), self._kernel, out.reshape(size, self.factor)
+        )
+        self._delay_line.advance(size)
+
+        return out
+
+    def reset(self):
+        """
+        Clears the stream state, as if no sample had been processed.
+        """
+        self._delay_line.reset()
+
+    def snapshot(self) -> MultirateState:
+        """
+        Returns a copy of the stream state.
+
+        Returns:
+            MultirateState: The last J - 1 input samples, with a phase of 0 since
+                every input sample produces L outputs.
+        """
+        return {"history": self._delay_line.snapshot(), "phase": 0}
+
+    def restore(self, state: MultirateState):
+        """
+        Restores a state returned by snapshot().
+
+        Args:
+            state (MultirateState): The state to restore.
+
+        Raises:
+            ValueError: If the history does not have J - 1 samples or the phase is not 0.
+        """
+        if state["phase"] != 0:
+            raise ValueError("The phase of an interpolator must be 0.")
+
+        self._delay_line.restore(state["history"])
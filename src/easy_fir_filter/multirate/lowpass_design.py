@@ -0,0 +1,64 @@
+"""
+This module contains the design of the lowpass filters used by the multirate filters.
+"""
+
+import math
+
+import numpy as np
+
+from easy_fir_filter.easy_fir_filter import EasyFirFilter
+from easy_fir_filter.types import FilterConf
+
+
+def design_lowpass(
+    filter_conf: FilterConf,
+    sampling_freq_hz: float,
+    stopband_freq_hz: float,
+    round_to: int = 4,
+) -> tuple[FilterConf, np.ndarray]:
+    """
+    Designs the lowpass filter of a multirate filter with EasyFirFilter.
+
+    The passband edge, the ripples and the window come from `filter_conf`, while the
+    filter type, the sampling frequency and the stopband edge are replaced, since they
+    follow from the rate change.
+
+    With the `half_band` option, which suits rate changes by 2 (a stopband edge of a
+    quarter of the filter rate), the stopband edge becomes F / 2 - fp, so the
+    transition band is symmetric around F / 4 and every other coefficient is zero.
+
+    Args:
+        filter_conf (FilterConf): The filter configuration providing the passband
+            frequency, the ripples and the window type.
+        sampling_freq_hz (float): The rate the filter runs at.
+        stopband_freq_hz (float): The stopband edge frequency.
+        round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+
+    Returns:
+        tuple[FilterConf, np.ndarray]: The lowpass configuration and its coefficients.
+
+    Raises:
+        ValueError: If the lowpass configuration is invalid, for example with a
+            passband edge above the stopband edge, or a half-band filter is requested
+            for a rate change other than by 2.
+    """
+    half_band = filter_conf.get("half_band", False)
+    if half_band:
+        if not math.isclose(stopband_freq_hz, sampling_freq_hz / 4):
+            raise ValueError("A half-band filter only suits a rate change by 2.")
+        stopband_freq_hz = sampling_freq_hz / 2 - filter_conf["passband_freq_hz"]
+
+    lowpass_conf: FilterConf = {
+        "filter_type": "lowpass",
+        "window_type": filter_conf["window_type"],
+        "passband_ripple_db": filter_conf["passband_ripple_db"],
+        "stopband_attenuation_db": filter_conf["stopband_attenuation_db"],
+        "passband_freq_hz": filter_conf["passband_freq_hz"],
+        "stopband_freq_hz": stopband_freq_hz,
+        "sampling_freq_hz": sampling_freq_hz,
+    }
+    if half_band:
+        lowpass_conf["half_band"] = True
+    coefficients = EasyFirFilter(lowpass_conf, round_to).calculate_filter()
+
+    return lowpass_conf, np.array(coefficients, dtype=np.float64)
@@ -0,0 +1,285 @@
+"""
+This module contains the multistage decimation planner and the MultistageDecimator
+class, a cascade of polyphase decimators.
+"""
+
+import math
+
+import numpy as np
+
+from easy_fir_filter.filtering.output_window import prepare_output
+from easy_fir_filter.multirate.decimator import Decimator
+from easy_fir_filter.types import FilterConf, MultirateState
+
+
+class MultistageDecimator:
+    """
+    Reduces the sampling rate of a signal by a cascade of decimators.
+
+    The total factor is the product of the stage factors. The cascade works one-shot,
+    with decimate(), or on a stream of chunks of any size, with process(), where each
+    stage streams its outputs into the next one.
+
+    Attributes:
+        stages (list[Decimator]): The decimators, first stage first.
+        factor (int): The total decimation factor.
+        cost (float): The multiply-accumulates per output sample, see decimation_cost.
+    """
+
+    def __init__(self, stages: list[Decimator]):
+        """
+        Initializes the cascade.
+
+        Args:
+            stages (list[Decimator]): The decimators, first stage first.
+
+        Raises:
+            ValueError: If there are no stages.
+        """
+        if not stages:
+            raise ValueError("A multistage decimator needs at least one stage.")
+
+        self.stages = stages
+        self.factor = int(np.prod([stage.factor for stage in stages]))
+        self.cost = decimation_cost(stages)
+
+        # Outputs of every stage but the last, which feed the next stage
+        self._buffers = [np.empty(0) for _ in stages[:-1]]
+
+    def output_length(self, chunk_size: int) -> int:
+        """
+        Returns the number of outputs process() produces for the next chunk.
+
+        Args:
+            chunk_size (int): The length of the next chunk.
+
+        Returns:
+            int: The number of outputs.
+        """
+        for stage in self.stages:
+            chunk_size = stage.output_length(chunk_size)
+
+        return chunk_size
+
+    def decimate(self, signal: np.ndarray | list[float]) -> np.ndarray:
+        """
+        Decimates a whole signal, independently of the stream state.
+
+        Args:
+            signal (np.ndarray | list[float]): The 1-D signal at the input rate.
+
+        Returns:
+            np.ndarray: The ceil(L / M) output samples.
+
+        Raises:
+            ValueError: If the signal is not a non-empty 1-D array.
+        """
+        for stage in self.stages:
+            signal = stage.decimate(signal)
+
+        return signal
+
+    def process(
+        self, chunk: np.ndarray | list[float], out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Decimates the next chunk of the stream.
+
+        Args:
+            chunk (np.ndarray | list[float]): The next samples of the 1-D signal.
+            out (np.ndarray, optional): A float64 buffer of output_length(len(chunk))
+                samples to write the output into.
+
+        Returns:
+            np.ndarray: The outputs that fall in this chunk, which is `out` if it was given.
+
+        Raises:
+            ValueError: If the chunk is not a 1-D array or `out` is not a suitable buffer.
+        """
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if chunk.ndim != 1:
+            raise ValueError(
+                f"The chunk must be a 1-D array, got {chunk.ndim} dimensions."
+            )
+
+        out = prepare_output(out, self.output_length(chunk.size), chunk)
+
+        for i, stage in enumerate(self.stages[:-1]):
+            size = stage.output_length(chunk.size)
+            if size > self._buffers[i].size:
+                self._buffers[i] = np.empty(max(size, 2 * self._buffers[i].size))
+            chunk = stage.process(chunk, out=self._buffers[i][:size])
+
+        return self.stages[-1].process(chunk, out=out)
+
+    def reset(self):
+        """
+        Clears the stream state of every stage.
+        """
+        for stage in self.stages:
+            stage.reset()
+
+    def snapshot(self) -> list[MultirateState]:
+        """
+        Returns a copy of the stream state.
+
+        Returns:
+            list[MultirateState]: The state of every stage, first stage first.
+        """
+        return [stage.snapshot() for stage in self.stages]
+
+    def restore(self, state: list[MultirateState]):
+        """
+        Restores a state returned by snapshot().
+
+        Args:
+            state (list[MultirateState]): The state of every stage.
+
+        Raises:
+            ValueError: If the number of states does not match the number of stages,
+                or a stage state is invalid.
+        """
+        if len(state) != len(self.stages):
+            raise ValueError(
+                f"The state must have {len(self.stages)} stages, got {len(state)}."
+            )
+
+        for stage, stage_state in zip(self.stages, state):
+            stage.restore(stage_state)
+
+
+def decimation_cost(stages: list[Decimator]) -> float:
+    """
+    Returns the multiply-accumulates per output sample of a cascade of decimators.
+
+    Each output of stage i costs the T_i nonzero taps of its branch matrix, without
+    the zero padding of the last branches and the zero taps of half-band filters,
+    and the stage produces F_(i + 1) / F_out outputs per output of the cascade:
+        cost = sum(T_i * F_(i + 1) / F_out)
+    Where:
+        F_(i + 1) / F_out = M_(i + 1) * ... * M_K
+
+    Args:
+        stages (list[Decimator]): The decimators, first stage first.
+
+    Returns:
+        float: The multiply-accumulates per output sample.
+    """
+    cost = 0.0
+    later = 1
+    for stage in reversed(stages):
+        cost += np.count_nonzero(stage.branches) * later
+        later *= stage.factor
+
+    return cost
+
+
+def plan_decimation(
+    factor: int,
+    filter_conf: FilterConf,
+    round_to: int = 4,
+    max_stages: int = 3,
+) -> MultistageDecimator:
+    """
+    Finds the cascade of decimators with the lowest cost for a decimation factor.
+
+    Every ordering of every factorization of the factor into at most `max_stages`
+    factors is designed, including the single stage. Each stage only has to remove
+    the frequencies that would alias into the final passband, so stage i, decimating
+    from F_i to F_(i + 1), has the relaxed stopband edge:
+        fs_i = F_(i + 1) - F_out / 2
+    which is F_out / 2 for the last stage. The passband ripple of the cascade is the
+    sum of the stage ripples in dB, so each of the K stages gets Ap / K, and every
+    stage keeps the stopband attenuation. The `half_band` option only applies to
+    the stages whose relaxed stopband edge is a quarter of their rate, and is
+    dropped from the others.
+
+    Args:
+        factor (int): The total decimation factor (M).
+        filter_conf (FilterConf): The input sampling frequency, passband edge,
+            ripples and window of the anti-aliasing filter.
+        round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+        max_stages (int, optional): The largest number of stages. Defaults to 3.
+
+    Returns:
+        MultistageDecimator: The cascade with the fewest multiply-accumulates per
+            output sample, see decimation_cost.
+
+    Raises:
+        ValueError: If the factor or max_stages is lower than 1, or no cascade can
+            be designed, for example with a passband edge above F / (2 * M).
+    """
+    if not isinstance(factor, (int, np.integer)) or factor < 1:
+        raise ValueError("The decimation factor must be an integer of at least 1.")
+    if max_stages < 1:
+        raise ValueError("The maximum number of stages must be at least 1.")
+
+    sampling_freq_hz = filter_conf["sampling_freq_hz"]
+    output_nyquist_hz = sampling_freq_hz / factor / 2
+
+    # Stages shared by several plans are only designed once
+    designs: dict[tuple[int, int, int], Decimator | None] = {}
+
+    def design_stage(before: int, stage_factor: int, count: int) -> Decimator | None:
+        key = (before, stage_factor, count)
+        if key not in designs:
+            stage_conf: FilterConf = {
+                **filter_conf,  # type: ignore
+                "sampling_freq_hz": sampling_freq_hz / before,
+                "passband_ripple_db": filter_conf["passband_ripple_db"] / count,
+            }
+            stopband_freq_hz = (
+                sampling_freq_hz / (before * stage_factor) - output_nyquist_hz
+            )
+            # Only a stage stopping at a quarter of its rate can be half-band
+            if not math.isclose(stopband_freq_hz, stage_conf["sampling_freq_hz"] / 4):
+                stage_conf.pop("half_band", None)
+            try:
+                designs[key] = Decimator(
+                    stage_factor, stage_conf, round_to, stopband_freq_hz
+                )
+            except ValueError:
+                designs[key] = None
+
+        return designs[key]
+
+    best: list[Decimator] | None = None
+    for factors in _ordered_factorizations(int(factor), max_stages):
+        stages = []
+        before = 1
+        for stage_factor in factors:
+            stage = design_stage(before, stage_factor, len(factors))
+            if stage is None:
+                break
+            stages.append(stage)
+            before *= stage_factor
+        else:
+            if best is None or decimation_cost(stages) < decimation_cost(best):
+                best = stages
+
+    if best is None:
+        raise ValueError(
+            f"No cascade of decimators can decimate by {factor} with this configuration."
+        )
+
+    return MultistageDecimator(best)
+
+
+def _ordered_factorizations(factor: int, max_stages: int) -> list[tuple[int, ...]]:
+    """
+    Returns every ordered factorization of `factor` into at most `max_stages` factors
+    of at least 2, or (1,) for a factor of 1.
+    """
+    if factor == 1:
+        return [(1,)]
+
+    factorizations = [(factor,)]
+    if max_stages > 1:
+        for first in range(2, factor):
+            if factor % first == 0:
+                factorizations += [
+                    (first,) + rest
+                    for rest in _ordered_factorizations(factor // first, max_stages - 1)
+                ]
+
+    return factorizations
@@ -0,0 +1,122 @@
+"""
+This module contains the polyphase decomposition of FIR coefficients and the
+polyphase kernels of the multirate filters.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def polyphase_branches(coefficients: np.ndarray, factor: int) -> np.ndarray:
+    """
+    Splits FIR coefficients into `factor` polyphase branches.
+
+    The branch matrix is:
+        E(k, j) = h(j * M + k) for k = 0 to M - 1 and j = 0 to J - 1
+    Where:
+        M = factor
+        J = ceil(N / M)
+    with the coefficients zero padded to J * M taps.
+
+    Args:
+        coefficients (np.ndarray): The 1-D FIR filter coefficients (h).
+        factor (int): The number of branches (M).
+
+    Returns:
+        np.ndarray: The (M, J) branch matrix.
+    """
+    taps = -(-coefficients.size // factor) * factor
+    padded = np.zeros(taps)
+    padded[: coefficients.size] = coefficients
+
+    return padded.reshape(-1, factor).T.copy()
+
+
+def decimate_kernel(
+    x: np.ndarray,
+    kernel: np.ndarray,
+    first: int,
+    out: np.ndarray,
+    product: np.ndarray,
+):
+    """
+    Computes the retained outputs of a filter followed by decimation, branch by branch.
+
+    `x` holds J * M - 1 past samples followed by the chunk, and the outputs are taken
+    at chunk indexes first, first + M, ... Viewing x[first:] as rows of M samples,
+    output r only reads the J rows before and including row r + J - 1, so:
+        y(r) = sum(rows[r + J - 1 - j] @ kernel[j]) for j = 0 to J - 1
+    Each term is a matrix-vector product over every output, and the dropped outputs
+    are never computed.
+
+    Args:
+        x (np.ndarray): The 1-D float64 history followed by the chunk.
+        kernel (np.ndarray): The (J, M) matrix kernel[j, q] = h(j * M + M - 1 - q),
+            which is the branch matrix with reversed branches, transposed.
+        first (int): The chunk index of the first retained output.
+        out (np.ndarray): The float64 buffer receiving the outputs.
+        product (np.ndarray): A float64 scratch buffer with the shape of `out`.
+    """
+    branches, factor = kernel.shape
+    outputs = out.size
+    rows = x[first : first + (outputs + branches - 1) * factor].reshape(-1, factor)
+
+    out.fill(0.0)
+    for j in range(branches):
+        start = branches - 1 - j
+        np.dot(rows[start : start + outputs], kernel[j], out=product)
+        np.add(out, product, out=out)
+
+
+def sparse_decimate_kernel(
+    x: np.ndarray,
+    kernel: np.ndarray,
+    first: int,
+    out: np.ndarray,
+    product: np.ndarray,
+):
+    """
+    Computes the retained outputs like decimate_kernel, skipping the zero taps.
+
+    Each column q of the rows of M samples is filtered by column q of the kernel, one
+    nonzero tap at a time:
+        y(r) = sum(kernel[j, q] * rows[r + J - 1 - j, q]) for every nonzero kernel[j, q]
+    This does as many multiplications as there are nonzero taps, about half of the
+    matrix-vector products of decimate_kernel for a half-band filter decimating by 2.
+
+    Args:
+        x (np.ndarray): The 1-D float64 history followed by the chunk.
+        kernel (np.ndarray): The (J, M) kernel matrix of decimate_kernel.
+        first (int): The chunk index of the first retained output.
+        out (np.ndarray): The float64 buffer receiving the outputs.
+        product (np.ndarray): A float64 scratch buffer with the shape of `out`.
+    """
+    branches, factor = kernel.shape
+    outputs = out.size
+    rows = x[first : first + (outputs + branches - 1) * factor].reshape(-1, factor)
+
+    out.fill(0.0)
+    for j, q in zip(*np.nonzero(kernel)):
+        start = branches - 1 - j
+        np.multiply(rows[start : start + outputs, q], kernel[j, q], out=product)
+        np.add(out, product, out=out)
+
+
+def interpolate_kernel(x: np.ndarray, kernel: np.ndarray, out: np.ndarray):
+    """
+    Computes the outputs of zero insertion followed by a filter, for every branch.
+
+    `x` holds J - 1 past samples followed by a chunk of C samples, and each input
+    sample produces L outputs, one per branch:
+        y(m * L + p) = sum(kernel[i, p] * x[m + i]) for i = 0 to J - 1
+    where x[m + i] is the chunk sample m - (J - 1 - i). The sliding windows of J
+    samples are a strided view of `x`, so all the outputs are a single matrix product
+    and the inserted zeros are never multiplied.
+
+    Args:
+        x (np.ndarray): The 1-D float64 history followed by the chunk.
+        kernel (np.ndarray): The (J, L) matrix kernel[i, p] = L * h((J - 1 - i) * L + p),
+            which is the transposed branch matrix with reversed rows, scaled by the gain.
+        out (np.ndarray): The (C, L) float64 buffer receiving the outputs.
+    """
+    np.matmul(sliding_window_view(x, kernel.shape[0]), kernel, out=out)
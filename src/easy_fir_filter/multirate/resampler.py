@@ -0,0 +1,225 @@
+"""
+This module contains the Resampler class, a polyphase rational sampling rate
+converter.
+"""
+
+from math import gcd
+
+import numpy as np
+
+from easy_fir_filter.filtering.delay_line import DelayLine
+from easy_fir_filter.filtering.output_window import as_signal, prepare_output
+from easy_fir_filter.multirate.lowpass_design import design_lowpass
+from easy_fir_filter.multirate.polyphase import decimate_kernel, polyphase_branches
+from easy_fir_filter.types import FilterConf, MultirateState
+
+
+class Resampler:
+    """
+    Changes the sampling rate of a signal by a rational factor L / M.
+
+    The signal is upsampled by L, filtered by a lowpass filter running at L * F, and
+    decimated by M. The stopband edge of the filter is the lowest of the input and
+    output Nyquist frequencies, F / 2 * min(1, L / M), and the filter is scaled by L,
+    the gain lost by the zero insertion. Output n reads a single branch of the filter,
+    with nM = mL + p:
+        y(n) = L * sum(h(j * L + p) * x(m - j)) for j = 0 to J - 1
+    so neither the inserted zeros nor the dropped outputs are ever computed. Since L
+    and M are coprime, the outputs n = r, r + L, r + 2L, ... share a branch and read
+    inputs M samples apart, so each of the L groups is computed as a decimation by M
+    of the input with that branch.
+
+    The resampler works one-shot, with resample(), or on a stream of chunks of any
+    size, with process(), where the output equals resampling the concatenated chunks.
+
+    Attributes:
+        up (int): The interpolation factor (L), divided by gcd(L, M).
+        down (int): The decimation factor (M), divided by gcd(L, M).
+        filter_conf (FilterConf): The configuration of the lowpass filter.
+        coefficients (np.ndarray): The lowpass filter coefficients (h), without the gain.
+        branches (np.ndarray): The (L, J) polyphase branch matrix, E(p, j) = h(j * L + p).
+    """
+
+    def __init__(
+        self,
+        up: int,
+        down: int,
+        filter_conf: FilterConf,
+        round_to: int = 4,
+        stopband_freq_hz: float | None = None,
+        max_chunk_size: int = 0,
+    ):
+        """
+        Initializes the resampler and designs its lowpass filter.
+
+        Args:
+            up (int): The interpolation factor (L).
+            down (int): The decimation factor (M).
+            filter_conf (FilterConf): The input sampling frequency, passband edge,
+                ripples and window of the lowpass filter. The filter type and stopband
+                edge are derived from the factors.
+            round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+            stopband_freq_hz (float, optional): Overrides the stopband edge,
+                F / 2 * min(1, L / M) by default.
+            max_chunk_size (int, optional): The expected largest input chunk, to
+                preallocate the buffers for. Defaults to 0, allocating on the first call.
+
+        Raises:
+            ValueError: If a factor is lower than 1, max_chunk_size is negative, or
+                the lowpass filter configuration is invalid.
+        """
+        for factor in (up, down):
+            if not isinstance(factor, (int, np.integer)) or factor < 1:
+                raise ValueError(
+                    "The resampling factors must be integers of at least 1."
+                )
+        if max_chunk_size < 0:
+            raise ValueError("The maximum chunk size cannot be negative.")
+
+        common = gcd(int(up), int(down))
+        self.up = int(up) // common
+        self.down = int(down) // common
+
+        sampling_freq_hz = filter_conf["sampling_freq_hz"]
+        if stopband_freq_hz is None:
+            stopband_freq_hz = sampling_freq_hz / 2 * min(1, self.up / self.down)
+
+        self.filter_conf, self.coefficients = design_lowpass(
+            filter_conf, sampling_freq_hz * self.up, stopband_freq_hz, round_to
+        )
+        self.branches = polyphase_branches(self.coefficients, self.up)
+
+        # One decimate_kernel matrix per branch, with the gain of the zero insertion
+        self._kernels = np.stack(
+            [
+                polyphase_branches(branch * self.up, self.down)[::-1].T
+                for branch in self.branches
+            ]
+        )
+        history = self._kernels.shape[1] * self.down - 1
+        self._delay_line = DelayLine(history, (), max_chunk_size)
+        self._product = np.empty(-(-max_chunk_size // self.down) + 1)
+        self._phase = 0
+
+    def output_length(self, chunk_size: int) -> int:
+        """
+        Returns the number of outputs process() produces for the next chunk.
+
+        Args:
+            chunk_size (int): The length of the next chunk.
+
+        Returns:
+            int: The number of outputs.
+        """
+        return max(-(-(chunk_size * self.up - self._phase) // self.down), 0)
+
+    def resample(self, signal: np.ndarray | list[float]) -> np.ndarray:
+        """
+        Resamples a whole signal, independently of the stream state.
+
+        Args:
+            signal (np.ndarray | list[float]): The 1-D signal at the input rate.
+
+        Returns:
+            np.ndarray: The ceil(len(signal) * L / M) output samples.
+
+        Raises:
+            ValueError: If the signal is not a non-empty 1-D array.
+        """
+        x = as_signal(signal)
+        history = self._delay_line.history
+        outputs = -(-x.size * self.up // self.down)
+
+        padded = np.zeros(history + x.size)
+        padded[history:] = x
+        out = np.empty(outputs)
+        self._resample_kernel(padded, 0, out, np.empty(-(-outputs // self.up)))
+
+        return out
+
+    def process(
+        self, chunk: np.ndarray | list[float], out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Resamples the next chunk of the stream.
+
+        Args:
+            chunk (np.ndarray | list[float]): The next samples of the 1-D signal.
+            out (np.ndarray, optional): A float64 buffer of output_length(len(chunk))
+                samples to write the output into.
+
+        Returns:
+            np.ndarray: The outputs that fall in this chunk, which is `out` if it was given.
+
+        Raises:
+            ValueError: If the chunk is not a 1-D array or `out` is not a suitable buffer.
+        """
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if chunk.ndim != 1:
+            raise ValueError(
+                f"The chunk must be a 1-D array, got {chunk.ndim} dimensions."
+            )
+
+        outputs = self.output_length(chunk.size)
+        out = prepare_output(out, outputs, chunk, *self._delay_line.buffers)
+        if chunk.size == 0:
+            return out
+
+        if chunk.size > self._delay_line.capacity:
+            self._delay_line.reserve(chunk.size)
+            self._product = np.empty(-(-self._delay_line.capacity // self.down) + 1)
+
+        buffer = self._delay_line.load(chunk)
+        self._resample_kernel(buffer, self._phase, out, self._product)
+        self._delay_line.advance(chunk.size)
+        self._phase = (self._phase - chunk.size * self.up) % self.down
+
+        return out
+
+    def reset(self):
+        """
+        Clears the stream state, as if no sample had been processed.
+        """
+        self._delay_line.reset()
+        self._phase = 0
+
+    def snapshot(self) -> MultirateState:
+        """
+        Returns a copy of the stream state.
+
+        Returns:
+            MultirateState: The last input samples and the position of the next
+                output, in samples at L * F, relative to the next input sample.
+        """
+        return {"history": self._delay_line.snapshot(), "phase": self._phase}
+
+    def restore(self, state: MultirateState):
+        """
+        Restores a state returned by snapshot().
+
+        Args:
+            state (MultirateState): The state to restore.
+
+        Raises:
+            ValueError: If the history does not have the length returned by
+                snapshot() or the phase is not between 0 and M - 1.
+        """
+        if not 0 <= state["phase"] < self.down:
+            raise ValueError(f"The phase must be between 0 and {self.down - 1}.")
+
+        self._delay_line.restore(state["history"])
+        self._phase = int(state["phase"])
+
+    def _resample_kernel(
+        self, x: np.ndarray, phase: int, out: np.ndarray, product: np.ndarray
+    ):
+        """
+        Computes the outputs of a chunk, one group of outputs sharing a branch at a time.
+
+        Output r of the chunk falls at position phase + r * M of the chunk at L * F,
+        which is input m = (phase + r * M) // L with branch p = (phase + r * M) % L.
+        """
+        for r in range(min(self.up, out.size)):
+            m, p = divmod(phase + r * self.down, self.up)
+            group = out[r :: self.up]
+            decimate_kernel(x, self._kernels[p], m, group, product[: group.size])
@@ -0,0 +1,3 @@
+from easy_fir_filter.phase.minimum_phase import minimum_phase, passband_latency
+
+__all__ = ["minimum_phase", "passband_latency"]
@@ -0,0 +1,110 @@
+"""
+This module contains the conversion of linear-phase FIR filters to minimum phase,
+and the measurement of their latency.
+"""
+
+import numpy as np
+
+from easy_fir_filter.analysis import filter_bands, frequency_response
+from easy_fir_filter.types import FilterConf
+from easy_fir_filter.utils import truncate_array
+
+# Smallest FFT size of the cepstrum, and FFT points per filter tap
+_MIN_FFT_SIZE = 1 << 16
+_FFT_POINTS_PER_TAP = 64
+# Floor of the magnitude response relative to its peak, where the logarithm diverges
+_MAGNITUDE_FLOOR = 1e-10
+# Grid size of the group delay measurement
+_GROUP_DELAY_POINTS = 8192
+
+
+def minimum_phase(
+    coefficients: np.ndarray | list[float],
+    round_to: int = 4,
+    n_fft: int | None = None,
+) -> np.ndarray:
+    """
+    Converts a filter to the minimum-phase filter with the same magnitude response.
+
+    The homomorphic (cepstral) method folds the real cepstrum of the magnitude
+    response onto positive quefrencies, which reflects every zero outside the unit
+    circle inside it:
+        c = IFFT(log|H|)
+        c_min(0) = c(0), c_min(k) = 2 * c(k) for 0 < k < M / 2, c_min(M / 2) = c(M / 2)
+        h_min = IFFT(exp(FFT(c_min)))
+    The result keeps the N taps of the input, where its energy is concentrated, so
+    the magnitude response is kept up to the cepstrum aliasing, which the large FFT
+    size makes negligible, and the truncation to `round_to` decimals.
+
+    Args:
+        coefficients (np.ndarray | list[float]): The linear-phase FIR filter coefficients.
+        round_to (int, optional): The number of decimal places to round coefficients to. Defaults to 4.
+        n_fft (int, optional): The FFT size (M). Defaults to 64 points per tap, and at
+            least 65536.
+
+    Returns:
+        np.ndarray: The N minimum-phase coefficients.
+
+    Raises:
+        ValueError: If the coefficients are empty or all zero, or n_fft is lower
+            than twice the number of taps.
+    """
+    h = np.asarray(coefficients, dtype=np.float64)
+    if h.size == 0 or not np.any(h):
+        raise ValueError("The coefficients must have at least one nonzero tap.")
+
+    if n_fft is None:
+        n_fft = max(
+            _MIN_FFT_SIZE, 1 << int(np.ceil(np.log2(_FFT_POINTS_PER_TAP * h.size)))
+        )
+    if n_fft < 2 * h.size:
+        raise ValueError(
+            f"The FFT size must be at least twice the number of taps, got {n_fft}."
+        )
+
+    magnitude = np.abs(np.fft.rfft(h, n_fft))
+    cepstrum = np.fft.irfft(
+        np.log(np.maximum(magnitude, _MAGNITUDE_FLOOR * magnitude.max())), n_fft
+    )
+
+    folded = np.zeros(n_fft)
+    folded[0] = cepstrum[0]
+    folded[1 : n_fft // 2] = 2 * cepstrum[1 : n_fft // 2]
+    folded[n_fft // 2] = cepstrum[n_fft // 2]
+
+    h_min = np.fft.irfft(np.exp(np.fft.rfft(folded)), n_fft)[: h.size]
+
+    return truncate_array(h_min, round_to)
+
+
+def passband_latency(
+    coefficients: np.ndarray | list[float],
+    filter_conf: FilterConf,
+    n_points: int = _GROUP_DELAY_POINTS,
+) -> float:
+    """
+    Measures the latency of a filter as its mean group delay over the passbands.
+
+    The group delay comes from analysis.frequency_response, and is (N - 1) / 2
+    samples at every frequency for a linear-phase filter.
+
+    Args:
+        coefficients (np.ndarray | list[float]): The FIR filter coefficients.
+        filter_conf (FilterConf): The filter configuration with the passband edges.
+        n_points (int, optional): The FFT size. Defaults to 8192.
+
+    Returns:
+        float: The mean passband group delay in samples.
+    """
+    h = np.asarray(coefficients, dtype=np.float64)
+    response = frequency_response(
+        h, filter_conf["sampling_freq_hz"], max(n_points, h.size)
+    )
+
+    passbands, _ = filter_bands(filter_conf)
+    frequencies = response["frequencies_hz"]
+    in_passband = np.zeros(frequencies.size, dtype=bool)
+    for low, high in passbands:
+        in_passband |= (frequencies >= low) & (frequencies <= high)
+
+    return float(np.nanmean(response["group_delay_samples"][in_passband]))
@@ -1,3 +1,24 @@
+from .cache_stats import CacheStats, DiskCacheStats
+from .convolution_mode import ConvolutionMode, FilteringMethod
 from .fir_filter_conf import FilterConf, FilterType, FilterWindow
+from .frequency_response import FrequencyResponse
+from .multirate_state import MultirateState
+from .spec_measurement import SpecMeasurement
+from .spec_verification import SpecVerification
+from .stage_record import DesignStage, StageRecord
 
-__all__ = ["FilterConf", "FilterType", "FilterWindow"]
+__all__ = [
+    "CacheStats",
+    "ConvolutionMode",
+    "DesignStage",
+    "DiskCacheStats",
+    "FilterConf",
+    "FilterType",
+    "FilterWindow",
+    "FilteringMethod",
+    "FrequencyResponse",
+    "MultirateState",
+    "SpecMeasurement",
+    "SpecVerification",
+    "StageRecord",
+]
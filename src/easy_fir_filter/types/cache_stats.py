@@ -0,0 +1,53 @@
+"""
+This file contains the definition of the design cache statistics type.
+"""
+
+from typing import TypedDict
+
+
+class CacheStats(TypedDict):
+    """
+    This class represents the counters of a design cache.
+    """
+
+    hits: int
+    """Number of designs served from the cache."""
+
+    misses: int
+    """Number of designs that had to be calculated."""
+
+    evictions: int
+    """Number of entries removed to respect the maximum size."""
+
+    size: int
+    """Number of entries currently stored."""
+
+    max_size: int
+    """Maximum number of entries the cache can store."""
+
+
+class DiskCacheStats(TypedDict):
+    """
+    This class represents the counters and usage of an on-disk design cache.
+
+    The hit, miss and eviction counters belong to the current process, while the
+    entry count and size describe the shared cache directory.
+    """
+
+    hits: int
+    """Number of designs loaded from disk by this process."""
+
+    misses: int
+    """Number of designs this process had to calculate."""
+
+    evictions: int
+    """Number of entries this process removed to respect the maximum size."""
+
+    entries: int
+    """Number of entries currently stored in the directory."""
+
+    size_bytes: int
+    """Total size in bytes of the stored entries."""
+
+    max_bytes: int
+    """Maximum total size in bytes of the stored entries."""
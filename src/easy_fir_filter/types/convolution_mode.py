@@ -0,0 +1,18 @@
+"""
+This file contains the definitions of the convolution output modes and filtering engines.
+"""
+
+from typing import Literal
+
+ConvolutionMode = Literal["full", "same", "valid"]
+"""
+Size of the filtered output, with the same meaning as in numpy.convolve:
+    - full: Every point of overlap between the signal and the coefficients.
+    - same: As long as the longest input, centered on the full output.
+    - valid: Only the points where the signal and the coefficients overlap completely.
+"""
+
+FilteringMethod = Literal["direct", "fft"]
+"""
+Filtering engine: the direct-form convolution or the FFT overlap-add method.
+"""
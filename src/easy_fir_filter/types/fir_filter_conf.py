@@ -5,7 +5,7 @@ This file contains the definitions of fir filter types.
 from typing import Literal, NotRequired, TypedDict
 
 FilterType = Literal["bandstop", "lowpass", "highpass", "bandpass"]
-FilterWindow = Literal["hamming", "blackman", "kaiser"]
+FilterWindow = Literal["hamming", "blackman", "kaiser", "equiripple"]
 
 
 class FilterConf(TypedDict):
@@ -17,7 +17,7 @@ class FilterConf(TypedDict):
     """Type of filter (e.g., lowpass, highpass, bandpass, bandstop)."""
 
     window_type: FilterWindow
-    """Type of window used for filter design (e.g., Hamming, Hamming, Blackman)."""
+    """Type of window used for filter design (e.g., Hamming, Hamming, Blackman), or "equiripple"."""
 
     passband_ripple_db: float  # Ap
     """Maximum allowable passband ripple in decibels (dB)."""
@@ -39,3 +39,9 @@ class FilterConf(TypedDict):
 
     passband_freq2_hz: NotRequired[float]  # fp2
     """Upper passband edge frequency in Hz (required for passband/stopband filters)."""
+
+    half_band: NotRequired[bool]
+    """Whether to design a half-band lowpass filter, with fp + fs = F / 2 (lowpass only)."""
+
+    minimum_phase: NotRequired[bool]
+    """Whether to convert the design to minimum phase, keeping its magnitude response."""
@@ -0,0 +1,25 @@
+"""
+This file contains the definition of the frequency response of a designed filter.
+"""
+
+from typing import TypedDict
+
+import numpy as np
+
+
+class FrequencyResponse(TypedDict):
+    """
+    This class represents the frequency response of a filter on a real FFT grid.
+    """
+
+    frequencies_hz: np.ndarray
+    """The n_points // 2 + 1 grid frequencies in Hz, from 0 to the Nyquist frequency."""
+
+    magnitude_db: np.ndarray
+    """The magnitude response in decibels (dB), -inf at the zeros of the response."""
+
+    phase_rad: np.ndarray
+    """The unwrapped phase response in radians."""
+
+    group_delay_samples: np.ndarray
+    """The group delay in samples, NaN at the zeros of the response."""
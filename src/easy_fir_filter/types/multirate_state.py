@@ -0,0 +1,19 @@
+"""
+This file contains the definition of the state of the streaming multirate filters.
+"""
+
+from typing import TypedDict
+
+import numpy as np
+
+
+class MultirateState(TypedDict):
+    """
+    This class represents the state of a streaming decimator, interpolator or resampler.
+    """
+
+    history: np.ndarray
+    """The last input samples, oldest first."""
+
+    phase: int
+    """The position of the next output relative to the next input sample."""
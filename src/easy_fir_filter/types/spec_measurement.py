@@ -0,0 +1,18 @@
+"""
+This file contains the definition of the measured specification of a designed filter.
+"""
+
+from typing import TypedDict
+
+
+class SpecMeasurement(TypedDict):
+    """
+    This class represents the passband ripple and stopband attenuation measured on
+    the frequency response of a filter.
+    """
+
+    passband_ripple_db: float
+    """Peak-to-peak magnitude variation over the passbands in decibels (dB)."""
+
+    stopband_attenuation_db: float
+    """Attenuation of the largest stopband magnitude in decibels (dB)."""
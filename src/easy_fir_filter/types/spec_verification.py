@@ -0,0 +1,28 @@
+"""
+This file contains the definition of the spec verification of many designed filters.
+"""
+
+from typing import TypedDict
+
+import numpy as np
+
+
+class SpecVerification(TypedDict):
+    """
+    This class represents the measured specification of many filters, one entry per filter.
+    """
+
+    passband_ripple_db: np.ndarray
+    """Peak-to-peak magnitude variation over the passbands in decibels (dB)."""
+
+    stopband_attenuation_db: np.ndarray
+    """Attenuation of the largest stopband magnitude in decibels (dB)."""
+
+    passband_margin_db: np.ndarray
+    """Required minus measured passband ripple, negative when the ripple is too large."""
+
+    stopband_margin_db: np.ndarray
+    """Measured minus required stopband attenuation, negative when the attenuation is too low."""
+
+    passed: np.ndarray
+    """Whether both margins are non-negative."""
@@ -0,0 +1,41 @@
+"""
+This file contains the definitions of the instrumentation records of the design stages.
+"""
+
+from typing import Literal, TypedDict
+
+DesignStage = Literal[
+    "validation",
+    "delta",
+    "ripples",
+    "d_parameter",
+    "order",
+    "equiripple",
+    "minimum_order",
+    "impulse_response",
+    "window",
+    "coefficients",
+    "minimum_phase",
+]
+"""
+Stage of the EasyFirFilter design process, in the order they run. Only the stages
+that apply to the configuration are recorded.
+"""
+
+
+class StageRecord(TypedDict):
+    """
+    This class represents the measurements of one stage of a filter design.
+    """
+
+    stage: DesignStage
+    """The design stage."""
+
+    seconds: float
+    """Wall time of the stage in seconds."""
+
+    taps: int | None
+    """Filter length (N) at the end of the stage, None before the order is known."""
+
+    peak_bytes: int | None
+    """Peak memory allocated during the stage, None unless memory tracing is enabled."""
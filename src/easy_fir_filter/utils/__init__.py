@@ -1,5 +1,14 @@
-from easy_fir_filter.utils.build_filter_coefficients import \
-    build_filter_coefficients
-from easy_fir_filter.utils.truncate import truncate
+from easy_fir_filter.utils.bessel_i0 import bessel_i0
+from easy_fir_filter.utils.build_filter_coefficients import (
+    build_filter_coefficients,
+    build_symmetric_coefficients,
+)
+from easy_fir_filter.utils.truncate import truncate, truncate_array
 
-__all__ = ["truncate", "build_filter_coefficients"]
+__all__ = [
+    "truncate",
+    "truncate_array",
+    "build_filter_coefficients",
+    "build_symmetric_coefficients",
+    "bessel_i0",
+]
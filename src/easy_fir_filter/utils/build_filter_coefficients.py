@@ -1,10 +1,12 @@
 """
-This module provides a function to build the symmetric FIR filter coefficients.
+This module provides functions to build the symmetric FIR filter coefficients.
 
-The function processes the given FIR filter coefficients to ensure symmetry
+The functions process the given FIR filter coefficients to ensure symmetry
 and handle small numerical errors, such as negative zero values.
 """
 
+import numpy as np
+
 
 def build_filter_coefficients(fir_coefficients: list[float]) -> list[float]:
     """
@@ -45,3 +47,61 @@ def build_filter_coefficients(fir_coefficients: list[float]) -> list[float]:
         cont += 1
 
     return ordered
+
+
+def build_symmetric_coefficients(
+    window_coefficients: np.ndarray,
+    impulse_response_coefficients: np.ndarray,
+    decimals: int,
+) -> np.ndarray:
+    """
+    Builds the symmetric FIR filter coefficients from the window and impulse response.
+
+    The products w(i) * h(i) for i = 0 to n are truncated to `decimals` places in
+    place, written directly into the center-to-start half of a preallocated 2n + 1
+    array and mirrored into the other half. The values are bit-identical to calling
+    `truncate` on every product, with -0.0 turned into 0.0.
+
+    Args:
+        window_coefficients (np.ndarray): The n + 1 window coefficients, from the center.
+        impulse_response_coefficients (np.ndarray): The n + 1 impulse response
+            coefficients, from the center.
+        decimals (int): The number of decimal places to retain.
+
+    Returns:
+        np.ndarray: The 2n + 1 symmetric FIR filter coefficients.
+
+    Raises:
+        ValueError: If the number of decimals is negative or the halves have
+            different lengths.
+
+    Example:
+        >>> build_symmetric_coefficients(np.array([1.0, 0.5]), np.array([0.5, 0.25]), 4)
+        array([0.125, 0.5  , 0.125])
+    """
+    if decimals < 0:
+        raise ValueError("The number of decimals must be non-negative")
+
+    half = len(window_coefficients)
+    if len(impulse_response_coefficients) != half:
+        raise ValueError(
+            f"Got {half} window and {len(impulse_response_coefficients)} impulse "
+            "response coefficients."
+        )
+
+    coefficients = np.empty(max(2 * half - 1, 0))
+    left = coefficients[:half]
+    np.multiply(
+        np.asarray(window_coefficients, dtype=np.float64)[::-1],
+        np.asarray(impulse_response_coefficients, dtype=np.float64)[::-1],
+        out=left,
+    )
+    factor = 10.0**decimals
+    left *= factor
+    np.trunc(left, out=left)
+    left /= factor
+    # Adding 0.0 turns -0.0 into 0.0
+    left += 0.0
+    coefficients[half:] = left[-2::-1]
+
+    return coefficients
@@ -1,9 +1,11 @@
 """
-This module provides a function to truncate a floating-point number to a specified number of decimal places.
+This module provides functions to truncate floating-point numbers to a specified number of decimal places.
 """
 
 import math
 
+import numpy as np
+
 
 def truncate(number: float, decimals: int) -> float:
     """
@@ -31,3 +33,32 @@ def truncate(number: float, decimals: int) -> float:
         raise ValueError("The number of decimals must be non-negative")
     factor = 10.0**decimals
     return math.trunc(number * factor) / factor
+
+
+def truncate_array(values: np.ndarray, decimals: int) -> np.ndarray:
+    """
+    Truncates every element of an array to the specified number of decimal places.
+
+    This is the element-wise counterpart of `truncate`. It performs the same
+    operations in the same order, so each element is bit-identical to the
+    result of calling `truncate` on it.
+
+    Args:
+        values (np.ndarray): The values to truncate.
+        decimals (int): The number of decimal places to retain.
+
+    Returns:
+        np.ndarray: A new float64 array with the truncated values.
+
+    Raises:
+        ValueError: If the number of decimals is negative.
+
+    Example:
+        >>> truncate_array(np.array([3.14159, -0.00001]), 2)
+        array([3.14, 0.  ])
+    """
+    if decimals < 0:
+        raise ValueError("The number of decimals must be non-negative")
+    factor = 10.0**decimals
+    # Adding 0.0 turns the -0.0 produced by np.trunc into 0.0, as math.trunc does
+    return np.trunc(np.multiply(values, factor)) / factor + 0.0
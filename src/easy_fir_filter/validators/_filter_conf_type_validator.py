@@ -36,10 +36,18 @@ _OPTIONAL_KEYS: Dict[_optional_keys, tuple[type, ...]] = {
     "passband_freq2_hz": (float, int),
 }
 
+_option_keys = Literal["half_band", "minimum_phase"]
+
+# Define design options, which are never required, and their expected types
+_OPTION_KEYS: Dict[_option_keys, tuple[type, ...]] = {
+    "half_band": (bool,),
+    "minimum_phase": (bool,),
+}
+
 # Define valid values for filter_type
 _FILTER_TYPE_VALUES: list[str] = ["bandstop", "lowpass", "highpass", "bandpass"]
 # Define valid values for window_type
-_WINDOW_TYPE_VALUES: list[str] = ["hamming", "blackman", "kaiser"]
+_WINDOW_TYPE_VALUES: list[str] = ["hamming", "blackman", "kaiser", "equiripple"]
 
 
 class _FilterConfTypeValidator:
@@ -78,6 +86,7 @@ class _FilterConfTypeValidator:
         self._validate_required_keys()
         self._validate_values_types()
         self._validate_optional_keys()
+        self._validate_option_keys()
         self._validate_filter_type()
         self._validate_window_type()
 
@@ -129,6 +138,19 @@ class _FilterConfTypeValidator:
                         key, _OPTIONAL_KEYS[key][0], type(self.filter_conf[key])
                     )
 
+    def _validate_option_keys(self):
+        """
+        Validates the design options of the filter configuration.
+
+        This method checks if the design options present in the filter
+        configuration have the correct data types.
+        """
+        for key in _OPTION_KEYS.keys():
+            if key in self.filter_conf:
+                value = self.filter_conf[key]  # type: ignore
+                if not isinstance(value, _OPTION_KEYS[key]):
+                    raise InvalidTypeError(key, _OPTION_KEYS[key][0], type(value))
+
     def _validate_filter_type(self):
         """
         Validates the filter type of the filter configuration.
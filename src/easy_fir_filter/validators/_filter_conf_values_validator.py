@@ -5,6 +5,7 @@ The FilterConfValuesValidator ensures that the filter configuration parameters,
 meet the necessary criteria for a valid FIR filter design.
 """
 
+import math
 from typing import Literal
 
 from easy_fir_filter.types.fir_filter_conf import FilterConf
@@ -51,6 +52,7 @@ class _FilterConfValuesValidator:
         self._validate_ripples()
         self._validate_frequency_values()
         self._validate_frequencies_by_filter_type()
+        self._validate_half_band()
 
     def _extract_frequencies(self):
         """
@@ -162,6 +164,36 @@ class _FilterConfValuesValidator:
         elif filter_type not in ["lowpass", "highpass", "bandpass", "bandstop"]:
             raise ValueError(f"Unsupported filter type: {filter_type}")
 
+    def _validate_half_band(self):
+        """
+        Validates the half-band option.
+
+        A half-band filter is a lowpass filter whose transition band is symmetric
+        around F / 4, so fp + fs must equal F / 2.
+
+        Raises:
+            ValueError: If the half-band option is set for another filter type, with
+                the equiripple design, with minimum phase or with an asymmetric
+                transition band.
+        """
+        if not self.filter_conf.get("half_band", False):
+            return
+
+        if self.filter_conf["filter_type"] != "lowpass":
+            raise ValueError("Only lowpass filters can be half-band filters.")
+        if self.filter_conf["window_type"] == "equiripple":
+            raise ValueError("Half-band filters need a window type, not equiripple.")
+        if self.filter_conf.get("minimum_phase", False):
+            raise ValueError(
+                "Half-band filters cannot be minimum phase, which loses their zero taps."
+            )
+
+        fp1, _, fs1, _, F = self._extract_frequencies()
+        if not math.isclose(fp1 + fs1, F / 2):
+            raise ValueError(
+                f"For half-band filter, expected fp1 + fs1 = F / 2, got {fp1} + {fs1} != {F / 2}."
+            )
+
     def _validate_frequency_values(self):
         """
         Ensures frequency values are valid and within acceptable ranges.
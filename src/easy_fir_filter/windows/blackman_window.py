@@ -2,10 +2,10 @@
 This file contains the implementation of the Blackman window class.
 """
 
-import math
+import numpy as np
 
 from easy_fir_filter.interfaces.window_interface import IWindow
-from easy_fir_filter.utils import truncate
+from easy_fir_filter.utils import truncate_array
 
 
 class BlackmanWindow(IWindow):
@@ -26,12 +26,12 @@ class BlackmanWindow(IWindow):
             round_to (int, optional): Number of decimal places to round
                                       the window coefficients. Defaults to 4.
         """
-        self.window_coefficients = []
+        self.window_coefficients: np.ndarray = np.empty(0)
         self.round_to = round_to
 
     def calculate_window_coefficients(
         self, n: int, filter_length: int, AS: float | None = None
-    ) -> list[float]:
+    ) -> np.ndarray:
         """
         Computes the Blackman window coefficients.
 
@@ -47,19 +47,42 @@ class BlackmanWindow(IWindow):
             AS (float, optional): This parameter is not used by the Blackman window.
 
         Returns:
-            list[float]: List of Blackman window coefficients.
+            np.ndarray: The n + 1 Blackman window coefficients.
         """
         if n is None or filter_length is None:
             raise ValueError("Filter order and length must be provided.")
 
-        self.window_coefficients = [
-            truncate(
-                0.42
-                + 0.5 * math.cos((2 * math.pi * i) / (filter_length - 1))
-                + 0.08 * math.cos((4 * math.pi * i) / (filter_length - 1)),
-                self.round_to,
-            )
-            for i in range(n + 1)
-        ]
+        self.window_coefficients = self._window(
+            np.arange(n + 1), filter_length, round_to=self.round_to
+        )
 
         return self.window_coefficients
+
+    @staticmethod
+    def _window(
+        i: np.ndarray,
+        filter_length: int | np.ndarray,
+        alpha: float | np.ndarray | None = None,
+        round_to: int = 4,
+    ) -> np.ndarray:
+        """
+        Evaluates the Blackman window at the coefficient indexes `i`.
+
+        The filter length may be a scalar or an array broadcastable against `i`,
+        so the windows of several filters can be evaluated in a single call.
+
+        Args:
+            i (np.ndarray): Coefficient indexes (0 to n).
+            filter_length (int | np.ndarray): The total length of the filter (N).
+            alpha (float | np.ndarray, optional): Not used by the Blackman window.
+            round_to (int, optional): Number of decimal places to truncate to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The window coefficients.
+        """
+        return truncate_array(
+            0.42
+            + 0.5 * np.cos((2 * np.pi * i) / (filter_length - 1))
+            + 0.08 * np.cos((4 * np.pi * i) / (filter_length - 1)),
+            round_to,
+        )
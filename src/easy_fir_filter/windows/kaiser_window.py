@@ -2,10 +2,10 @@
 This file contains the implementation of the Kaiser window class.
 """
 
-import math
+import numpy as np
 
 from easy_fir_filter.interfaces.window_interface import IWindow
-from easy_fir_filter.utils import truncate
+from easy_fir_filter.utils import bessel_i0, truncate, truncate_array
 
 
 class KaiserWindow(IWindow):
@@ -27,11 +27,13 @@ class KaiserWindow(IWindow):
             round_to (int, optional): Number of decimal places to round
                                       the window coefficients. Defaults to 4.
         """
-        self.window_coefficients = []
+        self.window_coefficients: np.ndarray = np.empty(0)
         self.round_to = round_to
 
         self.alpha: float | None = None
-        self.betas = []
+        self.betas: np.ndarray = np.empty(0)
+        # The stopband attenuation alpha was calculated for
+        self._alpha_AS: float | None = None
 
     def _calculate_alpha_parameter(self, AS: float) -> float:
         """
@@ -56,10 +58,38 @@ class KaiserWindow(IWindow):
             )
         else:
             self.alpha = truncate(0.1102 * (AS - 8.7), self.round_to)
+        self._alpha_AS = AS
 
         return self.alpha
 
-    def _calculate_betas(self, n: int, filter_length: int) -> list[float]:
+    @staticmethod
+    def _alpha_parameters(AS: np.ndarray, round_to: int = 4) -> np.ndarray:
+        """
+        Calculates the alpha parameters of several windows at once.
+
+        This is the array counterpart of `_calculate_alpha_parameter`.
+
+        Args:
+            AS (np.ndarray): The stopband attenuations in dB.
+            round_to (int, optional): Number of decimal places to truncate to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The calculated alpha parameters.
+        """
+        # Clip so that the unused branches never raise a negative number to 0.4
+        excess = np.maximum(AS - 21, 0)
+
+        return np.where(
+            AS <= 21,
+            0.0,
+            np.where(
+                AS <= 50,
+                truncate_array((0.5842 * excess**0.4) + 0.07886 * excess, round_to),
+                truncate_array(0.1102 * (AS - 8.7), round_to),
+            ),
+        )
+
+    def _calculate_betas(self, n: int, filter_length: int) -> np.ndarray:
         """
         Calculates the beta values for each coefficient index.
 
@@ -70,24 +100,49 @@ class KaiserWindow(IWindow):
             filter_length (int): The total length of the filter (N).
 
         Returns:
-            list[float]: List of beta values.
+            np.ndarray: The n + 1 beta values.
         """
         if self.alpha is None:
             raise ValueError("Alpha parameter must be calculated first")
 
-        nc = 0
-        while nc <= n:
-            b = self.alpha * (1 - ((2 * nc) / (filter_length - 1)) ** 2) ** 0.5
-            self.betas.append(truncate(b, self.round_to))
-            nc = nc + 1
+        self.betas = self._betas(
+            np.arange(n + 1), filter_length, self.alpha, self.round_to
+        )
 
         return self.betas
 
+    @staticmethod
+    def _betas(
+        nc: np.ndarray,
+        filter_length: int | np.ndarray,
+        alpha: float | np.ndarray,
+        round_to: int = 4,
+    ) -> np.ndarray:
+        """
+        Evaluates the beta values at the coefficient indexes `nc`.
+
+        The formula used for calculating the betas is:
+            b = alpha * (1 - (2 * nc / (N - 1)) ** 2) ** 0.5
+
+        Args:
+            nc (np.ndarray): Coefficient indexes (0 to n).
+            filter_length (int | np.ndarray): The total length of the filter (N).
+            alpha (float | np.ndarray): The alpha parameter.
+            round_to (int, optional): Number of decimal places to truncate to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The beta values.
+        """
+        return truncate_array(
+            alpha * (1 - ((2 * nc) / (filter_length - 1)) ** 2) ** 0.5, round_to
+        )
+
     def _calculate_i_alpha(self, alpha: float) -> float:
         """
         Calculates the modified Bessel function of the first kind, I0(alpha).
 
         This function is used in the calculation of the Kaiser window coefficients.
+        See `bessel_i0` for the evaluation method and its accuracy.
 
         Args:
             alpha (float): The alpha parameter.
@@ -98,27 +153,17 @@ class KaiserWindow(IWindow):
         if alpha is None:
             raise ValueError("Alpha parameter must be provided")
 
-        if alpha == 0:
-            return 1
-
-        k = 1
-        result = 0
-        while k <= 25:
-            result += truncate(
-                ((1 / math.factorial(k)) * (alpha / 2) ** k) ** 2, self.round_to
-            )
-            k = k + 1
-
-        return result + 1
+        return float(bessel_i0(alpha))
 
     def calculate_window_coefficients(
         self, n: int, filter_length: int, AS: float = None
-    ) -> list[float]:
+    ) -> np.ndarray:
         """
         Computes the Kaiser window coefficients.
 
         The Kaiser window coefficients are calculated using the alpha parameter,
-        beta values, and the modified Bessel function of the first kind.
+        beta values, and the modified Bessel function of the first kind, which is
+        evaluated for all betas in a single call.
 
         Args:
             n (int): The filter order.
@@ -126,7 +171,7 @@ class KaiserWindow(IWindow):
             AS (float, optional): The stopband attenuation in dB. Defaults to None.
 
         Returns:
-            list[float]: List of Kaiser window coefficients.
+            np.ndarray: The n + 1 Kaiser window coefficients.
         """
         if n is None or filter_length is None:
             raise ValueError("Filter order (n) and filter length (N) must be provided")
@@ -134,17 +179,45 @@ class KaiserWindow(IWindow):
         if AS is None:
             raise ValueError("Stopband attenuation (AS) not provided")
 
-        # Calculate alpha
-        self._calculate_alpha_parameter(AS=AS)
+        # Calculate alpha, which only changes with AS and is kept across redesigns
+        if self.alpha is None or AS != self._alpha_AS:
+            self._calculate_alpha_parameter(AS=AS)
 
         # Calculate betas
         self._calculate_betas(n=n, filter_length=filter_length)
 
-        i_alpha = self._calculate_i_alpha(self.alpha)
-        for beta in self.betas:
-
-            self.window_coefficients.append(
-                truncate(self._calculate_i_alpha(beta) / i_alpha, self.round_to)
-            )
+        i_alpha = self._calculate_i_alpha(self.alpha)  # type: ignore
+        self.window_coefficients = truncate_array(
+            bessel_i0(self.betas) / i_alpha, self.round_to
+        )
 
         return self.window_coefficients
+
+    @staticmethod
+    def _window(
+        i: np.ndarray,
+        filter_length: int | np.ndarray,
+        alpha: float | np.ndarray | None = None,
+        round_to: int = 4,
+    ) -> np.ndarray:
+        """
+        Evaluates the Kaiser window at the coefficient indexes `i`.
+
+        The filter length and alpha may be scalars or arrays broadcastable against
+        `i`, so the windows of several filters can be evaluated in a single call.
+
+        Args:
+            i (np.ndarray): Coefficient indexes (0 to n).
+            filter_length (int | np.ndarray): The total length of the filter (N).
+            alpha (float | np.ndarray): The alpha parameter of each window.
+            round_to (int, optional): Number of decimal places to truncate to. Defaults to 4.
+
+        Returns:
+            np.ndarray: The window coefficients.
+        """
+        if alpha is None:
+            raise ValueError("Alpha parameter must be provided")
+
+        betas = KaiserWindow._betas(i, filter_length, alpha, round_to)
+
+        return truncate_array(bessel_i0(betas) / bessel_i0(alpha), round_to)
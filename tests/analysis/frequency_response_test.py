@@ -0,0 +1,78 @@
+"""
+This file contains the tests for the frequency response analyzer.
+"""
+
+import numpy as np
+import pytest
+from scipy.signal import freqz, group_delay
+
+from easy_fir_filter import EasyFirFilter, FilterConf
+from easy_fir_filter.analysis import frequency_response
+from easy_fir_filter.phase import minimum_phase
+
+lowpass_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "kaiser",
+    "sampling_freq_hz": 8000,
+    "passband_freq_hz": 1000,
+    "stopband_freq_hz": 1500,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 60,
+}
+
+
+class TestFrequencyResponse:
+    """
+    Tests for the frequency_response function and EasyFirFilter.frequency_response.
+    """
+
+    @pytest.fixture
+    def coefficients(self) -> np.ndarray:
+        """
+        Returns the minimum-phase version of a lowpass design, with a varying group delay.
+        """
+        return minimum_phase(EasyFirFilter(lowpass_conf, 7).calculate_filter(), 7)
+
+    def test_matches_scipy(self, coefficients):
+        """
+        Test that the magnitude, phase and group delay match scipy.signal.
+        """
+        response = frequency_response(coefficients, 8000, 1024)
+        frequencies, h = freqz(coefficients, worN=513, include_nyquist=True, fs=8000)
+        _, delay = group_delay((coefficients, [1.0]), w=frequencies, fs=8000)
+
+        np.testing.assert_allclose(response["frequencies_hz"], frequencies)
+        np.testing.assert_allclose(
+            response["magnitude_db"], 20 * np.log10(np.abs(h)), atol=1e-9
+        )
+        np.testing.assert_allclose(
+            response["phase_rad"], np.unwrap(np.angle(h)), atol=1e-9
+        )
+        passband = frequencies <= 1000
+        np.testing.assert_allclose(
+            response["group_delay_samples"][passband], delay[passband], atol=1e-6
+        )
+
+    def test_too_few_points(self, coefficients):
+        """
+        Test that fewer points than taps raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            frequency_response(coefficients, 8000, coefficients.size - 1)
+
+    def test_cached_per_size_until_the_next_design(self):
+        """
+        Test that EasyFirFilter returns the same read-only response for a size,
+        and a new one after a new design.
+        """
+        easy_fir_filter = EasyFirFilter(lowpass_conf)
+        response = easy_fir_filter.frequency_response(2048)
+
+        assert easy_fir_filter.frequency_response(2048) is response
+        assert easy_fir_filter.frequency_response(4096) is not response
+        assert response["magnitude_db"].size == 1025
+        assert not response["magnitude_db"].flags.writeable
+        np.testing.assert_allclose(response["group_delay_samples"][:200], 29)
+
+        easy_fir_filter.calculate_filter()
+        assert easy_fir_filter.frequency_response(2048) is not response
@@ -0,0 +1,115 @@
+"""
+This file contains the tests for the minimum order search.
+"""
+
+import numpy as np
+import pytest
+from scipy.signal import firwin
+
+from easy_fir_filter import FilterConf
+from easy_fir_filter.analysis import measure_spec, meets_spec, minimum_order
+
+lowpass_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "hamming",
+    "sampling_freq_hz": 8000,
+    "passband_freq_hz": 1000,
+    "stopband_freq_hz": 1500,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 50,
+}
+
+
+def hamming_design(n: int) -> np.ndarray:
+    """
+    Returns the Hamming window lowpass design of order n.
+    """
+    return firwin(2 * n + 1, 1250, fs=8000)
+
+
+def meets(n: int) -> bool:
+    """
+    Returns whether the design of order n meets the lowpass configuration.
+    """
+    return meets_spec(measure_spec(hamming_design(n), lowpass_conf), lowpass_conf)
+
+
+class TestMinimumOrder:
+    """
+    Tests for the minimum_order function.
+    """
+
+    def test_shrinks_a_long_estimate(self):
+        """
+        Test that an estimate meeting the specification shrinks to the lowest meeting order.
+        """
+        n = minimum_order(60, hamming_design, lowpass_conf)
+
+        assert n < 60
+        assert meets(n)
+        assert not meets(n - 1)
+
+    def test_grows_a_short_estimate(self):
+        """
+        Test that an estimate failing the specification grows to the lowest meeting order.
+        """
+        n = minimum_order(10, hamming_design, lowpass_conf, max_order=40)
+
+        assert n > 10
+        assert meets(n)
+        assert not meets(n - 1)
+
+    def test_step_keeps_the_parity(self):
+        """
+        Test that a step of 2 only tries orders with the parity of the estimate.
+        """
+        tried = []
+
+        def design(n: int) -> np.ndarray:
+            tried.append(n)
+            return hamming_design(n)
+
+        n = minimum_order(61, design, lowpass_conf, step=2)
+
+        assert all(order % 2 == 1 for order in tried)
+        assert meets(n)
+        assert not meets(n - 2)
+
+    def test_unreachable_specification(self):
+        """
+        Test that the estimate is returned when no order up to max_order meets the specification.
+        """
+        unreachable: FilterConf = {**lowpass_conf, "stopband_attenuation_db": 90}
+
+        assert minimum_order(20, hamming_design, unreachable) == 20
+
+    @pytest.mark.parametrize("n, step", [(1, 1), (2, 2), (3, 2)])
+    def test_never_designs_order_zero(self, n, step):
+        """
+        Test that order 1 is the lowest candidate, as a single tap has no window.
+        """
+        orders = []
+
+        def design(order: int) -> np.ndarray:
+            orders.append(order)
+            return firwin(2 * order + 1, 2000, fs=8000)
+
+        # Met by every order from 1
+        lenient: FilterConf = {
+            **lowpass_conf,
+            "passband_freq_hz": 500,
+            "stopband_freq_hz": 3500,
+            "passband_ripple_db": 3,
+            "stopband_attenuation_db": 1.5,
+        }
+
+        assert minimum_order(n, design, lenient, step) in (1, 2)
+        assert min(orders) >= 1
+
+    @pytest.mark.parametrize("n, step", [(-1, 1), (10, 0)])
+    def test_invalid_arguments(self, n, step):
+        """
+        Test that a negative order or a step lower than 1 raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            minimum_order(n, hamming_design, lowpass_conf, step)
@@ -0,0 +1,112 @@
+"""
+This file contains the tests for the measurement of passband ripple and stopband attenuation.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from scipy.signal import firwin
+
+from easy_fir_filter import FilterConf
+from easy_fir_filter.analysis import filter_bands, measure_spec, meets_spec
+
+lowpass_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "hamming",
+    "sampling_freq_hz": 8000,
+    "passband_freq_hz": 1000,
+    "stopband_freq_hz": 1500,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 50,
+}
+
+bandstop_conf: FilterConf = {
+    "filter_type": "bandstop",
+    "window_type": "kaiser",
+    "sampling_freq_hz": 8000,
+    "passband_freq_hz": 1000,
+    "passband_freq2_hz": 2000,
+    "stopband_freq_hz": 1300,
+    "stopband_freq2_hz": 1700,
+    "passband_ripple_db": 0.5,
+    "stopband_attenuation_db": 40,
+}
+
+
+class TestFilterBands:
+    """
+    Tests for the filter_bands function.
+    """
+
+    def test_lowpass_bands(self):
+        """
+        Test that a lowpass filter passes up to fp and stops from fs to the Nyquist frequency.
+        """
+        assert filter_bands(lowpass_conf) == ([(0.0, 1000)], [(1500, 4000)])
+
+    def test_bandstop_bands(self):
+        """
+        Test that a bandstop filter has two passbands around its stopband.
+        """
+        assert filter_bands(bandstop_conf) == (
+            [(0.0, 1000), (2000, 4000)],
+            [(1300, 1700)],
+        )
+
+    def test_invalid_filter_type(self):
+        """
+        Test that an unknown filter type raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            filter_bands({**lowpass_conf, "filter_type": "notch"})  # type: ignore
+
+
+class TestMeasureSpec:
+    """
+    Tests for the measure_spec and meets_spec functions.
+    """
+
+    def test_identity_filter(self):
+        """
+        Test that a unit impulse has no ripple and no attenuation.
+        """
+        measurement = measure_spec([1.0], lowpass_conf)
+
+        assert measurement["passband_ripple_db"] == pytest.approx(0.0)
+        assert measurement["stopband_attenuation_db"] == pytest.approx(0.0)
+        assert not meets_spec(measurement, lowpass_conf)
+
+    @pytest.mark.parametrize("coefficients", [[0.0, 0.0, 0.0], [0.5, 0.0, -0.5]])
+    def test_zero_passband_gain(self, coefficients):
+        """
+        Test that a passband with a zero gain fails the specification without warnings.
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            measurement = measure_spec(coefficients, lowpass_conf)
+
+        assert measurement["passband_ripple_db"] == np.inf
+        assert not meets_spec(measurement, lowpass_conf)
+
+    def test_matches_a_dense_response(self):
+        """
+        Test that the measurement matches the response evaluated on a much finer grid.
+        """
+        h = firwin(61, 1250, fs=8000)
+        measurement = measure_spec(h, lowpass_conf)
+
+        frequencies = np.linspace(0, 4000, 400001)
+        response = np.abs(
+            np.exp(-2j * np.pi * np.outer(frequencies, np.arange(h.size)) / 8000) @ h
+        )
+        passband = response[frequencies <= 1000]
+        stopband = response[frequencies >= 1500]
+
+        assert measurement["passband_ripple_db"] == pytest.approx(
+            20 * np.log10(passband.max() / passband.min()), rel=1e-4
+        )
+        assert measurement["stopband_attenuation_db"] == pytest.approx(
+            -20 * np.log10(stopband.max()), rel=1e-4
+        )
+        assert meets_spec(measurement, lowpass_conf)
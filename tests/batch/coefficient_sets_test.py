@@ -0,0 +1,57 @@
+"""
+This file contains the tests for the CoefficientSets class.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import CoefficientSets
+
+
+class TestCoefficientSets:
+    """
+    Tests for the CoefficientSets class.
+    """
+
+    @pytest.fixture
+    def coefficient_sets(self) -> CoefficientSets:
+        """
+        Returns a collection with sets of 1 and 3 coefficients.
+        """
+        return CoefficientSets(np.array([0.5, 0.1, 0.8, 0.1]), np.array([0, 1, 4]))
+
+    def test_getitem_returns_view(self, coefficient_sets: CoefficientSets):
+        """
+        Test that indexing returns a view of the flat values.
+        """
+        coefficients = coefficient_sets[1]
+
+        assert coefficients.tolist() == [0.1, 0.8, 0.1]
+        assert np.shares_memory(coefficients, coefficient_sets.values)
+
+    def test_getitem_supports_negative_indexes(self, coefficient_sets: CoefficientSets):
+        """
+        Test that negative indexes count from the end.
+        """
+        assert coefficient_sets[-2].tolist() == [0.5]
+
+    def test_getitem_raises_index_error(self, coefficient_sets: CoefficientSets):
+        """
+        Test that an out of range index raises an IndexError.
+        """
+        with pytest.raises(IndexError):
+            coefficient_sets[2]
+
+    def test_lengths_and_orders(self, coefficient_sets: CoefficientSets):
+        """
+        Test the number of coefficients and the order of each set.
+        """
+        assert coefficient_sets.lengths.tolist() == [1, 3]
+        assert coefficient_sets.orders.tolist() == [0, 1]
+
+    def test_invalid_offsets_raise_value_error(self):
+        """
+        Test that offsets not matching the values raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            CoefficientSets(np.array([0.5, 0.1]), np.array([0, 1]))
@@ -0,0 +1,76 @@
+"""
+This file contains the tests for the design_many function.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import CoefficientSets, EasyFirFilter, FilterConf, design_many
+from easy_fir_filter.exceptions import MissingKeysError
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+
+class TestDesignMany:
+    """
+    Tests for the design_many function.
+    """
+
+    @pytest.mark.parametrize("round_to", [4, 7])
+    def test_design_many_matches_easy_fir_filter(self, round_to: int):
+        """
+        Test that every design equals the design of EasyFirFilter.
+        """
+        result = design_many(list_filter_configurations, round_to)
+
+        for coefficients, filter_conf in zip(result, list_filter_configurations):
+            expected = EasyFirFilter(filter_conf, round_to).calculate_filter()
+            assert coefficients.tolist() == expected
+
+    def test_design_many_keeps_input_order(self):
+        """
+        Test that the results follow the order of the configurations, even though
+        they are designed grouped by filter and window type.
+        """
+        confs = list_filter_configurations + list_filter_configurations[::-1]
+        result = design_many(confs, 7).tolist()
+
+        assert result[5:] == result[:5][::-1]
+
+    def test_design_many_returns_coefficient_sets(self):
+        """
+        Test that the result is a ragged collection with the right orders.
+        """
+        result = design_many(list_filter_configurations, 7)
+
+        assert isinstance(result, CoefficientSets)
+        assert len(result) == len(list_filter_configurations)
+        assert result.orders.tolist() == [10, 13, 10, 16, 10]
+        assert result.values.dtype == np.float64
+
+    def test_design_many_with_no_configurations(self):
+        """
+        Test that an empty sequence of configurations gives an empty collection.
+        """
+        assert len(design_many([])) == 0
+
+    def test_design_many_validates_configurations(self):
+        """
+        Test that invalid configurations are rejected.
+        """
+        conf: FilterConf = {**list_filter_configurations[0]}
+        del conf["sampling_freq_hz"]  # type: ignore
+
+        with pytest.raises(MissingKeysError):
+            design_many([conf])
+
+    def test_design_many_raises_if_delta_truncates_to_zero(self):
+        """
+        Test that a delta truncated to zero raises a ValueError.
+        """
+        conf: FilterConf = {
+            **list_filter_configurations[1],
+            "stopband_attenuation_db": 100,
+        }
+
+        with pytest.raises(ValueError):
+            design_many([conf], round_to=4)
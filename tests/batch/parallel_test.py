@@ -0,0 +1,111 @@
+"""
+This file contains the tests for the design_many_parallel function.
+"""
+
+import os
+
+import pytest
+
+from easy_fir_filter import FilterConf, design_many, design_many_parallel
+from easy_fir_filter.exceptions import InvalidTypeError, MissingKeysError
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+
+def _shared_memory_blocks() -> set[str]:
+    """
+    Lists the shared memory blocks currently present on the system.
+    """
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+class TestDesignManyParallel:
+    """
+    Tests for the design_many_parallel function.
+    """
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3])
+    def test_design_many_parallel_matches_design_many(self, chunk_size: int):
+        """
+        Test that sharding the configurations gives the same designs, in input order.
+        """
+        confs = list_filter_configurations * 3
+        expected = design_many(confs, 7)
+        result = design_many_parallel(confs, 7, max_workers=2, chunk_size=chunk_size)
+
+        assert result.tolist() == expected.tolist()
+        assert result.offsets.tolist() == expected.offsets.tolist()
+
+    def test_design_many_parallel_with_a_single_chunk(self):
+        """
+        Test that a sweep that fits in one chunk is designed in the calling process.
+        """
+        result = design_many_parallel(list_filter_configurations, chunk_size=100)
+
+        assert result.tolist() == design_many(list_filter_configurations).tolist()
+
+    def test_design_many_parallel_with_no_configurations(self):
+        """
+        Test that an empty sequence of configurations gives an empty collection.
+        """
+        assert len(design_many_parallel([])) == 0
+
+    def test_design_many_parallel_releases_shared_memory(self):
+        """
+        Test that no shared memory block is left behind.
+        """
+        before = _shared_memory_blocks()
+        design_many_parallel(list_filter_configurations, max_workers=2, chunk_size=1)
+
+        assert _shared_memory_blocks() <= before
+
+    def test_design_many_parallel_raises_worker_errors(self):
+        """
+        Test that a design failing in any chunk raises its error and releases the
+        shared memory of the other chunks.
+        """
+        # Truncated to 4 decimals, delta is 0
+        conf: FilterConf = {
+            **list_filter_configurations[0],
+            "stopband_attenuation_db": 100,
+        }
+        before = _shared_memory_blocks()
+
+        with pytest.raises(ValueError):
+            design_many_parallel(
+                [*list_filter_configurations, conf], max_workers=2, chunk_size=2
+            )
+
+        assert _shared_memory_blocks() <= before
+
+    @pytest.mark.parametrize("chunk_size", [2, 100])
+    def test_design_many_parallel_raises_validation_errors(self, chunk_size: int):
+        """
+        Test that an invalid configuration raises its validation error whatever the
+        number of chunks.
+        """
+        missing: FilterConf = {**list_filter_configurations[0]}
+        del missing["sampling_freq_hz"]  # type: ignore
+        bad_type: FilterConf = {
+            **list_filter_configurations[0],
+            "filter_type": 1,  # type: ignore
+        }
+
+        with pytest.raises(MissingKeysError):
+            design_many_parallel(
+                [*list_filter_configurations, missing],
+                max_workers=2,
+                chunk_size=chunk_size,
+            )
+        with pytest.raises(InvalidTypeError):
+            design_many_parallel(
+                [list_filter_configurations[0]] * 4 + [bad_type],
+                max_workers=2,
+                chunk_size=chunk_size,
+            )
+
+    def test_design_many_parallel_rejects_invalid_chunk_size(self):
+        """
+        Test that a chunk size lower than 1 raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            design_many_parallel(list_filter_configurations, chunk_size=0)
@@ -0,0 +1,105 @@
+"""
+This file contains the tests for the verify_many function.
+"""
+
+import sys
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import FilterConf, design_many, verify_many
+from easy_fir_filter.analysis import measure_spec, meets_spec
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+
+class TestVerifyMany:
+    """
+    Tests for the verify_many function.
+    """
+
+    @pytest.fixture
+    def filter_confs(self) -> list[FilterConf]:
+        """
+        Returns the fixture configurations, their equiripple and minimum-phase versions.
+        """
+        return (
+            list_filter_configurations
+            + [
+                {**filter_conf, "window_type": "equiripple"}
+                for filter_conf in list_filter_configurations
+            ]
+            + [
+                {**filter_conf, "minimum_phase": True}
+                for filter_conf in list_filter_configurations
+            ]
+        )
+
+    def test_matches_measure_spec(self, filter_confs):
+        """
+        Test that every measurement and verdict matches measure_spec on the same grid.
+        """
+        coefficient_sets = design_many(filter_confs, 6)
+        result = verify_many(coefficient_sets, filter_confs, 8192)
+
+        for i, filter_conf in enumerate(filter_confs):
+            measurement = measure_spec(coefficient_sets[i], filter_conf, 8192)
+            assert result["passband_ripple_db"][i] == pytest.approx(
+                measurement["passband_ripple_db"], abs=1e-9
+            )
+            assert result["stopband_attenuation_db"][i] == pytest.approx(
+                measurement["stopband_attenuation_db"], abs=1e-9
+            )
+            assert result["passed"][i] == meets_spec(measurement, filter_conf)
+
+    def test_margins(self, filter_confs):
+        """
+        Test that the margins compare the measurements with the configurations.
+        """
+        result = verify_many(design_many(filter_confs, 6).tolist(), filter_confs)
+        Ap = np.array([conf["passband_ripple_db"] for conf in filter_confs])
+        As = np.array([conf["stopband_attenuation_db"] for conf in filter_confs])
+
+        np.testing.assert_allclose(
+            result["passband_margin_db"], Ap - result["passband_ripple_db"]
+        )
+        np.testing.assert_allclose(
+            result["stopband_margin_db"], result["stopband_attenuation_db"] - As
+        )
+        np.testing.assert_array_equal(
+            result["passed"],
+            (result["passband_margin_db"] >= 0) & (result["stopband_margin_db"] >= 0),
+        )
+        # The equiripple designs are searched until they meet the specification
+        count = len(list_filter_configurations)
+        assert result["passed"][count : 2 * count].all()
+
+    def test_batches(self, filter_confs, monkeypatch):
+        """
+        Test that splitting the filters into batches of rows gives the same result.
+        """
+        coefficient_sets = design_many(filter_confs, 6)
+        expected = verify_many(coefficient_sets, filter_confs)
+        module = sys.modules["easy_fir_filter.batch.verify_many"]
+        monkeypatch.setattr(module, "_BATCH_ELEMENTS", 3 * 8192)
+        result = verify_many(coefficient_sets, filter_confs)
+
+        for key, values in expected.items():
+            np.testing.assert_array_equal(result[key], values)
+
+    def test_empty(self):
+        """
+        Test that no filters give empty results.
+        """
+        assert verify_many([], [])["passed"].size == 0
+
+    def test_invalid_arguments(self):
+        """
+        Test that mismatched lengths, empty filters or a too small grid raise a ValueError.
+        """
+        filter_conf = list_filter_configurations[0]
+        with pytest.raises(ValueError):
+            verify_many([[1.0]], [filter_conf, filter_conf])
+        with pytest.raises(ValueError):
+            verify_many([[]], [filter_conf])
+        with pytest.raises(ValueError):
+            verify_many([np.ones(9)], [filter_conf], n_points=8)
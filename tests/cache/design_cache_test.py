@@ -0,0 +1,140 @@
+"""
+This file contains the tests for the DesignCache class.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import DesignCache, EasyFirFilter, FilterConf
+from easy_fir_filter.cache import canonicalize_filter_conf
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+
+class TestCanonicalizeFilterConf:
+    """
+    Tests for the canonicalize_filter_conf function.
+    """
+
+    def test_canonical_key_is_hashable(self):
+        """
+        Test that the canonical key can be hashed.
+        """
+        hash(canonicalize_filter_conf(list_filter_configurations[0]))
+
+    def test_canonical_key_ignores_key_order(self):
+        """
+        Test that the key order of the configuration does not change the key.
+        """
+        conf = list_filter_configurations[0]
+        reversed_conf = dict(reversed(list(conf.items())))
+        assert canonicalize_filter_conf(conf) == canonicalize_filter_conf(
+            reversed_conf  # type: ignore
+        )
+
+    def test_canonical_key_normalizes_numbers(self):
+        """
+        Test that int and float spellings of a value produce the same key.
+        """
+        conf = list_filter_configurations[0]
+        float_conf = {
+            key: float(value) if isinstance(value, int) else value
+            for key, value in conf.items()
+        }
+        assert canonicalize_filter_conf(conf) == canonicalize_filter_conf(
+            float_conf  # type: ignore
+        )
+
+    def test_canonical_key_depends_on_round_to(self):
+        """
+        Test that the rounding precision is part of the key.
+        """
+        conf = list_filter_configurations[0]
+        assert canonicalize_filter_conf(conf, 4) != canonicalize_filter_conf(conf, 7)
+
+    def test_canonical_key_depends_on_window_type(self):
+        """
+        Test that the window type is part of the key.
+        """
+        conf = list_filter_configurations[0]
+        other: FilterConf = {**conf, "window_type": "blackman"}
+        assert canonicalize_filter_conf(conf) != canonicalize_filter_conf(other)
+
+
+class TestDesignCache:
+    """
+    Tests for the DesignCache class.
+    """
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations)
+    def test_calculate_filter_returns_same_coefficients_as_easy_fir_filter(
+        self, filter_conf: FilterConf
+    ):
+        """
+        Test that a cached design equals the design of EasyFirFilter.
+        """
+        expected = EasyFirFilter(filter_conf, 7).calculate_filter()
+        assert DesignCache().calculate_filter(filter_conf, 7).tolist() == expected
+
+    def test_calculate_filter_returns_read_only_array(self):
+        """
+        Test that the cached coefficients cannot be modified.
+        """
+        coefficients = DesignCache().calculate_filter(list_filter_configurations[0])
+        assert isinstance(coefficients, np.ndarray)
+        with pytest.raises(ValueError):
+            coefficients[0] = 1.0
+
+    def test_calculate_filter_counts_hits_and_misses(self):
+        """
+        Test that repeated designs are served from the cache.
+        """
+        cache = DesignCache()
+        first = cache.calculate_filter(list_filter_configurations[0])
+        second = cache.calculate_filter(list_filter_configurations[0])
+
+        assert second is first
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_calculate_filter_evicts_least_recently_used(self):
+        """
+        Test that the least recently used design is evicted when the cache is full.
+        """
+        cache = DesignCache(max_size=2)
+        conf_a, conf_b, conf_c = list_filter_configurations[:3]
+
+        cache.calculate_filter(conf_a)
+        cache.calculate_filter(conf_b)
+        cache.calculate_filter(conf_a)  # conf_b is now the least recently used
+        cache.calculate_filter(conf_c)
+
+        assert len(cache) == 2
+        assert cache.stats()["evictions"] == 1
+
+        cache.calculate_filter(conf_a)
+        assert cache.stats()["hits"] == 2
+        cache.calculate_filter(conf_b)
+        assert cache.stats()["misses"] == 4
+
+    def test_clear_removes_entries_and_counters(self):
+        """
+        Test that clear empties the cache and resets its counters.
+        """
+        cache = DesignCache()
+        cache.calculate_filter(list_filter_configurations[0])
+        cache.clear()
+
+        assert cache.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "size": 0,
+            "max_size": 256,
+        }
+
+    def test_invalid_max_size_raises_value_error(self):
+        """
+        Test that a maximum size lower than 1 raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            DesignCache(max_size=0)
@@ -0,0 +1,183 @@
+"""
+This file contains the tests for the DiskDesignCache class.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import DiskDesignCache, EasyFirFilter, FilterConf
+from easy_fir_filter.cache import disk_cache
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+
+class TestDiskDesignCache:
+    """
+    Tests for the DiskDesignCache class.
+    """
+
+    @pytest.fixture
+    def cache(self, tmp_path) -> DiskDesignCache:
+        """
+        Returns a disk cache on a temporary directory.
+        """
+        return DiskDesignCache(tmp_path / "designs")
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations)
+    def test_calculate_filter_returns_same_coefficients_as_easy_fir_filter(
+        self, cache: DiskDesignCache, filter_conf: FilterConf
+    ):
+        """
+        Test that both designed and loaded entries equal the design of EasyFirFilter.
+        """
+        expected = EasyFirFilter(filter_conf, 7).calculate_filter()
+
+        assert cache.calculate_filter(filter_conf, 7).tolist() == expected
+        assert cache.calculate_filter(filter_conf, 7).tolist() == expected
+
+    def test_entries_are_shared_between_instances(self, tmp_path):
+        """
+        Test that an entry written by one instance is loaded by another one.
+        """
+        conf = list_filter_configurations[0]
+        DiskDesignCache(tmp_path).calculate_filter(conf)
+
+        other = DiskDesignCache(tmp_path)
+        coefficients = other.calculate_filter(conf)
+
+        assert other.stats()["hits"] == 1
+        assert other.stats()["misses"] == 0
+        assert isinstance(coefficients, np.memmap)
+        assert not coefficients.flags.writeable
+
+    def test_entries_are_raw_npy_files(self, cache: DiskDesignCache):
+        """
+        Test that entries are plain .npy files that can be loaded with NumPy.
+        """
+        conf = list_filter_configurations[0]
+        coefficients = cache.calculate_filter(conf)
+
+        path = cache.entry_path(conf)
+        assert path.endswith(".npy")
+        assert np.load(path).tolist() == coefficients.tolist()
+
+    def test_no_temporary_files_are_left(self, cache: DiskDesignCache):
+        """
+        Test that the atomic write does not leave temporary files behind.
+        """
+        cache.calculate_filter(list_filter_configurations[0])
+        assert all(name.endswith(".npy") for name in os.listdir(cache.directory))
+
+    def test_entry_path_depends_on_library_version(
+        self, cache: DiskDesignCache, monkeypatch
+    ):
+        """
+        Test that a different library version uses a different entry.
+        """
+        conf = list_filter_configurations[0]
+        path = cache.entry_path(conf)
+
+        monkeypatch.setattr(disk_cache, "_library_version", lambda: "99.0.0")
+
+        assert cache.entry_path(conf) != path
+
+    def test_unreadable_entry_is_designed_again(self, cache: DiskDesignCache):
+        """
+        Test that a corrupted entry is treated as a miss and replaced.
+        """
+        conf = list_filter_configurations[0]
+        with open(cache.entry_path(conf), "wb") as file:
+            file.write(b"not a npy file")
+
+        coefficients = cache.calculate_filter(conf)
+
+        assert cache.stats()["misses"] == 1
+        assert np.load(cache.entry_path(conf)).tolist() == coefficients.tolist()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        """
+        Test that the cache removes the least recently used entries to fit max_bytes.
+        """
+        conf_a, conf_b, conf_c = list_filter_configurations[:3]
+        cache = DiskDesignCache(tmp_path)
+        cache.calculate_filter(conf_a)
+        cache.calculate_filter(conf_b)
+        os.utime(cache.entry_path(conf_a), (1, 1))
+        os.utime(cache.entry_path(conf_b), (2, 2))
+
+        cache.max_bytes = cache.stats()["size_bytes"]
+        cache.calculate_filter(conf_c)
+
+        assert cache.stats()["evictions"] == 1
+        assert not os.path.exists(cache.entry_path(conf_a))
+        assert os.path.exists(cache.entry_path(conf_b))
+        assert os.path.exists(cache.entry_path(conf_c))
+
+    def test_clear_removes_entries_and_counters(self, cache: DiskDesignCache):
+        """
+        Test that clear empties the directory and resets the counters.
+        """
+        cache.calculate_filter(list_filter_configurations[0])
+        cache.clear()
+
+        assert cache.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "entries": 0,
+            "size_bytes": 0,
+            "max_bytes": 64 * 1024**2,
+        }
+
+    def test_clear_keeps_recent_temporary_files(self, cache: DiskDesignCache):
+        """
+        Test that clear only removes temporary files too old to be in use.
+        """
+        recent = os.path.join(cache.directory, "recent.tmp")
+        stale = os.path.join(cache.directory, "stale.tmp")
+        for path in (recent, stale):
+            with open(path, "wb"):
+                pass
+        os.utime(stale, (1, 1))
+
+        cache.clear()
+
+        assert os.path.exists(recent)
+        assert not os.path.exists(stale)
+
+    def test_removed_temporary_file_skips_the_store(
+        self, cache: DiskDesignCache, monkeypatch
+    ):
+        """
+        Test that a temporary file removed by another process does not fail the design.
+        """
+        conf = list_filter_configurations[0]
+
+        def replace(source, destination):
+            os.remove(source)
+            raise FileNotFoundError(source)
+
+        monkeypatch.setattr(disk_cache.os, "replace", replace)
+        coefficients = cache.calculate_filter(conf)
+
+        assert coefficients.tolist() == EasyFirFilter(conf).calculate_filter()
+        assert not os.path.exists(cache.entry_path(conf))
+
+    def test_library_version_is_read_once(self, cache: DiskDesignCache, monkeypatch):
+        """
+        Test that the package metadata is not read on every lookup.
+        """
+        disk_cache._library_version()
+        monkeypatch.setattr(
+            disk_cache, "version", lambda name: pytest.fail("metadata read again")
+        )
+
+        cache.entry_path(list_filter_configurations[0])
+
+    def test_invalid_max_bytes_raises_value_error(self, tmp_path):
+        """
+        Test that a non-positive maximum size raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            DiskDesignCache(tmp_path, max_bytes=0)
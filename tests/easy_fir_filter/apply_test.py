@@ -0,0 +1,72 @@
+"""
+This file contains tests for the apply function in the easy_fir_filter module.
+"""
+
+import numpy as np
+import pytest
+
+from tests.easy_fir_filter.easy_fir_filter_test import TestBaseEasyFirFilter
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+
+class TestApply(TestBaseEasyFirFilter):
+    """
+    Tests for the apply function in the easy_fir_filter module.
+    """
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations)
+    @pytest.mark.parametrize("mode", ["full", "same", "valid"])
+    @pytest.mark.parametrize("method", ["auto", "direct", "fft"])
+    def test_apply_filters_with_designed_coefficients(
+        self, easy_fir_filter_builder, mode, method
+    ):
+        """
+        Test that apply convolves the signal with the designed coefficients.
+        """
+        signal = np.random.default_rng(0).standard_normal(500)
+        coefficients = easy_fir_filter_builder.calculate_filter()
+
+        np.testing.assert_allclose(
+            easy_fir_filter_builder.apply(signal, mode, method=method),
+            np.convolve(signal, coefficients, mode),
+            rtol=1e-12,
+            atol=1e-12,
+        )
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations[:1])
+    def test_apply_designs_the_filter_if_needed(self, easy_fir_filter_builder):
+        """
+        Test that apply designs the filter when calculate_filter was not called.
+        """
+        result = easy_fir_filter_builder.apply(np.ones(50))
+
+        assert easy_fir_filter_builder.coefficients is not None
+        assert result.shape == (50,)
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations[:1])
+    def test_apply_writes_into_out(self, easy_fir_filter_builder):
+        """
+        Test that apply writes into the given output buffer.
+        """
+        out = np.empty(50)
+
+        assert easy_fir_filter_builder.apply(np.ones(50), out=out) is out
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations[:1])
+    def test_apply_keeps_the_fft_engine(self, easy_fir_filter_builder):
+        """
+        Test that the overlap-add engine, with its cached spectrum, is reused.
+        """
+        easy_fir_filter_builder.apply(np.ones(50), method="fft")
+        convolver = easy_fir_filter_builder._convolver
+        easy_fir_filter_builder.apply(np.ones(50), method="fft")
+
+        assert easy_fir_filter_builder._convolver is convolver
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations[:1])
+    def test_apply_rejects_invalid_method(self, easy_fir_filter_builder):
+        """
+        Test that an unknown method raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            easy_fir_filter_builder.apply(np.ones(50), method="winograd")
@@ -2,15 +2,16 @@
 This file contains tests for the calculate_filter_coefficients function in the easy_fir_filter module.
 """
 
+import logging
+
 import pytest
 
 from tests.easy_fir_filter.easy_fir_filter_test import TestBaseEasyFirFilter
 from tests.fixtures.filter_configurations import (
-    list_filter_configurations,
     filter_order_results,
+    list_filter_configurations,
 )
 
-
 correct_filter_values = [
     [
         0.7,
@@ -57,7 +58,7 @@ correct_filter_values = [
     [
         0.6923076,
         0.0354389,
-        0.2480602,
+        0.2480603,
         -0.0705916,
         -0.1190898,
         0.0409022,
@@ -151,3 +152,26 @@ class TestCalculateFilterCoefficients(TestBaseEasyFirFilter):
         Tests that the calculate_filter_coefficients function returns the correct values.
         """
         assert precomputed_filter._calculate_filter_coefficients() == correct_values
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations)
+    def test_calculate_filter_coefficients_builds_symmetric_filter(
+        self, precomputed_filter
+    ):
+        """
+        Tests that the complete symmetric filter is stored in coefficients.
+        """
+        half = precomputed_filter._calculate_filter_coefficients()
+        assert precomputed_filter.coefficients.tolist() == half[:0:-1] + half
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations[:1])
+    def test_calculate_filter_coefficients_logs_instead_of_printing(
+        self, precomputed_filter, capsys, caplog
+    ):
+        """
+        Tests that the coefficients are only written to the debug log.
+        """
+        with caplog.at_level(logging.DEBUG, logger="easy_fir_filter.easy_fir_filter"):
+            coefficients = precomputed_filter._calculate_filter_coefficients()
+
+        assert capsys.readouterr().out == ""
+        assert str(coefficients) in caplog.text
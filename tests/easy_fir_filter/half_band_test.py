@@ -0,0 +1,99 @@
+"""
+This file contains the tests for the half-band design option of the easy_fir_filter class.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import FilterConf, design_many
+from easy_fir_filter.easy_fir_filter import EasyFirFilter
+
+half_band_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "kaiser",
+    "sampling_freq_hz": 48000,
+    "passband_freq_hz": 10000,
+    "stopband_freq_hz": 14000,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 60,
+    "half_band": True,
+}
+
+
+class TestHalfBand:
+    """
+    Tests for the half-band design option.
+    """
+
+    @pytest.fixture
+    def half_band_filter(self) -> EasyFirFilter:
+        """
+        Returns a designed half-band filter.
+        """
+        easy_fir_filter = EasyFirFilter(half_band_conf, 7)
+        easy_fir_filter.calculate_filter()
+
+        return easy_fir_filter
+
+    def test_every_other_tap_is_zero(self, half_band_filter):
+        """
+        Test that the taps at an even, nonzero distance from the center are exactly
+        0 and are marked as zero taps.
+        """
+        coefficients = half_band_filter.coefficients
+        center = coefficients.size // 2
+
+        assert coefficients[center] == 0.5
+        assert half_band_filter.zero_taps.tolist() == [
+            i for i in range(coefficients.size) if i != center and (i - center) % 2 == 0
+        ]
+        assert np.all(coefficients[half_band_filter.zero_taps] == 0.0)
+        assert np.count_nonzero(coefficients) == coefficients.size - len(
+            half_band_filter.zero_taps
+        )
+
+    def test_meets_the_passband_ripple(self, half_band_filter):
+        """
+        Test that the response is flat in the passband and halved at F / 4.
+        """
+        response = np.abs(np.fft.rfft(half_band_filter.coefficients, 4096))
+        frequencies = np.fft.rfftfreq(4096, 1 / 48000)
+
+        passband = 20 * np.log10(response[frequencies <= 10000])
+        assert passband.max() - passband.min() < 0.1
+        assert response[frequencies == 12000][0] == pytest.approx(0.5, abs=1e-6)
+
+    def test_design_many_matches(self, half_band_filter):
+        """
+        Test that the batch design of a half-band configuration matches calculate_filter.
+        """
+        plain_conf: FilterConf = {**half_band_conf}  # type: ignore
+        del plain_conf["half_band"]
+
+        designs = design_many([half_band_conf, plain_conf], round_to=7)
+
+        assert designs[0].tolist() == half_band_filter.coefficients.tolist()
+        assert designs[1].tolist() == EasyFirFilter(plain_conf, 7).calculate_filter()
+
+    @pytest.mark.parametrize("method", ["direct", "fft"])
+    def test_apply_skips_zero_taps_exactly(self, half_band_filter, method):
+        """
+        Test that filtering with the zero taps skipped gives the full convolution.
+        """
+        signal = np.random.default_rng(0).standard_normal(1000)
+
+        np.testing.assert_allclose(
+            half_band_filter.apply(signal, method=method),
+            np.convolve(signal, half_band_filter.coefficients, "same"),
+            atol=1e-12,
+        )
+
+    def test_plain_design_has_no_zero_taps(self):
+        """
+        Test that filters designed without the option mark no zero taps.
+        """
+        plain_conf: FilterConf = {**half_band_conf, "half_band": False}
+        easy_fir_filter = EasyFirFilter(plain_conf, 7)
+        easy_fir_filter.calculate_filter()
+
+        assert easy_fir_filter.zero_taps.size == 0
@@ -0,0 +1,102 @@
+"""
+This file contains the tests for the minimize_order option of the easy_fir_filter class.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import FilterConf
+from easy_fir_filter.analysis import measure_spec, meets_spec
+from easy_fir_filter.easy_fir_filter import EasyFirFilter
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+half_band_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "kaiser",
+    "sampling_freq_hz": 48000,
+    "passband_freq_hz": 10000,
+    "stopband_freq_hz": 14000,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 60,
+    "half_band": True,
+}
+
+
+class TestMinimizeOrder:
+    """
+    Tests for the minimize_order option.
+    """
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations)
+    def test_design_is_the_shortest_meeting_the_spec(self, filter_conf):
+        """
+        Test that the design meets the specification and the next lower order does not.
+        """
+        easy_fir_filter = EasyFirFilter(filter_conf, 6, minimize_order=True)
+        coefficients = easy_fir_filter.calculate_filter()
+        n = len(coefficients) // 2
+
+        assert meets_spec(measure_spec(coefficients, filter_conf), filter_conf)
+        assert easy_fir_filter.taps_saved == easy_fir_filter.kaiser_taps - len(
+            coefficients
+        )
+
+        shorter = easy_fir_filter._window_design(n - 1)
+        assert not meets_spec(measure_spec(shorter, filter_conf), filter_conf)
+
+    def test_matches_the_design_of_the_same_order(self):
+        """
+        Test that the coefficients match _window_design for the chosen order.
+        """
+        easy_fir_filter = EasyFirFilter(list_filter_configurations[0], 6, True)
+        coefficients = easy_fir_filter.calculate_filter()
+
+        np.testing.assert_array_equal(
+            coefficients, easy_fir_filter._window_design(len(coefficients) // 2)
+        )
+
+    def test_half_band_order_stays_odd(self):
+        """
+        Test that a minimized half-band filter keeps an odd order and its zero taps.
+        """
+        easy_fir_filter = EasyFirFilter(half_band_conf, 7, minimize_order=True)
+        coefficients = np.array(easy_fir_filter.calculate_filter())
+        n = coefficients.size // 2
+
+        assert n % 2 == 1
+        assert meets_spec(measure_spec(coefficients, half_band_conf), half_band_conf)
+        assert np.count_nonzero(coefficients[n % 2 :: 2]) == 1
+
+    @pytest.mark.parametrize("window_type", ["hamming", "blackman", "kaiser"])
+    def test_wide_transition_keeps_a_window(self, window_type):
+        """
+        Test that the search stops at order 1 without dividing by a zero filter length.
+        """
+        wide_conf: FilterConf = {
+            "filter_type": "lowpass",
+            "window_type": window_type,
+            "sampling_freq_hz": 1000,
+            "passband_freq_hz": 50,
+            "stopband_freq_hz": 450,
+            "passband_ripple_db": 3,
+            "stopband_attenuation_db": 15,
+        }
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            coefficients = EasyFirFilter(
+                wide_conf, minimize_order=True
+            ).calculate_filter()
+
+        assert len(coefficients) >= 3
+
+    def test_default_keeps_the_estimate(self):
+        """
+        Test that without minimize_order the order of the closed-form estimate is kept.
+        """
+        easy_fir_filter = EasyFirFilter(list_filter_configurations[0])
+        coefficients = easy_fir_filter.calculate_filter()
+
+        assert len(coefficients) == easy_fir_filter.kaiser_taps
+        assert easy_fir_filter.taps_saved == 0
@@ -0,0 +1,75 @@
+"""
+This file contains the tests for the minimum_phase option of the easy_fir_filter class.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import FilterConf, design_many
+from easy_fir_filter.analysis import measure_spec
+from easy_fir_filter.easy_fir_filter import EasyFirFilter
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+
+class TestMinimumPhaseOption:
+    """
+    Tests for the minimum_phase design option.
+    """
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations)
+    def test_keeps_the_specification_and_cuts_the_latency(self, filter_conf):
+        """
+        Test that the minimum-phase design measures like the linear-phase one and
+        has a lower latency.
+        """
+        linear = EasyFirFilter(filter_conf, 7)
+        linear_coefficients = linear.calculate_filter()
+        minimum = EasyFirFilter({**filter_conf, "minimum_phase": True}, 7)
+        minimum_coefficients = minimum.calculate_filter()
+
+        assert len(minimum_coefficients) == len(linear_coefficients)
+        assert linear.latency_samples == len(linear_coefficients) // 2
+        assert minimum.latency_samples < linear.latency_samples / 2
+
+        linear_spec = measure_spec(linear_coefficients, filter_conf)
+        minimum_spec = measure_spec(minimum_coefficients, filter_conf)
+        assert minimum_spec["passband_ripple_db"] == pytest.approx(
+            linear_spec["passband_ripple_db"], abs=1e-2
+        )
+        assert minimum_spec["stopband_attenuation_db"] == pytest.approx(
+            linear_spec["stopband_attenuation_db"], abs=0.5
+        )
+
+    def test_filters_with_the_minimum_phase_coefficients(self):
+        """
+        Test that apply() filters with the asymmetric minimum-phase coefficients.
+        """
+        filter_conf: FilterConf = {
+            **list_filter_configurations[1],
+            "minimum_phase": True,
+        }
+        easy_fir_filter = EasyFirFilter(filter_conf, 7)
+        coefficients = easy_fir_filter.calculate_filter()
+        signal = np.random.default_rng(0).standard_normal(500)
+
+        for method in ("direct", "fft"):
+            np.testing.assert_allclose(
+                easy_fir_filter.apply(signal, "full", method=method),
+                np.convolve(signal, coefficients),
+                atol=1e-12,
+            )
+
+    def test_design_many(self):
+        """
+        Test that design_many matches EasyFirFilter for minimum-phase configurations.
+        """
+        filter_confs: list[FilterConf] = [
+            {**filter_conf, "minimum_phase": True}
+            for filter_conf in list_filter_configurations
+        ] + list_filter_configurations
+        coefficient_sets = design_many(filter_confs, 6)
+
+        for i, filter_conf in enumerate(filter_confs):
+            np.testing.assert_array_equal(
+                coefficient_sets[i], EasyFirFilter(filter_conf, 6).calculate_filter()
+            )
@@ -0,0 +1,201 @@
+"""
+This file contains the tests for reusing an EasyFirFilter instance with calculate_filter and redesign.
+"""
+
+import pytest
+
+from easy_fir_filter import FilterConf
+from easy_fir_filter.easy_fir_filter import EasyFirFilter
+from easy_fir_filter.instrumentation import StageCollector
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+bandstop_conf: FilterConf = list_filter_configurations[3]
+
+
+def assert_same_design(fir_filter: EasyFirFilter, minimize_order: bool = False):
+    """
+    Asserts that a redesigned filter matches a new design of its configuration.
+    """
+    expected = EasyFirFilter(fir_filter.filter_conf, minimize_order=minimize_order)
+    coefficients = expected.calculate_filter()
+
+    assert fir_filter.coefficients.tolist() == coefficients
+    assert fir_filter.fir_filter_coefficients == expected.fir_filter_coefficients
+    assert fir_filter.latency_samples == expected.latency_samples
+    assert fir_filter.kaiser_taps == expected.kaiser_taps
+    assert fir_filter.taps_saved == expected.taps_saved
+    assert fir_filter.zero_taps.tolist() == expected.zero_taps.tolist()
+
+
+class TestRedesign:
+    """
+    Tests for calculate_filter called more than once and for redesign.
+    """
+
+    @pytest.mark.parametrize("filter_conf", list_filter_configurations)
+    def test_calculate_filter_twice(self, filter_conf):
+        """
+        Test that calculating the filter again returns the same design.
+        """
+        fir_filter = EasyFirFilter(filter_conf)
+        first = fir_filter.calculate_filter()
+
+        assert fir_filter.calculate_filter() == first
+        assert len(fir_filter.fir_filter_coefficients) == len(first) // 2 + 1
+        assert (
+            len(fir_filter.filter.impulse_response_coefficients) == len(first) // 2 + 1
+        )
+        assert len(fir_filter.window.window_coefficients) == len(first) // 2 + 1
+
+    @pytest.mark.parametrize("minimize_order", [False, True])
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"window_type": "hamming"},
+            {"window_type": "equiripple"},
+            {"stopband_freq_hz": 2800},
+            {"passband_freq2_hz": 5200, "stopband_freq2_hz": 4200},
+            {"stopband_attenuation_db": 50},
+            {"passband_ripple_db": 0.1},
+            {"minimum_phase": True},
+            {
+                "filter_type": "bandpass",
+                "stopband_freq_hz": 1000,
+                "passband_freq_hz": 3000,
+                "passband_freq2_hz": 4000,
+                "stopband_freq2_hz": 5000,
+            },
+        ],
+    )
+    def test_matches_new_design(self, changes, minimize_order):
+        """
+        Test that a redesign matches designing the changed configuration from scratch.
+        """
+        fir_filter = EasyFirFilter(bandstop_conf, minimize_order=minimize_order)
+        fir_filter.calculate_filter()
+
+        coefficients = fir_filter.redesign(**changes)
+
+        assert coefficients == fir_filter.coefficients.tolist()
+        assert fir_filter.filter_conf == {**bandstop_conf, **changes}
+        assert_same_design(fir_filter, minimize_order)
+
+    def test_sequence_of_changes(self):
+        """
+        Test that every redesign of a tuning sequence matches a new design.
+        """
+        fir_filter = EasyFirFilter(bandstop_conf)
+        fir_filter.calculate_filter()
+
+        for changes in (
+            {"minimum_phase": True},
+            {"stopband_freq_hz": 2900},
+            {"window_type": "equiripple"},
+            {"stopband_attenuation_db": 40},
+            {"window_type": "kaiser"},
+            {"minimum_phase": None},
+        ):
+            fir_filter.redesign(**changes)
+            assert_same_design(fir_filter)
+
+        assert "minimum_phase" not in fir_filter.filter_conf
+
+    @pytest.mark.parametrize(
+        "changes, stages",
+        [
+            ({"window_type": "hamming"}, ["window", "coefficients"]),
+            (
+                {"stopband_freq_hz": 2900},
+                ["order", "impulse_response", "window", "coefficients"],
+            ),
+            (
+                {"stopband_attenuation_db": 50},
+                [
+                    "delta",
+                    "ripples",
+                    "d_parameter",
+                    "order",
+                    "impulse_response",
+                    "window",
+                    "coefficients",
+                ],
+            ),
+            ({"minimum_phase": True}, ["minimum_phase"]),
+            ({"stopband_freq_hz": 3000}, []),
+        ],
+    )
+    def test_recomputes_invalidated_stages(self, changes, stages):
+        """
+        Test that only the stages depending on the changed fields are recomputed.
+        """
+        collector = StageCollector()
+        fir_filter = EasyFirFilter(bandstop_conf, on_stage=collector)
+        fir_filter.calculate_filter()
+        collector.clear()
+
+        fir_filter.redesign(**changes)
+
+        assert [record["stage"] for record in collector.records] == [
+            "validation"
+        ] + stages
+
+    def test_frequency_change_keeps_kaiser_alpha(self, monkeypatch):
+        """
+        Test that a band edge change reuses the Kaiser alpha parameter.
+        """
+        fir_filter = EasyFirFilter(bandstop_conf)
+        fir_filter.calculate_filter()
+
+        def fail(AS):
+            raise AssertionError("alpha recomputed")
+
+        monkeypatch.setattr(fir_filter.window, "_calculate_alpha_parameter", fail)
+        fir_filter.redesign(stopband_freq_hz=2900)
+
+        assert_same_design(fir_filter)
+
+    def test_before_calculate_filter(self):
+        """
+        Test that redesigning a filter that was never calculated designs it.
+        """
+        fir_filter = EasyFirFilter(bandstop_conf)
+        fir_filter.redesign(window_type="blackman")
+
+        assert_same_design(fir_filter)
+
+    def test_invalid_change_keeps_design(self):
+        """
+        Test that an invalid change raises a ValueError and keeps the previous design.
+        """
+        fir_filter = EasyFirFilter(bandstop_conf)
+        coefficients = fir_filter.calculate_filter()
+
+        with pytest.raises(ValueError):
+            fir_filter.redesign(stopband_freq_hz=6000)
+
+        assert fir_filter.filter_conf == bandstop_conf
+        assert fir_filter.coefficients.tolist() == coefficients
+        assert_same_design(fir_filter)
+
+    @pytest.mark.parametrize("minimize_order", [False, True])
+    def test_failed_stage_keeps_design(self, minimize_order):
+        """
+        Test that a change whose design fails keeps the previous design, and that
+        later redesigns start from it.
+        """
+        fir_filter = EasyFirFilter(bandstop_conf, minimize_order=minimize_order)
+        coefficients = fir_filter.calculate_filter()
+
+        # Truncated to 4 decimals, delta is 0 and its logarithm fails
+        with pytest.raises(ValueError, match="math domain error"):
+            fir_filter.redesign(stopband_attenuation_db=100)
+
+        assert fir_filter.filter_conf == bandstop_conf
+        assert fir_filter.As == bandstop_conf["stopband_attenuation_db"]
+        assert fir_filter.redesign() == coefficients
+        assert_same_design(fir_filter, minimize_order)
+
+        fir_filter.redesign(window_type="blackman")
+        assert_same_design(fir_filter, minimize_order)
+        fir_filter.redesign(stopband_attenuation_db=50)
+        assert_same_design(fir_filter, minimize_order)
@@ -0,0 +1,201 @@
+"""
+This file contains the tests for the equiripple (Parks-McClellan) design.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import EasyFirFilter, FilterConf, design_many
+from easy_fir_filter.analysis import measure_spec, meets_spec
+from easy_fir_filter.equiripple import (
+    design_equiripple,
+    equiripple_coefficients,
+    estimate_equiripple_taps,
+    remez_bands,
+)
+
+equiripple_confs: list[FilterConf] = [
+    {
+        "filter_type": "lowpass",
+        "window_type": "equiripple",
+        "sampling_freq_hz": 8000,
+        "passband_freq_hz": 1000,
+        "stopband_freq_hz": 1500,
+        "passband_ripple_db": 0.1,
+        "stopband_attenuation_db": 60,
+    },
+    {
+        "filter_type": "highpass",
+        "window_type": "equiripple",
+        "sampling_freq_hz": 8000,
+        "passband_freq_hz": 2000,
+        "stopband_freq_hz": 1500,
+        "passband_ripple_db": 0.5,
+        "stopband_attenuation_db": 50,
+    },
+    {
+        "filter_type": "bandpass",
+        "window_type": "equiripple",
+        "sampling_freq_hz": 8000,
+        "passband_freq_hz": 1000,
+        "passband_freq2_hz": 2000,
+        "stopband_freq_hz": 700,
+        "stopband_freq2_hz": 2300,
+        "passband_ripple_db": 0.5,
+        "stopband_attenuation_db": 40,
+    },
+    {
+        "filter_type": "bandstop",
+        "window_type": "equiripple",
+        "sampling_freq_hz": 8000,
+        "passband_freq_hz": 1000,
+        "passband_freq2_hz": 2000,
+        "stopband_freq_hz": 1300,
+        "stopband_freq2_hz": 1700,
+        "passband_ripple_db": 0.5,
+        "stopband_attenuation_db": 40,
+    },
+]
+
+
+class TestRemezDesign:
+    """
+    Tests for the equiripple design functions.
+    """
+
+    def test_remez_bands(self):
+        """
+        Test that the bands are sorted and weighted by the inverse of their tolerance.
+        """
+        bands, desired, weight = remez_bands(equiripple_confs[3])
+
+        assert bands == [0.0, 1000, 1300, 1700, 2000, 4000]
+        assert desired == [1.0, 0.0, 1.0]
+        assert weight[0] == weight[2]
+        assert weight[1] == pytest.approx(100)
+
+    def test_estimate_is_odd(self):
+        """
+        Test that the estimated length is odd.
+        """
+        for filter_conf in equiripple_confs:
+            assert estimate_equiripple_taps(filter_conf) % 2 == 1
+
+    @pytest.mark.parametrize("filter_conf", equiripple_confs)
+    def test_design_is_the_shortest_meeting_the_spec(self, filter_conf):
+        """
+        Test that the design is symmetric and meets the specification, while the
+        next shorter odd length does not.
+        """
+        h = design_equiripple(filter_conf)
+
+        assert h.size % 2 == 1
+        np.testing.assert_array_equal(h, h[::-1])
+        assert meets_spec(measure_spec(h, filter_conf), filter_conf)
+
+        shorter = equiripple_coefficients(filter_conf, h.size - 2)
+        assert shorter is None or not meets_spec(
+            measure_spec(shorter, filter_conf), filter_conf
+        )
+
+    def test_does_not_skip_lengths_above_the_estimate(self):
+        """
+        Test a specification met a few lengths above the estimate, where the Remez
+        exchange diverges for longer filters.
+        """
+        filter_conf: FilterConf = {
+            "filter_type": "bandpass",
+            "window_type": "equiripple",
+            "sampling_freq_hz": 44100,
+            "passband_freq_hz": 5953.1,
+            "stopband_freq_hz": 5030.5,
+            "passband_freq2_hz": 12335,
+            "stopband_freq2_hz": 20097.2,
+            "passband_ripple_db": 0.36,
+            "stopband_attenuation_db": 25,
+        }
+        h = design_equiripple(filter_conf)
+
+        assert meets_spec(measure_spec(h, filter_conf), filter_conf)
+        assert h.size <= 61
+
+    def test_met_only_below_the_estimate(self):
+        """
+        Test a specification that no length from the estimate up meets, but shorter
+        designs do.
+        """
+        filter_conf: FilterConf = {
+            "filter_type": "bandpass",
+            "window_type": "equiripple",
+            "sampling_freq_hz": 48000,
+            "stopband_freq_hz": 2353.4,
+            "passband_freq_hz": 12062.4,
+            "passband_freq2_hz": 12335.1,
+            "stopband_freq2_hz": 13062.1,
+            "passband_ripple_db": 0.81,
+            "stopband_attenuation_db": 42,
+        }
+        h = design_equiripple(filter_conf)
+
+        assert meets_spec(measure_spec(h, filter_conf), filter_conf)
+        assert h.size < estimate_equiripple_taps(filter_conf)
+
+    def test_unreachable_spec(self):
+        """
+        Test that a specification no design can meet at this precision raises a
+        ValueError, without warnings from the designs truncated to zero.
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with pytest.raises(ValueError):
+                design_equiripple(
+                    {**equiripple_confs[0], "stopband_attenuation_db": 90}, round_to=2
+                )
+
+
+class TestEquirippleEasyFirFilter:
+    """
+    Tests for the equiripple window type of EasyFirFilter and design_many.
+    """
+
+    @pytest.mark.parametrize("filter_conf", equiripple_confs)
+    def test_saves_taps_over_kaiser(self, filter_conf):
+        """
+        Test that the equiripple design is shorter than the Kaiser design and
+        reports the difference.
+        """
+        equiripple = EasyFirFilter(filter_conf)
+        coefficients = equiripple.calculate_filter()
+        kaiser = EasyFirFilter({**filter_conf, "window_type": "kaiser"})
+
+        assert equiripple.window is None
+        assert equiripple.kaiser_taps == len(kaiser.calculate_filter())
+        assert equiripple.taps_saved == equiripple.kaiser_taps - len(coefficients)
+        assert equiripple.taps_saved > 0
+        np.testing.assert_array_equal(coefficients, design_equiripple(filter_conf))
+
+    def test_window_designs_save_no_taps(self):
+        """
+        Test that the window designs report no saved taps.
+        """
+        kaiser = EasyFirFilter({**equiripple_confs[0], "window_type": "kaiser"})
+        kaiser.calculate_filter()
+
+        assert kaiser.taps_saved == 0
+
+    def test_design_many(self):
+        """
+        Test that design_many matches EasyFirFilter for equiripple configurations
+        mixed with window ones.
+        """
+        filter_confs = equiripple_confs + [
+            {**equiripple_confs[0], "window_type": "hamming"}
+        ]
+        coefficient_sets = design_many(filter_confs)
+
+        for i, filter_conf in enumerate(filter_confs):
+            np.testing.assert_array_equal(
+                coefficient_sets[i], EasyFirFilter(filter_conf).calculate_filter()
+            )
@@ -0,0 +1,161 @@
+"""
+This file contains the tests for the direct-form filtering engine.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter.filtering import convolve_direct, output_window
+from easy_fir_filter.filtering.direct_form import is_symmetric
+
+
+class TestConvolveDirect:
+    """
+    Tests for the convolve_direct function.
+    """
+
+    @pytest.mark.parametrize("mode", ["full", "same", "valid"])
+    @pytest.mark.parametrize(
+        "signal_length,taps", [(200, 21), (200, 20), (21, 200), (7, 7), (1, 5)]
+    )
+    def test_convolve_direct_matches_numpy(self, mode, signal_length: int, taps: int):
+        """
+        Test that every mode matches numpy.convolve, whichever input is longer.
+        """
+        rng = np.random.default_rng(signal_length * taps)
+        signal = rng.standard_normal(signal_length)
+        coefficients = rng.standard_normal(taps)
+
+        result = convolve_direct(signal, coefficients, mode)
+
+        np.testing.assert_allclose(
+            result, np.convolve(signal, coefficients, mode), rtol=1e-12, atol=1e-12
+        )
+
+    @pytest.mark.parametrize("mode", ["full", "same", "valid"])
+    @pytest.mark.parametrize(
+        "signal_length,taps", [(200, 21), (200, 20), (21, 21), (5, 1)]
+    )
+    @pytest.mark.parametrize("symmetric", [None, True, False])
+    def test_convolve_direct_with_symmetric_coefficients_matches_numpy(
+        self, mode, signal_length: int, taps: int, symmetric: bool | None
+    ):
+        """
+        Test that the folded and generic kernels match numpy.convolve for symmetric
+        coefficients of odd and even length.
+        """
+        rng = np.random.default_rng(signal_length * taps)
+        signal = rng.standard_normal(signal_length)
+        half = rng.standard_normal((taps + 1) // 2)
+        coefficients = np.concatenate([half, half[::-1][taps % 2 :]])
+
+        result = convolve_direct(signal, coefficients, mode, symmetric=symmetric)
+
+        np.testing.assert_allclose(
+            result, np.convolve(signal, coefficients, mode), rtol=1e-12, atol=1e-12
+        )
+
+    def test_convolve_direct_rejects_asymmetric_coefficients_when_folding(self):
+        """
+        Test that forcing the folded kernel with asymmetric coefficients raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            convolve_direct(np.ones(10), [1.0, 2.0], symmetric=True)
+
+    def test_convolve_direct_writes_into_out(self):
+        """
+        Test that the output buffer is filled and returned, whatever it contained.
+        """
+        signal = np.arange(10.0)
+        out = np.full(10, np.nan)
+
+        result = convolve_direct(signal, [0.25, 0.5, 0.25], out=out)
+
+        assert result is out
+        np.testing.assert_allclose(out, np.convolve(signal, [0.25, 0.5, 0.25], "same"))
+
+    def test_convolve_direct_accepts_lists(self):
+        """
+        Test that lists of numbers are accepted as inputs.
+        """
+        assert convolve_direct([1, 2, 3], [1, 1], "full").tolist() == [
+            1.0,
+            3.0,
+            5.0,
+            3.0,
+        ]
+
+    @pytest.mark.parametrize(
+        "signal,coefficients",
+        [(1.0, [1.0]), ([], [1.0]), ([1.0], []), ([1.0], np.ones((2, 2)))],
+    )
+    def test_convolve_direct_rejects_invalid_inputs(self, signal, coefficients):
+        """
+        Test that scalar or empty signals and coefficients that are not non-empty
+        1-D arrays raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            convolve_direct(signal, coefficients)
+
+    def test_convolve_direct_rejects_invalid_mode(self):
+        """
+        Test that an unknown mode raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            convolve_direct([1.0, 2.0], [1.0], "circular")  # type: ignore
+
+    @pytest.mark.parametrize(
+        "out", [np.empty(9), np.empty(10, dtype=np.float32), [0.0] * 10]
+    )
+    def test_convolve_direct_rejects_invalid_out(self, out):
+        """
+        Test that an output buffer of the wrong shape or type raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            convolve_direct(np.ones(10), [1.0, 1.0], out=out)
+
+    def test_convolve_direct_rejects_out_overlapping_the_signal(self):
+        """
+        Test that filtering a signal in place raises a ValueError.
+        """
+        signal = np.ones(10)
+
+        with pytest.raises(ValueError):
+            convolve_direct(signal, [1.0], out=signal)
+
+
+class TestOutputWindow:
+    """
+    Tests for the output_window function.
+    """
+
+    @pytest.mark.parametrize(
+        "mode,expected", [("full", (0, 14)), ("same", (2, 10)), ("valid", (4, 6))]
+    )
+    def test_output_window(self, mode, expected: tuple[int, int]):
+        """
+        Test the start and length of every mode.
+        """
+        assert output_window(10, 5, mode) == expected
+        assert output_window(5, 10, mode) == expected
+
+
+class TestIsSymmetric:
+    """
+    Tests for the is_symmetric function.
+    """
+
+    @pytest.mark.parametrize(
+        "coefficients,expected",
+        [
+            ([1.0], True),
+            ([1.0, 2.0, 1.0], True),
+            ([1.0, 1.0], True),
+            ([1.0, 2.0], False),
+        ],
+    )
+    def test_is_symmetric(self, coefficients: list[float], expected: bool):
+        """
+        Test the detection of symmetric coefficients.
+        """
+        assert is_symmetric(np.array(coefficients)) is expected
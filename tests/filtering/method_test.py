@@ -0,0 +1,51 @@
+"""
+This file contains the tests for the crossover heuristic of the filtering engines.
+"""
+
+import pytest
+
+from easy_fir_filter.filtering import choose_method
+
+
+class TestChooseMethod:
+    """
+    Tests for the choose_method function.
+    """
+
+    @pytest.mark.parametrize("signal_length", [1000, 100_000])
+    def test_choose_method_uses_direct_form_for_short_filters(self, signal_length):
+        """
+        Test that a filter with a few taps is applied with the direct form.
+        """
+        assert choose_method(signal_length, 3) == "direct"
+
+    @pytest.mark.parametrize("signal_length", [1000, 100_000])
+    def test_choose_method_uses_fft_for_long_filters(self, signal_length):
+        """
+        Test that a filter with thousands of taps is applied with the FFT.
+        """
+        assert choose_method(signal_length, 2001) == "fft"
+
+    def test_choose_method_rejects_invalid_mode(self):
+        """
+        Test that an unknown mode raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            choose_method(100, 10, "circular")  # type: ignore
+
+    def test_choose_method_accounts_for_zero_taps(self):
+        """
+        Test that a half-band filter, whose zero taps the direct form skips, stays
+        with the direct form at a length where a dense filter would not.
+        """
+        assert choose_method(100_000, 31) == "fft"
+        assert choose_method(100_000, 31, zero_taps=14) == "direct"
+
+    def test_choose_method_accounts_for_symmetric_coefficients(self):
+        """
+        Test that symmetric coefficients, which the direct form filters with the
+        folded kernel, stay with the direct form at a length where asymmetric ones
+        would not.
+        """
+        assert choose_method(100_000, 27) == "fft"
+        assert choose_method(100_000, 27, symmetric=True) == "direct"
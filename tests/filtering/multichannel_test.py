@@ -0,0 +1,164 @@
+"""
+This file contains the tests for filtering multichannel signals along an axis.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import EasyFirFilter, StreamingFirFilter
+from easy_fir_filter.filtering import convolve_direct, convolve_fft
+from easy_fir_filter.filtering.output_window import as_signals
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+
+def _expected(signals: np.ndarray, coefficients: np.ndarray, mode, axis: int):
+    """
+    Filters every channel with numpy.convolve.
+    """
+    return np.apply_along_axis(np.convolve, axis, signals, coefficients, mode)
+
+
+class TestMultichannelFiltering:
+    """
+    Tests for the multichannel filtering of the direct-form and overlap-add engines.
+    """
+
+    @pytest.mark.parametrize("engine", [convolve_direct, convolve_fft])
+    @pytest.mark.parametrize("mode", ["full", "same", "valid"])
+    @pytest.mark.parametrize("axis", [0, 1, -1])
+    @pytest.mark.parametrize("symmetric", [False, True])
+    def test_engines_filter_every_channel(self, engine, mode, axis: int, symmetric):
+        """
+        Test that (channels, samples) and (samples, channels) arrays are filtered
+        along the chosen axis, like filtering each channel on its own.
+        """
+        rng = np.random.default_rng(axis + 3)
+        signals = rng.standard_normal((8, 300) if axis != 0 else (300, 8))
+        coefficients = rng.standard_normal(31)
+        if symmetric:
+            coefficients = coefficients + coefficients[::-1]
+
+        result = engine(signals, coefficients, mode, axis=axis)
+
+        np.testing.assert_allclose(
+            result, _expected(signals, coefficients, mode, axis), rtol=0, atol=1e-11
+        )
+
+    @pytest.mark.parametrize("engine", [convolve_direct, convolve_fft])
+    def test_engines_filter_channels_shorter_than_the_filter(self, engine):
+        """
+        Test channels with fewer samples than taps.
+        """
+        rng = np.random.default_rng(0)
+        signals = rng.standard_normal((4, 10))
+        coefficients = rng.standard_normal(25)
+
+        result = engine(signals, coefficients, "full")
+
+        np.testing.assert_allclose(
+            result, _expected(signals, coefficients, "full", -1), rtol=0, atol=1e-11
+        )
+
+    @pytest.mark.parametrize("engine", [convolve_direct, convolve_fft])
+    def test_engines_write_into_out_with_the_input_layout(self, engine):
+        """
+        Test that the output buffer has the layout of the input.
+        """
+        signals = np.ones((100, 4))
+        out = np.empty((100, 4))
+
+        assert engine(signals, np.ones(5), out=out, axis=0) is out
+        np.testing.assert_allclose(out, _expected(signals, np.ones(5), "same", 0))
+
+    @pytest.mark.parametrize("engine", [convolve_direct, convolve_fft])
+    def test_engines_reject_invalid_axis(self, engine):
+        """
+        Test that an axis out of range raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            engine(np.ones((4, 10)), np.ones(3), axis=2)
+
+    def test_signals_are_not_copied(self):
+        """
+        Test that a non-contiguous float64 input is read in place.
+        """
+        signals = np.ones((1000, 16))[:, ::2]
+
+        assert np.shares_memory(as_signals(signals, 0), signals)
+
+    @pytest.mark.parametrize("method", ["auto", "direct", "fft"])
+    def test_apply_filters_multichannel_signals(self, method):
+        """
+        Test EasyFirFilter.apply on a (samples, channels) array.
+        """
+        fir_filter = EasyFirFilter(list_filter_configurations[1])
+        coefficients = fir_filter.calculate_filter()
+        signals = np.random.default_rng(0).standard_normal((500, 64))
+
+        result = fir_filter.apply(signals, method=method, axis=0)
+
+        np.testing.assert_allclose(
+            result, _expected(signals, coefficients, "same", 0), rtol=0, atol=1e-11
+        )
+
+
+class TestMultichannelStreaming:
+    """
+    Tests for the multichannel StreamingFirFilter.
+    """
+
+    @pytest.mark.parametrize("axis", [0, 1])
+    @pytest.mark.parametrize("symmetric", [False, True])
+    def test_process_keeps_a_state_per_channel(self, axis: int, symmetric: bool):
+        """
+        Test that every channel is filtered like its concatenated signal.
+        """
+        rng = np.random.default_rng(axis)
+        coefficients = rng.standard_normal(21)
+        if symmetric:
+            coefficients = coefficients + coefficients[::-1]
+        signals = rng.standard_normal((6, 400))
+        streaming_filter = StreamingFirFilter(coefficients, channels=6)
+
+        outputs = []
+        for first, last in [(0, 5), (5, 105), (105, 106), (106, 400)]:
+            chunk = signals[:, first:last]
+            chunk = chunk if axis == 1 else np.ascontiguousarray(chunk.T)
+            output = streaming_filter.process(chunk, axis=axis)
+            outputs.append(output if axis == 1 else output.T)
+
+        np.testing.assert_allclose(
+            np.concatenate(outputs, axis=1),
+            _expected(signals, coefficients, "full", 1)[:, :400],
+            rtol=0,
+            atol=1e-12,
+        )
+
+    def test_snapshot_has_one_state_per_channel(self):
+        """
+        Test the shape of the state and that restore checks it.
+        """
+        streaming_filter = StreamingFirFilter(np.ones(5), channels=3)
+        streaming_filter.process(np.ones((3, 10)))
+        state = streaming_filter.snapshot()
+
+        assert state.shape == (3, 4)
+        with pytest.raises(ValueError):
+            streaming_filter.restore(np.zeros(4))
+
+    @pytest.mark.parametrize(
+        "chunk", [np.ones(10), np.ones((4, 10)), np.ones((3, 2, 1))]
+    )
+    def test_process_rejects_chunks_with_other_channels(self, chunk):
+        """
+        Test that chunks without the channels of the filter raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            StreamingFirFilter(np.ones(5), channels=3).process(chunk)
+
+    def test_rejects_invalid_channels(self):
+        """
+        Test that a number of channels lower than 1 raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            StreamingFirFilter(np.ones(5), channels=0)
@@ -0,0 +1,113 @@
+"""
+This file contains the tests for the FFT overlap-add filtering engine.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter.filtering import OverlapAddConvolver, choose_fft_size, convolve_fft
+
+
+class TestOverlapAdd:
+    """
+    Tests for the OverlapAddConvolver class and the convolve_fft function.
+    """
+
+    @pytest.mark.parametrize("mode", ["full", "same", "valid"])
+    @pytest.mark.parametrize(
+        "signal_length,taps", [(5000, 101), (5000, 100), (101, 5000), (1, 1), (3, 40)]
+    )
+    @pytest.mark.parametrize("block_size", [None, 1, 300])
+    def test_convolve_fft_matches_numpy(
+        self, mode, signal_length: int, taps: int, block_size: int | None
+    ):
+        """
+        Test that every mode and block size matches numpy.convolve.
+        """
+        rng = np.random.default_rng(signal_length + taps)
+        signal = rng.standard_normal(signal_length)
+        coefficients = rng.standard_normal(taps)
+
+        result = convolve_fft(signal, coefficients, mode, block_size=block_size)
+
+        np.testing.assert_allclose(
+            result, np.convolve(signal, coefficients, mode), rtol=0, atol=1e-11
+        )
+
+    def test_convolver_processes_several_batches(self, monkeypatch):
+        """
+        Test that long signals, processed in several batches of blocks, match numpy.convolve.
+        """
+        monkeypatch.setattr("easy_fir_filter.filtering.overlap_add._BATCH_SAMPLES", 256)
+        rng = np.random.default_rng(0)
+        signal = rng.standard_normal(20000)
+        coefficients = rng.standard_normal(61)
+
+        result = OverlapAddConvolver(coefficients).convolve(signal, "full")
+
+        np.testing.assert_allclose(
+            result, np.convolve(signal, coefficients), rtol=0, atol=1e-11
+        )
+
+    def test_convolver_caches_the_spectrum(self):
+        """
+        Test that the spectrum of the coefficients is computed once per FFT size.
+        """
+        convolver = OverlapAddConvolver(np.ones(31))
+
+        assert convolver.spectrum(256) is convolver.spectrum(256)
+        np.testing.assert_allclose(
+            convolver.spectrum(256), np.fft.rfft(np.ones(31), 256)
+        )
+
+    def test_convolver_writes_into_out(self):
+        """
+        Test that the output buffer is filled and returned, whatever it contained.
+        """
+        out = np.full(100, np.nan)
+
+        result = OverlapAddConvolver(np.ones(5)).convolve(np.ones(100), out=out)
+
+        assert result is out
+        np.testing.assert_allclose(out, np.convolve(np.ones(100), np.ones(5), "same"))
+
+    def test_convolver_keeps_a_copy_of_the_coefficients(self):
+        """
+        Test that changing the coefficients after creating the convolver has no effect.
+        """
+        coefficients = np.ones(5)
+        convolver = OverlapAddConvolver(coefficients)
+        coefficients[:] = 0
+
+        assert convolver.convolve(np.ones(10)).any()
+
+
+class TestChooseFftSize:
+    """
+    Tests for the choose_fft_size function.
+    """
+
+    @pytest.mark.parametrize("taps", [1, 2, 11, 101, 1001, 5001])
+    def test_choose_fft_size_is_a_large_enough_power_of_two(self, taps: int):
+        """
+        Test that the FFT size is a power of two that fits twice the filter tail.
+        """
+        size = choose_fft_size(taps)
+
+        assert size & (size - 1) == 0
+        assert size >= 2 * (taps - 1)
+
+    def test_choose_fft_size_with_block_size(self):
+        """
+        Test that a block size gives the smallest power of two holding a block and the tail.
+        """
+        assert choose_fft_size(101, 924) == 1024
+        assert choose_fft_size(101, 925) == 2048
+
+    @pytest.mark.parametrize("taps,block_size", [(0, None), (10, 0)])
+    def test_choose_fft_size_rejects_invalid_values(self, taps, block_size):
+        """
+        Test that taps or block sizes lower than 1 raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            choose_fft_size(taps, block_size)
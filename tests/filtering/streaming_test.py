@@ -0,0 +1,146 @@
+"""
+This file contains the tests for the StreamingFirFilter class.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import EasyFirFilter, StreamingFirFilter
+from tests.fixtures.filter_configurations import list_filter_configurations
+
+
+def _process_chunks(
+    streaming_filter: StreamingFirFilter, signal: np.ndarray, sizes: list[int]
+) -> np.ndarray:
+    """
+    Filters a signal split into chunks of the given sizes.
+    """
+    bounds = np.cumsum([0, *sizes])
+
+    return np.concatenate(
+        [streaming_filter.process(signal[a:b]) for a, b in zip(bounds, bounds[1:])]
+    )
+
+
+class TestStreamingFirFilter:
+    """
+    Tests for the StreamingFirFilter class.
+    """
+
+    @pytest.mark.parametrize("taps", [1, 2, 31, 200])
+    @pytest.mark.parametrize("symmetric", [False, True])
+    def test_process_matches_filtering_the_concatenated_signal(
+        self, taps: int, symmetric: bool
+    ):
+        """
+        Test that chunks of varying sizes, shorter and longer than the filter,
+        give the output of filtering the whole signal, with the generic and the
+        folded kernel.
+        """
+        rng = np.random.default_rng(taps)
+        coefficients = rng.standard_normal(taps)
+        if symmetric:
+            coefficients = coefficients + coefficients[::-1]
+        sizes = [1, 7, 0, 300, 3, 64, 1000, 2, 150]
+        signal = rng.standard_normal(sum(sizes))
+
+        result = _process_chunks(StreamingFirFilter(coefficients), signal, sizes)
+
+        np.testing.assert_allclose(
+            result,
+            np.convolve(signal, coefficients)[: signal.size],
+            rtol=0,
+            atol=1e-12,
+        )
+
+    def test_process_with_easy_fir_filter_coefficients(self):
+        """
+        Test streaming with the coefficients of a designed filter.
+        """
+        coefficients = EasyFirFilter(list_filter_configurations[1]).calculate_filter()
+        signal = np.random.default_rng(0).standard_normal(1000)
+
+        result = _process_chunks(StreamingFirFilter(coefficients), signal, [100] * 10)
+
+        np.testing.assert_allclose(
+            result, np.convolve(signal, coefficients)[:1000], rtol=0, atol=1e-12
+        )
+
+    def test_process_does_not_allocate_after_warm_up(self):
+        """
+        Test that processing into an output buffer allocates no array after warm-up.
+        """
+        streaming_filter = StreamingFirFilter(np.ones(101), max_chunk_size=4096)
+        chunk = np.ones(4096)
+        out = np.empty(4096)
+        streaming_filter.process(chunk, out)
+
+        tracemalloc.start()
+        for size in (4096, 1000, 17):
+            streaming_filter.process(chunk[:size], out[:size])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert peak < chunk.nbytes // 4
+
+    def test_reset_clears_the_state(self):
+        """
+        Test that after a reset, the filter behaves like a new one.
+        """
+        coefficients = np.arange(1.0, 6.0)
+        streaming_filter = StreamingFirFilter(coefficients)
+        streaming_filter.process(np.ones(10))
+        streaming_filter.reset()
+
+        assert streaming_filter.process([1.0, 0.0, 0.0]).tolist() == [1.0, 2.0, 3.0]
+
+    def test_snapshot_and_restore(self):
+        """
+        Test that restoring a snapshot resumes the stream from that point.
+        """
+        rng = np.random.default_rng(0)
+        streaming_filter = StreamingFirFilter(rng.standard_normal(21))
+        streaming_filter.process(rng.standard_normal(50))
+        state = streaming_filter.snapshot()
+        chunk = rng.standard_normal(30)
+
+        expected = streaming_filter.process(chunk).copy()
+        streaming_filter.process(rng.standard_normal(40))
+        streaming_filter.restore(state)
+
+        assert state.shape == (20,)
+        np.testing.assert_array_equal(streaming_filter.process(chunk), expected)
+
+    def test_snapshot_is_a_copy(self):
+        """
+        Test that processing more samples does not change a snapshot.
+        """
+        streaming_filter = StreamingFirFilter(np.ones(5))
+        state = streaming_filter.snapshot()
+        streaming_filter.process(np.ones(10))
+
+        assert not state.any()
+
+    def test_restore_rejects_invalid_state(self):
+        """
+        Test that a state of the wrong length raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            StreamingFirFilter(np.ones(5)).restore(np.zeros(5))
+
+    @pytest.mark.parametrize("chunk", [np.ones((2, 3)), [[1.0]]])
+    def test_process_rejects_invalid_chunks(self, chunk):
+        """
+        Test that chunks that are not 1-D arrays raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            StreamingFirFilter(np.ones(5)).process(chunk)
+
+    def test_rejects_negative_max_chunk_size(self):
+        """
+        Test that a negative maximum chunk size raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            StreamingFirFilter(np.ones(5), max_chunk_size=-1)
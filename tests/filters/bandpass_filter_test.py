@@ -2,11 +2,15 @@
 This file contains tests for the bandpass filter.
 """
 
+import math
+
+import numpy as np
 import pytest
 
 from easy_fir_filter import FilterConf
 from easy_fir_filter.filters.bandpass_filter import BandpassFilter
 from easy_fir_filter.filters.highpass_filter import HighpassFilter
+from easy_fir_filter.utils import truncate
 
 bandpass_filter_configurations: list[FilterConf] = [
     {
@@ -664,16 +668,16 @@ class TestBandpassFilter:
         "filter_conf, order",
         list(zip(bandpass_filter_configurations, bandpass_order_results)),
     )
-    def test_calculate_impulse_response_coefficients_returns_list(
+    def test_calculate_impulse_response_coefficients_returns_ndarray(
         self, filter_builder: HighpassFilter, order: tuple[int, int]
     ):
         """
-        Test that the calculate_impulse_response_coefficients method returns a list.
+        Test that the calculate_impulse_response_coefficients method returns an ndarray.
         """
         n, N = order
         filter_builder.n = n
         assert isinstance(
-            filter_builder.calculate_impulse_response_coefficients(), list
+            filter_builder.calculate_impulse_response_coefficients(), np.ndarray
         )
 
     @pytest.mark.parametrize(
@@ -713,4 +717,31 @@ class TestBandpassFilter:
         n, N = order
         filter_builder.n = n
         c = filter_builder.calculate_impulse_response_coefficients()
-        assert c == coefficients
+        assert c.tolist() == coefficients
+
+    @pytest.mark.parametrize("filter_conf", bandpass_filter_configurations)
+    def test_calculate_impulse_response_coefficients_matches_scalar_formula(
+        self, filter_builder: BandpassFilter
+    ):
+        """
+        Test that the vectorized impulse response is bit-identical to the
+        per-coefficient formula for a long filter.
+        """
+        n = 2000
+        filter_builder.n = n
+        F = filter_builder.F
+        deltaF = min(
+            filter_builder.fp - filter_builder.fs,
+            filter_builder.fs2 - filter_builder.fp2,
+        )
+        fc1 = filter_builder.fp - (deltaF / 2)
+        fc2 = filter_builder.fp2 + (deltaF / 2)
+        expected = [truncate((2 / F) * (fc2 - fc1), 7)]
+        for nc in range(1, n + 1):
+            term1 = (2 * math.pi * nc * fc2) / F
+            term2 = (2 * math.pi * nc * fc1) / F
+            c = (1 / (nc * math.pi)) * (math.sin(term1) - math.sin(term2))
+            expected.append(truncate(c, 7))
+
+        c = filter_builder.calculate_impulse_response_coefficients()
+        assert c.tolist() == expected
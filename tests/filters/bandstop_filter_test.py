@@ -2,11 +2,15 @@
 This file contains tests for the bandstop filter.
 """
 
+import math
+
+import numpy as np
 import pytest
 
 from easy_fir_filter import FilterConf
 from easy_fir_filter.filters.bandstop_filter import BandstopFilter
 from easy_fir_filter.filters.highpass_filter import HighpassFilter
+from easy_fir_filter.utils import truncate
 
 bandstop_filter_configurations: list[FilterConf] = [
     {
@@ -634,16 +638,16 @@ class TestBandstopFilter:
         "filter_conf, order",
         list(zip(bandstop_filter_configurations, bandstop_order_results)),
     )
-    def test_calculate_impulse_response_coefficients_returns_list(
+    def test_calculate_impulse_response_coefficients_returns_ndarray(
         self, filter_builder: HighpassFilter, order: tuple[int, int]
     ):
         """
-        Test that the calculate_impulse_response_coefficients method returns a list.
+        Test that the calculate_impulse_response_coefficients method returns an ndarray.
         """
         n, N = order
         filter_builder.n = n
         assert isinstance(
-            filter_builder.calculate_impulse_response_coefficients(), list
+            filter_builder.calculate_impulse_response_coefficients(), np.ndarray
         )
 
     @pytest.mark.parametrize(
@@ -683,4 +687,31 @@ class TestBandstopFilter:
         n, N = order
         filter_builder.n = n
         c = filter_builder.calculate_impulse_response_coefficients()
-        assert c == coefficients
+        assert c.tolist() == coefficients
+
+    @pytest.mark.parametrize("filter_conf", bandstop_filter_configurations)
+    def test_calculate_impulse_response_coefficients_matches_scalar_formula(
+        self, filter_builder: BandstopFilter
+    ):
+        """
+        Test that the vectorized impulse response is bit-identical to the
+        per-coefficient formula for a long filter.
+        """
+        n = 2000
+        filter_builder.n = n
+        F = filter_builder.F
+        deltaF = min(
+            filter_builder.fs - filter_builder.fp,
+            filter_builder.fp2 - filter_builder.fs2,
+        )
+        fc1 = filter_builder.fp + (deltaF / 2)
+        fc2 = filter_builder.fp2 - (deltaF / 2)
+        expected = [(2 / F) * (fc1 - fc2) + 1]
+        for nc in range(1, n + 1):
+            term1 = (2 * math.pi * nc * fc1) / F
+            term2 = (2 * math.pi * nc * fc2) / F
+            c = (1 / (nc * math.pi)) * (math.sin(term1) - math.sin(term2))
+            expected.append(truncate(c, 7))
+
+        c = filter_builder.calculate_impulse_response_coefficients()
+        assert c.tolist() == expected
@@ -2,10 +2,14 @@
 This file contains tests for the highpass filter.
 """
 
+import math
+
+import numpy as np
 import pytest
 
 from easy_fir_filter import FilterConf
 from easy_fir_filter.filters.highpass_filter import HighpassFilter
+from easy_fir_filter.utils import truncate
 
 highpass_filter_configurations: list[FilterConf] = [
     {
@@ -732,16 +736,16 @@ class TestHighpassFilter:
         "filter_conf, order",
         list(zip(highpass_filter_configurations, highpass_order_results)),
     )
-    def test_calculate_impulse_response_coefficients_returns_list(
+    def test_calculate_impulse_response_coefficients_returns_ndarray(
         self, filter_builder: HighpassFilter, order: tuple[int, int]
     ):
         """
-        Test that the calculate_impulse_response_coefficients method returns a list.
+        Test that the calculate_impulse_response_coefficients method returns an ndarray.
         """
         n, N = order
         filter_builder.n = n
         assert isinstance(
-            filter_builder.calculate_impulse_response_coefficients(), list
+            filter_builder.calculate_impulse_response_coefficients(), np.ndarray
         )
 
     @pytest.mark.parametrize(
@@ -781,4 +785,24 @@ class TestHighpassFilter:
         n, N = order
         filter_builder.n = n
         c = filter_builder.calculate_impulse_response_coefficients()
-        assert c == coefficients
+        assert c.tolist() == coefficients
+
+    @pytest.mark.parametrize("filter_conf", highpass_filter_configurations)
+    def test_calculate_impulse_response_coefficients_matches_scalar_formula(
+        self, filter_builder: HighpassFilter
+    ):
+        """
+        Test that the vectorized impulse response is bit-identical to the
+        per-coefficient formula for a long filter.
+        """
+        n = 2000
+        filter_builder.n = n
+        fc = 0.5 * (filter_builder.fp + filter_builder.fs)
+        expected = [truncate(1 - ((2 * fc) / filter_builder.F), 7)]
+        for nc in range(1, n + 1):
+            term = (2 * math.pi * nc * fc) / filter_builder.F
+            c = -((2 * fc) / filter_builder.F) * (math.sin(term) / term)
+            expected.append(truncate(c, 7))
+
+        c = filter_builder.calculate_impulse_response_coefficients()
+        assert c.tolist() == expected
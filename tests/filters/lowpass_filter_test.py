@@ -2,11 +2,15 @@
 This file contains tests for the lowpass filter.
 """
 
+import math
+
+import numpy as np
 import pytest
 
 from easy_fir_filter import FilterConf
 from easy_fir_filter.filters.lowpass_filter import LowpassFilter
 from easy_fir_filter.interfaces.filter_interface import IFilter
+from easy_fir_filter.utils import truncate
 
 lowpass_filter_configurations: list[FilterConf] = [
     {
@@ -207,6 +211,17 @@ correct_impulse_response_coefficients = [
     ],
 ]
 
+half_band_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "kaiser",
+    "sampling_freq_hz": 48000,
+    "passband_freq_hz": 10000,
+    "stopband_freq_hz": 14000,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 60,
+    "half_band": True,
+}
+
 
 class TestLowpassFilter:
     """
@@ -261,16 +276,16 @@ class TestLowpassFilter:
         "filter_conf, order",
         list(zip(lowpass_filter_configurations, lowpass_order_results)),
     )
-    def test_calculate_impulse_response_coefficients_returns_list(
+    def test_calculate_impulse_response_coefficients_returns_ndarray(
         self, filter_builder: IFilter, order: tuple[int, int]
     ):
         """
-        Test that the calculate_impulse_response_coefficients method returns a list.
+        Test that the calculate_impulse_response_coefficients method returns an ndarray.
         """
         n, N = order
         filter_builder.n = n
         assert isinstance(
-            filter_builder.calculate_impulse_response_coefficients(), list
+            filter_builder.calculate_impulse_response_coefficients(), np.ndarray
         )
 
     @pytest.mark.parametrize(
@@ -307,4 +322,49 @@ class TestLowpassFilter:
         n, N = order
         filter_builder.n = n
         c = filter_builder.calculate_impulse_response_coefficients()
-        assert c == coefficients
+        assert c.tolist() == coefficients
+
+    @pytest.mark.parametrize("filter_conf", lowpass_filter_configurations)
+    def test_calculate_impulse_response_coefficients_matches_scalar_formula(
+        self, filter_builder: IFilter
+    ):
+        """
+        Test that the vectorized impulse response is bit-identical to the
+        per-coefficient formula for a long filter.
+        """
+        n = 2000
+        filter_builder.n = n
+        fc = 0.5 * (filter_builder.fp + filter_builder.fs)
+        n0 = (2 * fc) / filter_builder.F
+        expected = [n0]
+        for nc in range(1, n + 1):
+            term = (2 * math.pi * nc * fc) / filter_builder.F
+            expected.append(truncate(n0 * (math.sin(term) / term), 7))
+
+        c = filter_builder.calculate_impulse_response_coefficients()
+        assert c.tolist() == expected
+
+    @pytest.mark.parametrize("d", [1.0, 2.0, 3.0, 4.0])
+    def test_half_band_order_is_odd(self, d: float):
+        """
+        Test that a half-band filter always has an odd order, so its outermost
+        coefficients are not zero.
+        """
+        lowpass = LowpassFilter(half_band_conf, 7)
+        n, N = lowpass.calculate_filter_order(d)
+
+        assert n % 2 == 1
+        assert N == 2 * n + 1
+        assert lowpass.n == n
+
+    def test_half_band_taps_are_exactly_zero(self):
+        """
+        Test that the coefficients at even, nonzero indexes of a half-band filter are exactly 0.
+        """
+        lowpass = LowpassFilter(half_band_conf, 12)
+        lowpass.calculate_filter_order(3.0)
+        c = lowpass.calculate_impulse_response_coefficients()
+
+        assert c[0] == 0.5
+        assert np.all(c[2::2] == 0.0)
+        assert np.all(c[1::2] != 0.0)
@@ -0,0 +1,168 @@
+"""
+This file contains the tests for the per-stage design instrumentation.
+"""
+
+import tracemalloc
+
+import pytest
+
+from easy_fir_filter import EasyFirFilter, FilterConf
+from easy_fir_filter.instrumentation import StageCollector, timed_stage
+
+lowpass_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "kaiser",
+    "sampling_freq_hz": 8000,
+    "passband_freq_hz": 1000,
+    "stopband_freq_hz": 1500,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 60,
+}
+
+
+class TestStageInstrumentation:
+    """
+    Tests for timed_stage, StageCollector and the on_stage option of EasyFirFilter.
+    """
+
+    def test_records_every_stage_in_order(self):
+        """
+        Test that a window design reports its stages in the order they run.
+        """
+        collector = StageCollector()
+        EasyFirFilter(lowpass_conf, on_stage=collector).calculate_filter()
+
+        assert [record["stage"] for record in collector.records] == [
+            "validation",
+            "delta",
+            "ripples",
+            "d_parameter",
+            "order",
+            "impulse_response",
+            "window",
+            "coefficients",
+        ]
+        assert all(record["seconds"] >= 0 for record in collector.records)
+        assert all(record["peak_bytes"] is None for record in collector.records)
+
+    def test_taps_known_from_the_order_stage(self):
+        """
+        Test that the tap count is None before the order is calculated and N after.
+        """
+        collector = StageCollector()
+        fir_filter = EasyFirFilter(lowpass_conf, on_stage=collector)
+        coefficients = fir_filter.calculate_filter()
+
+        taps = {record["stage"]: record["taps"] for record in collector.records}
+        assert taps["delta"] is None
+        assert taps["order"] == fir_filter.kaiser_taps
+        assert taps["coefficients"] == len(coefficients)
+
+    @pytest.mark.parametrize(
+        "options, stages",
+        [
+            ({"window_type": "equiripple"}, ["equiripple"]),
+            ({"minimum_phase": True}, ["window", "coefficients", "minimum_phase"]),
+        ],
+    )
+    def test_optional_stages(self, options, stages):
+        """
+        Test that the equiripple and minimum-phase stages are reported.
+        """
+        collector = StageCollector()
+        fir_filter = EasyFirFilter(
+            {**lowpass_conf, **options}, on_stage=collector  # type: ignore
+        )
+        fir_filter.calculate_filter()
+
+        recorded = [record["stage"] for record in collector.records]
+        assert recorded[-len(stages) :] == stages
+        assert collector.records[-1]["taps"] == len(fir_filter.coefficients)
+
+    def test_minimum_order_reports_searched_taps(self):
+        """
+        Test that the minimum-order search reports the length it settled on.
+        """
+        collector = StageCollector()
+        fir_filter = EasyFirFilter(
+            lowpass_conf, minimize_order=True, on_stage=collector
+        )
+        coefficients = fir_filter.calculate_filter()
+
+        taps = {record["stage"]: record["taps"] for record in collector.records}
+        assert taps["minimum_order"] == len(coefficients)
+
+    def test_trace_memory(self):
+        """
+        Test that peak memory is recorded with trace_memory and tracing is stopped after.
+        """
+        assert not tracemalloc.is_tracing()
+        collector = StageCollector()
+        EasyFirFilter(
+            lowpass_conf, on_stage=collector, trace_memory=True
+        ).calculate_filter()
+
+        assert not tracemalloc.is_tracing()
+        assert all(record["peak_bytes"] >= 0 for record in collector.records)
+        peaks = {record["stage"]: record["peak_bytes"] for record in collector.records}
+        assert peaks["window"] > 0
+
+    def test_keeps_running_trace(self):
+        """
+        Test that a trace started by the caller is left running with its peak.
+        """
+        tracemalloc.start()
+        try:
+            block = bytearray(1_000_000)
+            del block
+            outer_peak = tracemalloc.get_traced_memory()[1]
+            collector = StageCollector()
+            with timed_stage("delta", collector, lambda: None, True):
+                kept = bytearray(1000)
+
+            assert tracemalloc.is_tracing()
+            assert tracemalloc.get_traced_memory()[1] >= outer_peak
+            assert collector.records[0]["peak_bytes"] >= len(kept)
+
+            with timed_stage("window", collector, lambda: None, True):
+                bytearray(2_000_000)
+
+            assert collector.records[1]["peak_bytes"] >= 2_000_000
+        finally:
+            tracemalloc.stop()
+
+    def test_failed_stage_not_recorded(self):
+        """
+        Test that a stage raising an exception is not recorded.
+        """
+        collector = StageCollector()
+        with pytest.raises(RuntimeError):
+            with timed_stage("delta", collector, lambda: None, True):
+                raise RuntimeError
+
+        assert collector.records == []
+        assert not tracemalloc.is_tracing()
+
+    def test_disabled_by_default(self):
+        """
+        Test that no stage is measured without a callback.
+        """
+        fir_filter = EasyFirFilter(lowpass_conf)
+        fir_filter.calculate_filter()
+
+        assert fir_filter.on_stage is None
+
+    def test_totals_and_clear(self):
+        """
+        Test that the collector sums the time of repeated stages and can be cleared.
+        """
+        collector = StageCollector()
+        for seconds in (0.5, 0.25):
+            collector(
+                {"stage": "window", "seconds": seconds, "taps": 3, "peak_bytes": None}
+            )
+        collector({"stage": "delta", "seconds": 1.0, "taps": None, "peak_bytes": None})
+
+        assert collector.totals() == {"window": 0.75, "delta": 1.0}
+        collector.clear()
+        assert collector.records == [] and collector.totals() == {}
@@ -0,0 +1,175 @@
+"""
+This file contains the tests for the Decimator class.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import Decimator, FilterConf
+from easy_fir_filter.multirate import polyphase_branches
+
+decimator_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "kaiser",
+    "sampling_freq_hz": 48000,
+    "passband_freq_hz": 4000,
+    "stopband_freq_hz": 6000,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 60,
+}
+
+
+def _reference(decimator: Decimator, signal: np.ndarray) -> np.ndarray:
+    """
+    Filters the whole signal and keeps one of every M samples.
+    """
+    return np.convolve(signal, decimator.coefficients)[: signal.size][
+        :: decimator.factor
+    ]
+
+
+class TestDecimator:
+    """
+    Tests for the Decimator class.
+    """
+
+    @pytest.fixture
+    def signal(self) -> np.ndarray:
+        """
+        Returns a random test signal.
+        """
+        return np.random.default_rng(0).standard_normal(1001)
+
+    @pytest.mark.parametrize("factor", [1, 2, 3, 4, 5])
+    def test_decimate_matches_filtering_and_downsampling(self, factor, signal):
+        """
+        Test that the one-shot output equals filtering then keeping every M-th sample.
+        """
+        decimator = Decimator(factor, decimator_conf, round_to=7)
+
+        np.testing.assert_allclose(
+            decimator.decimate(signal), _reference(decimator, signal), atol=1e-12
+        )
+
+    @pytest.mark.parametrize("factor", [2, 3, 4])
+    def test_process_matches_decimate(self, factor, signal):
+        """
+        Test that chunks of any size, shorter and longer than the factor, give the
+        one-shot output.
+        """
+        decimator = Decimator(factor, decimator_conf, round_to=7)
+        bounds = [0, 1, 2, 5, 5, 17, 300, 301, 1001]
+
+        outputs = [decimator.process(signal[a:b]) for a, b in zip(bounds, bounds[1:])]
+
+        np.testing.assert_allclose(
+            np.concatenate(outputs), _reference(decimator, signal), atol=1e-12
+        )
+
+    def test_stopband_is_derived_from_the_factor(self):
+        """
+        Test that the stopband edge is the output Nyquist frequency, unless overridden.
+        """
+        assert Decimator(4, decimator_conf).filter_conf["stopband_freq_hz"] == 6000
+        assert (
+            Decimator(4, decimator_conf, stopband_freq_hz=5000).filter_conf[
+                "stopband_freq_hz"
+            ]
+            == 5000
+        )
+
+    def test_branches(self):
+        """
+        Test that the branch matrix holds the zero padded coefficients, E(k, j) = h(j * M + k).
+        """
+        branches = polyphase_branches(np.arange(1.0, 8.0), 3)
+
+        assert branches.tolist() == [[1, 4, 7], [2, 5, 0], [3, 6, 0]]
+
+    def test_output_length(self):
+        """
+        Test the number of outputs of the next chunk, which depends on the phase.
+        """
+        decimator = Decimator(4, decimator_conf)
+
+        assert decimator.output_length(5) == 2
+        decimator.process(np.ones(5))
+        assert decimator.output_length(4) == 1
+        assert decimator.output_length(3) == 0
+
+    def test_snapshot_and_restore(self, signal):
+        """
+        Test that restoring a snapshot resumes the stream from that point.
+        """
+        decimator = Decimator(3, decimator_conf)
+        decimator.process(signal[:100])
+        state = decimator.snapshot()
+        expected = decimator.process(signal[100:200]).copy()
+        decimator.process(signal[200:])
+        decimator.restore(state)
+
+        np.testing.assert_array_equal(decimator.process(signal[100:200]), expected)
+
+    def test_reset_clears_the_state(self, signal):
+        """
+        Test that after a reset, the stream restarts from the beginning.
+        """
+        decimator = Decimator(3, decimator_conf)
+        decimator.process(signal[:101])
+        decimator.reset()
+
+        np.testing.assert_array_equal(
+            decimator.process(signal), decimator.decimate(signal)
+        )
+
+    @pytest.mark.parametrize("factor", [0, 2.5])
+    def test_rejects_invalid_factor(self, factor):
+        """
+        Test that a factor that is not a positive integer raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            Decimator(factor, decimator_conf)  # type: ignore
+
+    def test_rejects_passband_above_the_derived_stopband(self):
+        """
+        Test that a passband edge above F / (2 * M) raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            Decimator(8, decimator_conf)
+
+    def test_restore_rejects_invalid_phase(self):
+        """
+        Test that a phase outside 0 to M - 1 raises a ValueError.
+        """
+        decimator = Decimator(3, decimator_conf)
+        state = decimator.snapshot()
+
+        with pytest.raises(ValueError):
+            decimator.restore({**state, "phase": 3})
+
+    def test_half_band_decimator_matches_filtering_and_downsampling(self, signal):
+        """
+        Test that a half-band decimator by 2, whose zero taps are skipped, gives the
+        same output, with the stopband edge at F / 2 - fp.
+        """
+        decimator = Decimator(2, {**decimator_conf, "half_band": True}, round_to=7)
+        bounds = [0, 1, 2, 5, 17, 300, 1001]
+
+        outputs = [decimator.process(signal[a:b]) for a, b in zip(bounds, bounds[1:])]
+
+        assert decimator.filter_conf["stopband_freq_hz"] == 20000
+        center = decimator.coefficients.size // 2
+        assert np.count_nonzero(decimator.coefficients[center % 2 :: 2]) == 1
+        np.testing.assert_allclose(
+            decimator.decimate(signal), _reference(decimator, signal), atol=1e-12
+        )
+        np.testing.assert_allclose(
+            np.concatenate(outputs), _reference(decimator, signal), atol=1e-12
+        )
+
+    def test_rejects_half_band_for_other_factors(self):
+        """
+        Test that a half-band filter for a factor other than 2 raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            Decimator(4, {**decimator_conf, "half_band": True})
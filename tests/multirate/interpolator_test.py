@@ -0,0 +1,123 @@
+"""
+This file contains the tests for the Interpolator class.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import FilterConf, Interpolator
+
+interpolator_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "kaiser",
+    "sampling_freq_hz": 8000,
+    "passband_freq_hz": 3000,
+    "stopband_freq_hz": 4000,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 60,
+}
+
+
+def _reference(interpolator: Interpolator, signal: np.ndarray) -> np.ndarray:
+    """
+    Inserts L - 1 zeros after every sample and filters with the gain L.
+    """
+    upsampled = np.zeros(signal.size * interpolator.factor)
+    upsampled[:: interpolator.factor] = signal
+
+    return np.convolve(upsampled, interpolator.coefficients * interpolator.factor)[
+        : upsampled.size
+    ]
+
+
+class TestInterpolator:
+    """
+    Tests for the Interpolator class.
+    """
+
+    @pytest.fixture
+    def signal(self) -> np.ndarray:
+        """
+        Returns a random test signal.
+        """
+        return np.random.default_rng(0).standard_normal(1001)
+
+    @pytest.mark.parametrize("factor", [1, 2, 3, 4, 5])
+    def test_interpolate_matches_upsampling_and_filtering(self, factor, signal):
+        """
+        Test that the one-shot output equals zero insertion then filtering.
+        """
+        interpolator = Interpolator(factor, interpolator_conf, round_to=7)
+
+        np.testing.assert_allclose(
+            interpolator.interpolate(signal),
+            _reference(interpolator, signal),
+            atol=1e-12,
+        )
+
+    @pytest.mark.parametrize("factor", [2, 3])
+    def test_process_matches_interpolate(self, factor, signal):
+        """
+        Test that chunks of any size give the one-shot output.
+        """
+        interpolator = Interpolator(factor, interpolator_conf, round_to=7)
+        bounds = [0, 1, 2, 5, 5, 17, 300, 301, 1001]
+
+        outputs = [
+            interpolator.process(signal[a:b]) for a, b in zip(bounds, bounds[1:])
+        ]
+
+        np.testing.assert_allclose(
+            np.concatenate(outputs), _reference(interpolator, signal), atol=1e-12
+        )
+
+    def test_filter_runs_at_the_output_rate(self):
+        """
+        Test that the filter is designed at L * F with its stopband edge at F / 2.
+        """
+        filter_conf = Interpolator(4, interpolator_conf).filter_conf
+
+        assert filter_conf["sampling_freq_hz"] == 32000
+        assert filter_conf["stopband_freq_hz"] == 4000
+
+    def test_dc_gain_is_preserved(self):
+        """
+        Test that a constant signal keeps its level once the filter has settled.
+        """
+        interpolator = Interpolator(4, interpolator_conf, round_to=7)
+
+        output = interpolator.interpolate(np.ones(200))
+
+        np.testing.assert_allclose(
+            output[interpolator.coefficients.size :], 1.0, atol=1e-3
+        )
+
+    def test_process_writes_into_out(self, signal):
+        """
+        Test that the output is written into the given buffer.
+        """
+        interpolator = Interpolator(3, interpolator_conf)
+        out = np.empty(interpolator.output_length(100))
+
+        assert interpolator.process(signal[:100], out=out) is out
+
+    def test_snapshot_and_restore(self, signal):
+        """
+        Test that restoring a snapshot resumes the stream from that point.
+        """
+        interpolator = Interpolator(3, interpolator_conf)
+        interpolator.process(signal[:100])
+        state = interpolator.snapshot()
+        expected = interpolator.process(signal[100:200]).copy()
+        interpolator.reset()
+        interpolator.restore(state)
+
+        np.testing.assert_array_equal(interpolator.process(signal[100:200]), expected)
+
+    @pytest.mark.parametrize("factor", [0, 1.5])
+    def test_rejects_invalid_factor(self, factor):
+        """
+        Test that a factor that is not a positive integer raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            Interpolator(factor, interpolator_conf)  # type: ignore
@@ -0,0 +1,164 @@
+"""
+This file contains the tests for the multistage decimation planner.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import Decimator, FilterConf, plan_decimation
+from easy_fir_filter.multirate import MultistageDecimator, decimation_cost
+
+multistage_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "kaiser",
+    "sampling_freq_hz": 64000,
+    "passband_freq_hz": 400,
+    "stopband_freq_hz": 500,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 60,
+}
+
+
+class TestPlanDecimation:
+    """
+    Tests for the plan_decimation function and the MultistageDecimator class.
+    """
+
+    @pytest.fixture(scope="class")
+    def decimator(self) -> MultistageDecimator:
+        """
+        Returns the planned cascade decimating by 64.
+        """
+        return plan_decimation(64, multistage_conf, round_to=7)
+
+    @pytest.fixture
+    def signal(self) -> np.ndarray:
+        """
+        Returns a random test signal.
+        """
+        return np.random.default_rng(0).standard_normal(20000)
+
+    def test_cascade_is_cheaper_than_a_single_stage(self, decimator):
+        """
+        Test that the planned cascade needs fewer multiply-accumulates per output
+        than the single stage, which is also a candidate.
+        """
+        single = plan_decimation(64, multistage_conf, round_to=7, max_stages=1)
+
+        assert len(single.stages) == 1
+        assert len(decimator.stages) > 1
+        assert decimator.factor == 64
+        assert decimator.cost < single.cost / 4
+
+    def test_stage_bands_are_relaxed(self, decimator):
+        """
+        Test that stage i stops at F_(i + 1) - F_out / 2 and gets Ap / K.
+        """
+        rate = 64000
+        for stage in decimator.stages:
+            rate /= stage.factor
+            assert stage.filter_conf["stopband_freq_hz"] == rate - 500
+            assert stage.filter_conf["passband_ripple_db"] == pytest.approx(
+                0.1 / len(decimator.stages)
+            )
+
+    def test_cost(self):
+        """
+        Test the cost of a cascade, with each stage weighted by its output rate.
+        """
+        conf: FilterConf = {**multistage_conf, "sampling_freq_hz": 4000}
+        first = Decimator(2, conf, stopband_freq_hz=1500)
+        second = Decimator(2, {**conf, "sampling_freq_hz": 2000})
+
+        assert decimation_cost([first, second]) == (
+            np.count_nonzero(first.branches) * 2 + np.count_nonzero(second.branches)
+        )
+
+    def test_cost_skips_zero_taps(self):
+        """
+        Test that the cost of a half-band stage only counts the taps its kernel
+        multiplies, about half of its branch matrix.
+        """
+        conf: FilterConf = {
+            **multistage_conf,
+            "sampling_freq_hz": 4000,
+            "half_band": True,
+        }
+        stage = Decimator(2, conf)
+        taps = stage.coefficients.size
+
+        assert decimation_cost([stage]) == taps // 2 + 2
+        assert decimation_cost([stage]) < stage.branches.size / 1.5
+
+    def test_aliases_are_attenuated(self, decimator):
+        """
+        Test that a passband tone is kept and a tone aliasing into the passband is
+        removed.
+        """
+        t = np.arange(64000) / 64000
+
+        passband = decimator.decimate(np.sin(2 * np.pi * 200 * t))[100:]
+        alias = decimator.decimate(np.sin(2 * np.pi * 1600 * t))[100:]
+
+        # 900 outputs are whole periods of the tone, whatever the delay of the cascade
+        assert np.sqrt(2 * np.mean(passband**2)) == pytest.approx(1.0, abs=0.02)
+        assert np.max(np.abs(alias)) < 10 ** (-55 / 20)
+
+    def test_process_matches_decimate(self, decimator, signal):
+        """
+        Test that chunks of any size give the one-shot output.
+        """
+        decimator.reset()
+        bounds = [0, 1, 63, 64, 1000, 1001, 7777, 20000]
+
+        outputs = [decimator.process(signal[a:b]) for a, b in zip(bounds, bounds[1:])]
+
+        np.testing.assert_allclose(
+            np.concatenate(outputs), decimator.decimate(signal), atol=1e-12
+        )
+        assert decimator.decimate(signal).size == -(-signal.size // 64)
+
+    def test_snapshot_and_restore(self, decimator, signal):
+        """
+        Test that restoring a snapshot resumes the stream from that point.
+        """
+        decimator.reset()
+        decimator.process(signal[:1001])
+        state = decimator.snapshot()
+        expected = decimator.process(signal[1001:5000]).copy()
+        decimator.restore(state)
+
+        np.testing.assert_array_equal(decimator.process(signal[1001:5000]), expected)
+
+        with pytest.raises(ValueError):
+            decimator.restore(state[:1])
+
+    @pytest.mark.parametrize("factor", [8, 64])
+    def test_half_band_only_on_quarter_rate_stages(self, factor):
+        """
+        Test that the half_band option keeps the relaxed factor-2 stages and only
+        applies to the stages stopping at a quarter of their rate.
+        """
+        decimator = plan_decimation(
+            factor, {**multistage_conf, "half_band": True}, round_to=7
+        )
+
+        assert 2 in [stage.factor for stage in decimator.stages]
+        assert decimator.stages[-1].filter_conf.get("half_band", False)
+        for stage in decimator.stages[:-1]:
+            assert "half_band" not in stage.filter_conf
+
+    @pytest.mark.parametrize("factor", [0, 2.5])
+    def test_rejects_invalid_factor(self, factor):
+        """
+        Test that a factor that is not a positive integer raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            plan_decimation(factor, multistage_conf)  # type: ignore
+
+    def test_rejects_passband_above_the_output_nyquist_frequency(self):
+        """
+        Test that no cascade can be planned when the passband edge is above F / (2 * M).
+        """
+        with pytest.raises(ValueError):
+            plan_decimation(128, multistage_conf)
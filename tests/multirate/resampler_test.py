@@ -0,0 +1,134 @@
+"""
+This file contains the tests for the Resampler class.
+"""
+
+import numpy as np
+import pytest
+
+from easy_fir_filter import FilterConf, Resampler
+
+resampler_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "kaiser",
+    "sampling_freq_hz": 48000,
+    "passband_freq_hz": 4000,
+    "stopband_freq_hz": 6000,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 60,
+}
+
+
+def _reference(resampler: Resampler, signal: np.ndarray) -> np.ndarray:
+    """
+    Inserts L - 1 zeros after every sample, filters with the gain L and keeps one of
+    every M samples.
+    """
+    upsampled = np.zeros(signal.size * resampler.up)
+    upsampled[:: resampler.up] = signal
+
+    return np.convolve(upsampled, resampler.coefficients * resampler.up)[
+        : upsampled.size
+    ][:: resampler.down]
+
+
+class TestResampler:
+    """
+    Tests for the Resampler class.
+    """
+
+    @pytest.fixture
+    def signal(self) -> np.ndarray:
+        """
+        Returns a random test signal.
+        """
+        return np.random.default_rng(0).standard_normal(1001)
+
+    @pytest.mark.parametrize("up, down", [(1, 1), (1, 3), (2, 3), (3, 2), (5, 3)])
+    def test_resample_matches_the_reference(self, up, down, signal):
+        """
+        Test that the one-shot output equals upsampling, filtering and downsampling.
+        """
+        resampler = Resampler(up, down, resampler_conf, round_to=7)
+
+        np.testing.assert_allclose(
+            resampler.resample(signal), _reference(resampler, signal), atol=1e-12
+        )
+
+    @pytest.mark.parametrize("up, down", [(2, 3), (3, 2), (3, 7)])
+    def test_process_matches_resample(self, up, down, signal):
+        """
+        Test that chunks of any size, shorter and longer than the factors, give the
+        one-shot output.
+        """
+        resampler = Resampler(up, down, resampler_conf, round_to=7)
+        bounds = [0, 1, 2, 5, 5, 17, 300, 301, 1001]
+
+        outputs = [resampler.process(signal[a:b]) for a, b in zip(bounds, bounds[1:])]
+
+        np.testing.assert_allclose(
+            np.concatenate(outputs), _reference(resampler, signal), atol=1e-12
+        )
+
+    def test_factors_are_reduced(self):
+        """
+        Test that the factors are divided by their greatest common divisor.
+        """
+        resampler = Resampler(4, 6, resampler_conf)
+
+        assert (resampler.up, resampler.down) == (2, 3)
+
+    @pytest.mark.parametrize("up, down, stopband", [(2, 3, 16000), (3, 2, 24000)])
+    def test_stopband_is_the_lowest_nyquist_frequency(self, up, down, stopband):
+        """
+        Test that the stopband edge is the lowest of the input and output Nyquist
+        frequencies, with the filter running at L * F.
+        """
+        filter_conf = Resampler(up, down, resampler_conf).filter_conf
+
+        assert filter_conf["stopband_freq_hz"] == stopband
+        assert filter_conf["sampling_freq_hz"] == 48000 * up
+
+    def test_output_length(self):
+        """
+        Test the number of outputs of the next chunk, which depends on the phase.
+        """
+        resampler = Resampler(2, 3, resampler_conf)
+
+        assert resampler.output_length(4) == 3
+        resampler.process(np.ones(4))
+        assert resampler.output_length(4) == 3
+        resampler.process(np.ones(4))
+        assert resampler.output_length(4) == 2
+
+    def test_snapshot_and_restore(self, signal):
+        """
+        Test that restoring a snapshot resumes the stream from that point.
+        """
+        resampler = Resampler(3, 2, resampler_conf)
+        resampler.process(signal[:101])
+        state = resampler.snapshot()
+        expected = resampler.process(signal[101:200]).copy()
+        resampler.process(signal[200:])
+        resampler.restore(state)
+
+        np.testing.assert_array_equal(resampler.process(signal[101:200]), expected)
+
+    def test_reset_clears_the_state(self, signal):
+        """
+        Test that after a reset, the stream restarts from the beginning.
+        """
+        resampler = Resampler(2, 3, resampler_conf)
+        resampler.process(signal[:101])
+        resampler.reset()
+
+        np.testing.assert_array_equal(
+            resampler.process(signal), resampler.resample(signal)
+        )
+
+    @pytest.mark.parametrize("up, down", [(0, 1), (2, 1.5)])
+    def test_rejects_invalid_factors(self, up, down):
+        """
+        Test that factors that are not positive integers raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            Resampler(up, down, resampler_conf)  # type: ignore
@@ -0,0 +1,74 @@
+"""
+This file contains the tests for the minimum-phase conversion and the latency measurement.
+"""
+
+import numpy as np
+import pytest
+from scipy.signal import firwin
+
+from easy_fir_filter import FilterConf
+from easy_fir_filter.phase import minimum_phase, passband_latency
+
+lowpass_conf: FilterConf = {
+    "filter_type": "lowpass",
+    "window_type": "hamming",
+    "sampling_freq_hz": 8000,
+    "passband_freq_hz": 1000,
+    "stopband_freq_hz": 1500,
+    "passband_ripple_db": 0.1,
+    "stopband_attenuation_db": 50,
+}
+
+
+class TestMinimumPhase:
+    """
+    Tests for the minimum_phase and passband_latency functions.
+    """
+
+    @pytest.fixture
+    def linear_phase(self) -> np.ndarray:
+        """
+        Returns a linear-phase lowpass filter.
+        """
+        return firwin(61, 1250, fs=8000)
+
+    def test_keeps_the_magnitude_response(self, linear_phase):
+        """
+        Test that the magnitude response is kept, up to the truncation.
+        """
+        h_min = minimum_phase(linear_phase, round_to=10)
+
+        assert h_min.size == linear_phase.size
+        np.testing.assert_allclose(
+            np.abs(np.fft.rfft(h_min, 1024)),
+            np.abs(np.fft.rfft(linear_phase, 1024)),
+            atol=1e-6,
+        )
+
+    def test_zeros_are_inside_the_unit_circle(self, linear_phase):
+        """
+        Test that every zero of the minimum-phase filter lies on or inside the unit circle.
+        """
+        zeros = np.roots(minimum_phase(linear_phase, round_to=10))
+
+        assert np.all(np.abs(zeros) <= 1 + 1e-3)
+
+    def test_latency(self, linear_phase):
+        """
+        Test that a linear-phase filter is delayed by (N - 1) / 2 samples, and its
+        minimum-phase version by much less.
+        """
+        h_min = minimum_phase(linear_phase, round_to=10)
+
+        assert passband_latency(linear_phase, lowpass_conf) == pytest.approx(30)
+        assert 0 < passband_latency(h_min, lowpass_conf) < 10
+
+    @pytest.mark.parametrize(
+        "coefficients, n_fft", [([], None), ([0.0, 0.0], None), ([1.0, 1.0], 2)]
+    )
+    def test_invalid_arguments(self, coefficients, n_fft):
+        """
+        Test that empty or zero coefficients, or a too small FFT, raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            minimum_phase(coefficients, n_fft=n_fft)
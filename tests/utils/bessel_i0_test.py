@@ -0,0 +1,52 @@
+"""
+This file contains tests for the bessel_i0 function in the utils module.
+"""
+
+import numpy as np
+import pytest
+from scipy.special import i0
+
+from easy_fir_filter.utils import bessel_i0
+
+
+class TestBesselI0UtilFunction:
+    """
+    Tests for the bessel_i0 function.
+    """
+
+    def test_bessel_i0_at_zero(self):
+        """
+        Test bessel_i0 function at zero.
+        """
+        assert bessel_i0(0.0) == 1.0
+
+    def test_bessel_i0_returns_same_shape(self):
+        """
+        Test bessel_i0 function keeps the shape of its input.
+        """
+        x = np.linspace(0, 50, 12).reshape(3, 4)
+        assert bessel_i0(x).shape == (3, 4)
+
+    def test_bessel_i0_is_even(self):
+        """
+        Test bessel_i0 function is symmetric around zero.
+        """
+        x = np.linspace(0, 50, 101)
+        assert bessel_i0(-x).tolist() == bessel_i0(x).tolist()
+
+    @pytest.mark.parametrize(
+        "low, high",
+        [(0, 5), (5, 30), (30, 35), (35, 700)],
+    )
+    def test_bessel_i0_matches_reference(self, low: float, high: float):
+        """
+        Test bessel_i0 function against scipy in each argument range.
+        """
+        x = np.linspace(low, high, 10001)
+        np.testing.assert_allclose(bessel_i0(x), i0(x), rtol=3e-15)
+
+    def test_bessel_i0_overflows_to_inf(self):
+        """
+        Test bessel_i0 function returns inf when I0 exceeds the float64 range.
+        """
+        assert np.isinf(bessel_i0(800.0))
@@ -2,7 +2,14 @@
 This file contains tests for the truncate function in the utils module.
 """
 
-from easy_fir_filter.utils import build_filter_coefficients
+import numpy as np
+import pytest
+
+from easy_fir_filter.utils import (
+    build_filter_coefficients,
+    build_symmetric_coefficients,
+    truncate,
+)
 
 
 class TestBuildFilterCoefficientsUtilFunction:
@@ -45,3 +52,47 @@ class TestBuildFilterCoefficientsUtilFunction:
             1e-10,
             1e10,
         ]
+
+
+class TestBuildSymmetricCoefficients:
+    """
+    Tests for the build_symmetric_coefficients function.
+    """
+
+    def test_matches_truncated_products(self):
+        """
+        Test that the result is bit-identical to truncating every product and mirroring.
+        """
+        rng = np.random.default_rng(0)
+        window, impulse_response = rng.standard_normal((2, 50))
+
+        half = [truncate(w * h, 4) for w, h in zip(window, impulse_response)]
+        expected = build_filter_coefficients(half)
+
+        result = build_symmetric_coefficients(window, impulse_response, 4)
+        assert result.tolist() == expected
+
+    def test_negative_zero(self):
+        """
+        Test that products truncating to -0.0 become 0.0.
+        """
+        result = build_symmetric_coefficients(
+            np.array([1.0, 1.0]), np.array([0.5, -0.00001]), 4
+        )
+
+        assert not np.signbit(result).any()
+
+    def test_single_coefficient(self):
+        """
+        Test that a zero-order filter has a single coefficient.
+        """
+        assert build_symmetric_coefficients([0.5], [0.5], 4).tolist() == [0.25]
+
+    def test_invalid_arguments(self):
+        """
+        Test that negative decimals and mismatched halves raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            build_symmetric_coefficients([1.0], [1.0], -1)
+        with pytest.raises(ValueError):
+            build_symmetric_coefficients([1.0, 0.5], [1.0], 4)
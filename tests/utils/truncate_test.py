@@ -2,9 +2,10 @@
 This file  contains tests for the truncate function in the utils module.
 """
 
+import numpy as np
 import pytest
 
-from easy_fir_filter.utils import truncate
+from easy_fir_filter.utils import truncate, truncate_array
 
 
 class TestTruncateUtilFunction:
@@ -53,3 +54,37 @@ class TestTruncateUtilFunction:
         """
         with pytest.raises(ValueError):
             truncate(123.456789, -1)
+
+
+class TestTruncateArrayUtilFunction:
+    """
+    Tests for the truncate_array function.
+    """
+
+    def test_truncate_array_returns_ndarray(self):
+        """
+        Test truncate_array function returns an ndarray.
+        """
+        assert isinstance(truncate_array(np.array([1.2345]), 2), np.ndarray)
+
+    def test_truncate_array_matches_truncate(self):
+        """
+        Test truncate_array function gives the same values as truncate.
+        """
+        values = np.random.default_rng(0).uniform(-10, 10, 1000)
+        expected = [truncate(value, 7) for value in values]
+        assert truncate_array(values, 7).tolist() == expected
+
+    def test_truncate_array_has_no_negative_zero(self):
+        """
+        Test truncate_array function turns negative zero into zero.
+        """
+        result = truncate_array(np.array([-0.00001, -0.0]), 2)
+        assert not np.signbit(result).any()
+
+    def test_truncate_array_invalid_decimals(self):
+        """
+        Test truncate_array function with invalid number of decimals.
+        """
+        with pytest.raises(ValueError):
+            truncate_array(np.array([123.456789]), -1)
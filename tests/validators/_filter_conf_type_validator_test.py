@@ -5,11 +5,11 @@ This file contains the tests for the FilterConfTypeValidator class.
 import pytest
 
 from easy_fir_filter import FilterConf
-from easy_fir_filter.exceptions import MissingKeysError, InvalidTypeError
+from easy_fir_filter.exceptions import InvalidTypeError, MissingKeysError
 from easy_fir_filter.validators._filter_conf_type_validator import (  # type: ignore
-    _FilterConfTypeValidator,
-    _REQUIRED_KEYS,
     _OPTIONAL_KEYS,
+    _REQUIRED_KEYS,
+    _FilterConfTypeValidator,
 )
 
 INVALID_KEYS_TYPES = [
@@ -193,3 +193,23 @@ class TestFilterConfTypeValidator:
         Tests that the _validate_window_type method does not raise a ValueError when the window type is valid.
         """
         _FilterConfTypeValidator(valid_filter_conf)
+
+    @pytest.mark.parametrize("option", ["half_band", "minimum_phase"])
+    def test_validate_option_keys_raises_invalid_type_error(
+        self, valid_filter_conf: FilterConf, option: str
+    ):
+        """
+        Tests that the _validate_option_keys method raises an InvalidTypeError when an option is not a bool.
+        """
+        valid_filter_conf[option] = 1  # type: ignore
+        with pytest.raises(InvalidTypeError):
+            _FilterConfTypeValidator(valid_filter_conf)
+
+    def test_validate_option_keys_does_not_raise_invalid_type_error(
+        self, valid_filter_conf: FilterConf
+    ):
+        """
+        Tests that the _validate_option_keys method does not raise an InvalidTypeError when half_band is a bool.
+        """
+        valid_filter_conf["half_band"] = True
+        _FilterConfTypeValidator(valid_filter_conf)
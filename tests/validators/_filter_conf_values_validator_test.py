@@ -188,3 +188,60 @@ class TestFilterConfValuesValidator:
         """
         _FilterConfValuesValidator(valid_filter_conf)
         _FilterConfValuesValidator(valid_filter_conf_2)
+
+    def test_validate_half_band_raises_value_error_for_asymmetric_transition(
+        self, valid_filter_conf
+    ):
+        """
+        Tests that the _validate_half_band method raises a ValueError when fp + fs is not F / 2.
+        """
+        valid_filter_conf["half_band"] = True  # type: ignore
+        with pytest.raises(ValueError, match="half-band"):
+            _FilterConfValuesValidator(valid_filter_conf)
+
+    def test_validate_half_band_raises_value_error_for_other_filter_types(
+        self, valid_filter_conf_2
+    ):
+        """
+        Tests that the _validate_half_band method raises a ValueError for filters other than lowpass.
+        """
+        valid_filter_conf_2["half_band"] = True  # type: ignore
+        with pytest.raises(ValueError, match="Only lowpass"):
+            _FilterConfValuesValidator(valid_filter_conf_2)
+
+    def test_validate_half_band_raises_value_error_for_equiripple(
+        self, valid_filter_conf
+    ):
+        """
+        Tests that the _validate_half_band method raises a ValueError for the equiripple design.
+        """
+        valid_filter_conf["passband_freq_hz"] = 30000  # type: ignore
+        valid_filter_conf["stopband_freq_hz"] = 40000  # type: ignore
+        valid_filter_conf["window_type"] = "equiripple"  # type: ignore
+        valid_filter_conf["half_band"] = True  # type: ignore
+        with pytest.raises(ValueError, match="equiripple"):
+            _FilterConfValuesValidator(valid_filter_conf)
+
+    def test_validate_half_band_raises_value_error_for_minimum_phase(
+        self, valid_filter_conf
+    ):
+        """
+        Tests that the _validate_half_band method raises a ValueError for minimum-phase filters.
+        """
+        valid_filter_conf["passband_freq_hz"] = 30000  # type: ignore
+        valid_filter_conf["stopband_freq_hz"] = 40000  # type: ignore
+        valid_filter_conf["minimum_phase"] = True  # type: ignore
+        valid_filter_conf["half_band"] = True  # type: ignore
+        with pytest.raises(ValueError, match="minimum phase"):
+            _FilterConfValuesValidator(valid_filter_conf)
+
+    def test_validate_half_band_does_not_raise_error_for_symmetric_transition(
+        self, valid_filter_conf
+    ):
+        """
+        Tests that the _validate_half_band method does not raise an error when fp + fs is F / 2.
+        """
+        valid_filter_conf["passband_freq_hz"] = 30000  # type: ignore
+        valid_filter_conf["stopband_freq_hz"] = 40000  # type: ignore
+        valid_filter_conf["half_band"] = True  # type: ignore
+        _FilterConfValuesValidator(valid_filter_conf)
@@ -2,6 +2,7 @@
 This file contains the tests for the Hamming window implementation.
 """
 
+import numpy as np
 import pytest
 
 from easy_fir_filter import FilterConf
@@ -151,15 +152,17 @@ class TestHammingWindow:
         return HammingWindow(round_to=7)
 
     @pytest.mark.parametrize("order", filter_order_results)
-    def test_calculate_window_coefficients_returns_list(
+    def test_calculate_window_coefficients_returns_ndarray(
         self, window_builder: HammingWindow, order: tuple[int, int]
     ):
         """
-        Test that the calculate_window_coefficients method returns a list.
+        Test that the calculate_window_coefficients method returns a contiguous float64 ndarray.
         """
         n, N = order
         result = window_builder.calculate_window_coefficients(n, N, AS=None)
-        assert isinstance(result, list)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float64
+        assert result.flags.c_contiguous
 
     @pytest.mark.parametrize("order", filter_order_results)
     def test_calculate_window_coefficients_returns_list_of_floats(
@@ -212,4 +215,4 @@ class TestHammingWindow:
         """
         n, N = order
         result = window_builder.calculate_window_coefficients(n, N, AS=None)
-        assert result == expected_result
+        assert result.tolist() == expected_result
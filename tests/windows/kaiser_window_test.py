@@ -4,6 +4,7 @@ This file contains the tests for the Kaiser window implementation.
 
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from easy_fir_filter import FilterConf
@@ -75,8 +76,8 @@ correct_window_coefficients = [
         0.7625777,
         0.671038,
         0.5721842,
-        0.4698245,
-        0.3677679,
+        0.4698246,
+        0.367768,
         0.2696403,
     ],
     [
@@ -85,36 +86,36 @@ correct_window_coefficients = [
         0.9603086,
         0.9123848,
         0.8483462,
-        0.7710283,
+        0.7710284,
         0.6837801,
         0.5902701,
         0.4942773,
         0.3994818,
         0.3092683,
-        0.2265542,
+        0.2265543,
         0.153655,
         0.0921911,
     ],
     [
         1.0,
-        0.9888476,
+        0.9888477,
         0.9559032,
-        0.9026737,
+        0.9026738,
         0.831576,
         0.7457993,
-        0.6491255,
+        0.6491256,
         0.545719,
-        0.4398968,
+        0.4398969,
         0.335896,
         0.2376502,
     ],
     [
         1.0,
         0.9937727,
-        0.9752649,
-        0.9449921,
+        0.975265,
+        0.944992,
         0.9037922,
-        0.8527962,
+        0.8527963,
         0.7933867,
         0.7271485,
         0.6558136,
@@ -123,7 +124,7 @@ correct_window_coefficients = [
         0.4294595,
         0.3558426,
         0.2858509,
-        0.2208412,
+        0.2208413,
         0.1619353,
         0.1099918,
     ],
@@ -136,8 +137,8 @@ correct_window_coefficients = [
         0.7625777,
         0.671038,
         0.5721842,
-        0.4698245,
-        0.3677679,
+        0.4698246,
+        0.367768,
         0.2696403,
     ],
 ]
@@ -221,78 +222,78 @@ correct_betas = [
 
 i_alpha_results = [
     [
-        3.7086433999999997,
-        3.7086433999999997,
-        3.6703342999999995,
-        3.5570085000000002,
-        3.3733859,
-        3.1270643999999996,
-        2.8281288,
-        2.4886407999999998,
-        2.1220273,
-        1.7424118,
-        1.3639203,
+        3.708643747699045,
+        3.6703346824916956,
+        3.557008878158985,
+        3.3733863702125655,
+        3.127064681268927,
+        2.8281292244881158,
+        2.488641131366838,
+        2.1220275284026964,
+        1.7424121034756608,
+        1.3639205562190468,
+        1.0,
     ],
     [
-        10.847025299999999,
-        10.847025299999999,
-        10.738149899999998,
-        10.416492400000001,
-        9.896662,
-        9.2020337,
-        8.3633645,
-        7.4169804,
-        6.4026752,
-        5.3614388,
-        4.3331900999999995,
-        3.3546413,
-        2.4574399,
-        1.6666998,
+        10.847025898086036,
+        10.738150285875882,
+        10.416493003544742,
+        9.896662535363221,
+        9.202034140370813,
+        8.36336503639611,
+        7.416981006166962,
+        6.402675520616555,
+        5.361439177122489,
+        4.333190471710659,
+        3.3546417303702114,
+        2.457440408770102,
+        1.6667001379210806,
+        1.0,
     ],
     [
-        4.2078646,
-        4.2078646,
-        4.160937200000001,
-        4.0223113,
-        3.7983289,
-        3.4991594,
-        3.1382225,
-        2.7314324999999995,
-        2.2963119,
-        1.8510265000000001,
-        1.413405,
+        4.207864886944716,
+        4.160937606504025,
+        4.0223116877881875,
+        3.7983294265241696,
+        3.4991598019492827,
+        3.1382228054394936,
+        2.7314328494097335,
+        2.2963121888160423,
+        1.8510267723278928,
+        1.4134052832570616,
+        1.0,
     ],
     [
-        9.091581600000001,
-        9.091581600000001,
-        9.0349664,
-        8.8667013,
-        8.591472800000002,
-        8.2169013,
-        7.753267099999998,
-        7.213140100000001,
-        6.6109306,
-        5.9623829,
-        5.284020399999999,
-        4.592584499999999,
-        3.9044661,
-        3.2351721,
-        2.5988369000000002,
-        2.0077966,
-        1.4722484,
+        9.091582086348774,
+        9.034966760537326,
+        8.86670185619115,
+        8.591473173707842,
+        8.216901675155535,
+        7.753267578237195,
+        7.213140461409601,
+        6.610931098988078,
+        5.9623832319316925,
+        5.2840209610141295,
+        4.5925849989669025,
+        3.90446645608761,
+        3.2351725840004595,
+        2.5988373052667044,
+        2.0077969596394722,
+        1.4722488300927825,
+        1.0,
     ],
     [
-        3.7086433999999997,
-        3.7086433999999997,
-        3.6703342999999995,
-        3.5570085000000002,
-        3.3733859,
-        3.1270643999999996,
-        2.8281288,
-        2.4886407999999998,
-        2.1220273,
-        1.7424118,
-        1.3639203,
+        3.708643747699045,
+        3.6703346824916956,
+        3.557008878158985,
+        3.3733863702125655,
+        3.127064681268927,
+        2.8281292244881158,
+        2.488641131366838,
+        2.1220275284026964,
+        1.7424121034756608,
+        1.3639205562190468,
+        1.0,
     ],
 ]
 
@@ -357,12 +358,12 @@ class TestKaiserWindow:
         with pytest.raises(ValueError):
             window_builder._calculate_betas(7, 8)
 
-    def test_calculate_betas_must_return_list(self, window_builder: KaiserWindow):
+    def test_calculate_betas_must_return_ndarray(self, window_builder: KaiserWindow):
         """
-        Test the calculation of the betas. It must return a list of floats.
+        Test the calculation of the betas. It must return an ndarray.
         """
         window_builder.alpha = 3.8614156
-        assert isinstance(window_builder._calculate_betas(10, 21), list)
+        assert isinstance(window_builder._calculate_betas(10, 21), np.ndarray)
 
     @pytest.mark.parametrize(
         "ripples, filter_order",
@@ -397,7 +398,7 @@ class TestKaiserWindow:
         """
         n, N = filter_order
         window_builder._calculate_alpha_parameter(ripples[0])
-        assert window_builder._calculate_betas(n, N) == betas
+        assert window_builder._calculate_betas(n, N).tolist() == betas
 
     def test_calculate_i_alpha_must_raise_exception(self, window_builder: KaiserWindow):
         """
@@ -481,17 +482,16 @@ class TestKaiserWindow:
                 window_builder.calculate_window_coefficients(10, 21, 34)
                 mock_betas.assert_called_once_with(n=10, filter_length=21)
 
-    def test_calculate_window_coefficients_must_return_list(
+    def test_calculate_window_coefficients_must_return_ndarray(
         self, window_builder: KaiserWindow
     ):
         """
-        Test the calculation of the window coefficients. It must return a list of floats.
+        Test the calculation of the window coefficients. It must return a contiguous float64 ndarray.
         """
-        window_builder.alpha = 1.0
-        window_builder.betas = [1.0, 2.0, 3.0]
-        assert isinstance(
-            window_builder.calculate_window_coefficients(10, 21, 34), list
-        )
+        result = window_builder.calculate_window_coefficients(10, 21, 34)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float64
+        assert result.flags.c_contiguous
 
     @pytest.mark.parametrize(
         "ripples, filter_order, window_coefficients",
@@ -511,6 +511,30 @@ class TestKaiserWindow:
         AS, _ = ripples
 
         assert (
-            window_builder.calculate_window_coefficients(n, N, AS)
+            window_builder.calculate_window_coefficients(n, N, AS).tolist()
             == window_coefficients
         )
+
+    def test_window_evaluates_several_windows_at_once(self):
+        """
+        Test that _window evaluates windows of different lengths and alphas in a
+        single call, matching calculate_window_coefficients for each of them.
+        """
+        orders = [(10, 21), (16, 33)]
+        AS_list = [34.00001, 60.0]
+
+        expected = []
+        for (n, N), AS in zip(orders, AS_list):
+            expected.extend(
+                KaiserWindow(round_to=7)
+                .calculate_window_coefficients(n, N, AS)
+                .tolist()
+            )
+
+        builder = KaiserWindow(round_to=7)
+        alphas = [builder._calculate_alpha_parameter(AS) for AS in AS_list]
+        i = np.concatenate([np.arange(n + 1) for n, _ in orders])
+        N = np.repeat([N for _, N in orders], [n + 1 for n, _ in orders])
+        alpha = np.repeat(alphas, [n + 1 for n, _ in orders])
+
+        assert KaiserWindow._window(i, N, alpha, round_to=7).tolist() == expected